@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark duct sizing sweeps over grids of inputs.
+
+Run with: python -m benchmarks.bench_duct_calculator
+"""
+import timeit
+
+import numpy
+
+from mepcalc.common.duct_calculator import DuctCalculator
+from mepcalc.common.medium import Medium
+
+REPEAT = 5
+
+
+def main():
+    """Main program."""
+    calculator = DuctCalculator(medium=Medium.air())
+    air_flows = numpy.linspace(100.0, 25_000.0, 400)  # m³/h
+    sizes = numpy.arange(100.0, 2600.0, 50.0)  # mm
+    combinations = air_flows.size * sizes.size**2
+
+    def sweep():
+        calculator.sweep(
+            "velocity_from_width_height",
+            volume_flow=(air_flows, "m³/h"),
+            width=(sizes, "mm"),
+            height=(sizes, "mm"),
+        )
+
+    sweep_time = min(timeit.repeat(sweep, number=1, repeat=REPEAT))
+    print(f"combinations: {combinations}")
+    print(f"sweep:        {sweep_time * 1e3:10.3f} ms")
+    print(f"per element:  {sweep_time / combinations * 1e9:10.3f} ns")
+
+
+if __name__ == "__main__":
+    main()
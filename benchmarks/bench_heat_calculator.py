@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark scalar vs. batch heat calculations.
+
+Run with: python -m benchmarks.bench_heat_calculator
+"""
+import timeit
+
+import numpy
+from pint import Quantity
+
+from mepcalc.common.heat_calculator import HeatCalculator
+from mepcalc.common.medium import Medium
+
+ROWS = 10_000
+REPEAT = 3
+
+
+def main():
+    """Main program."""
+    calculator = HeatCalculator(medium=Medium.water())
+    rng = numpy.random.default_rng(0)
+    mass_flows = rng.uniform(0.1, 10.0, ROWS)
+    temp_diffs = rng.uniform(1.0, 20.0, ROWS)
+
+    def scalar():
+        for mass_flow, temp_diff in zip(mass_flows, temp_diffs):
+            calculator.heat_flow_from_mass_flow(
+                Quantity(mass_flow, "kg/h"), Quantity(temp_diff, "K"), unit="kW"
+            )
+
+    def batch():
+        calculator.batch(
+            "heat_flow_from_mass_flow",
+            mass_flow=(mass_flows, "kg/h"),
+            temp_diff=(temp_diffs, "K"),
+            unit="kW",
+        )
+
+    scalar_time = min(timeit.repeat(scalar, number=1, repeat=REPEAT)) / ROWS
+    batch_time = min(timeit.repeat(batch, number=1, repeat=REPEAT)) / ROWS
+    print(f"rows:   {ROWS}")
+    print(f"scalar: {scalar_time * 1e6:10.3f} µs/row")
+    print(f"batch:  {batch_time * 1e6:10.3f} µs/row")
+    print(f"speedup: {scalar_time / batch_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
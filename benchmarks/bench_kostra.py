@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark the KOSTRA store, loading the memory-mapped arrays, depth
+interpolation for arrays of cells, durations and return periods, and design
+rain lookups for arrays of sites.
+
+Run with: python -m benchmarks.bench_kostra
+"""
+import timeit
+
+import numpy
+
+from mepcalc.kostra.design_rain import DesignRain
+from mepcalc.kostra.interpolation import DepthInterpolator
+from mepcalc.kostra.store import STORE_DIRECTORY, KostraStore, load_store
+
+REPEAT = 5
+SITES = 100_000
+
+
+def main():
+    """Main program."""
+    store = load_store()  # build the store once, if missing or outdated
+    load_time = min(
+        timeit.repeat(lambda: KostraStore(STORE_DIRECTORY), number=1, repeat=REPEAT)
+    )
+    print(f"load store:   {load_time * 1e3:10.3f} ms")
+
+    rng = numpy.random.default_rng(10)
+    index_rc = rng.choice(store.index_rc, SITES)
+    durations = rng.uniform(5, 4320, SITES)
+    return_periods = rng.uniform(1, 100, SITES)
+    interpolator = DepthInterpolator(store)
+    interpolation_time = min(
+        timeit.repeat(
+            lambda: interpolator.depth(index_rc, durations, return_periods),
+            number=1,
+            repeat=REPEAT,
+        )
+    )
+    print(f"interpolate:  {interpolation_time * 1e3:10.3f} ms ({SITES} sites)")
+
+    rng = numpy.random.default_rng(1)
+    latitude = rng.uniform(47.5, 54.5, SITES)
+    longitude = rng.uniform(6.5, 14.5, SITES)
+    design_rain = DesignRain(store)
+    lookup_time = min(
+        timeit.repeat(
+            lambda: design_rain.intensity(latitude, longitude, 15, 100),
+            number=1,
+            repeat=REPEAT,
+        )
+    )
+    print(f"design rain:  {lookup_time * 1e3:10.3f} ms ({SITES} sites)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark the GUI startup, the time from creating the main window to its
+first paint, against STARTUP_TIME_TARGET. Exits with 1 above the target.
+
+Run with: python -m benchmarks.bench_startup
+(headless with QT_QPA_PLATFORM=offscreen)
+"""
+import sys
+import time
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtWidgets import QApplication, QTabWidget
+
+from mepcalc.app import MEPCalc
+
+STARTUP_TIME_TARGET = 0.5  # s
+
+
+class FirstPaintFilter(QObject):
+    """Event filter recording the time of the first paint of a widget."""
+
+    def __init__(self, parent=None):
+        """Initializer."""
+        super().__init__(parent)
+        self.painted_at = None
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Record the first paint event and quit the event loop."""
+        if event.type() == QEvent.Type.Paint and self.painted_at is None:
+            self.painted_at = time.perf_counter()
+            QTimer.singleShot(0, QApplication.quit)
+        return False
+
+
+def build_all_pages(tabs: QTabWidget) -> None:
+    """Build all (nested) tab pages, as if every tab was shown."""
+    for index in range(tabs.count()):
+        page = tabs.page(index)
+        if isinstance(page, QTabWidget):
+            build_all_pages(page)
+
+
+def main():
+    """Main program."""
+    app = QApplication()
+    start = time.perf_counter()
+    window = MEPCalc()
+    created_at = time.perf_counter()
+    first_paint = FirstPaintFilter(window)
+    window.installEventFilter(first_paint)
+    window.show()
+    app.exec()
+    create_time = created_at - start
+    startup_time = first_paint.painted_at - start
+    start = time.perf_counter()
+    build_all_pages(window.main_tabs)
+    all_pages_time = time.perf_counter() - start
+    window.close()
+    print(f"create window: {create_time * 1e3:10.3f} ms")
+    print(f"first paint:   {startup_time * 1e3:10.3f} ms")
+    print(f"target:        {STARTUP_TIME_TARGET * 1e3:10.3f} ms")
+    print(f"other pages:   {all_pages_time * 1e3:10.3f} ms")
+    sys.exit(0 if startup_time <= STARTUP_TIME_TARGET else 1)
+
+
+if __name__ == "__main__":
+    main()
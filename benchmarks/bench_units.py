@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark the cached dimensionality check against comparing the
+dimensionality of every quantity.
+
+Run with: python -m benchmarks.bench_units
+"""
+import timeit
+
+from pint import Quantity, Unit
+
+from mepcalc.common.units import check_dimensionality
+
+CHECKS = 2000
+REPEAT = 5
+
+
+def uncached_check(quantity: Quantity, unit: Unit) -> None:
+    """Dimensionality check without cache."""
+    if not quantity.dimensionality == unit.dimensionality:
+        raise ValueError
+
+
+def main():
+    """Main program."""
+    unit = Unit("kg") / Unit("s")
+
+    def run(check) -> float:
+        timings = []
+        for _ in range(REPEAT):
+            # fresh quantities, which have not computed their dimensionality yet
+            quantities = [Quantity(float(i), "kg/h") for i in range(CHECKS)]
+            start = timeit.default_timer()
+            for quantity in quantities:
+                check(quantity, unit)
+            timings.append(timeit.default_timer() - start)
+        return min(timings) / CHECKS
+
+    # warm up both checks before timing
+    run(check_dimensionality), run(uncached_check)
+    cached_time = run(check_dimensionality)
+    uncached_time = run(uncached_check)
+    print(f"checks:   {CHECKS}")
+    print(f"cached:   {cached_time * 1e6:10.3f} µs/check")
+    print(f"uncached: {uncached_time * 1e6:10.3f} µs/check")
+    print(f"speedup: {uncached_time / cached_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,12 @@
-from pint import UnitRegistry
+"""MEP calculations.
 
-ureg = UnitRegistry()
+All modules share one pint unit registry, ureg, which is also installed as
+pint's application registry, so that plain pint.Quantity and pint.Unit objects
+(as used in the GUIs and the unit converter) live in the same registry. The
+registry is only built on first use, and its parsed definitions are cached on
+disk; pint invalidates that cache when the definition files change.
+"""
+from pint import LazyRegistry, set_application_registry
+
+ureg = LazyRegistry(kwargs={"cache_folder": ":auto:"})
+set_application_registry(ureg)
@@ -1,12 +1,99 @@
-"""MEP Calculator GUI"""
+"""MEP Calculator GUI
+
+The tab pages are declared in PAGES and built on demand, the first time they
+are shown, so startup only pays for the visible calculator. The time to the
+first paint of the window is measured by benchmarks.bench_startup.
+"""
 
 import sys
+from functools import partial
+from typing import Callable, Dict, Sequence, Tuple, Union
 
-from PySide6.QtWidgets import QApplication, QLabel, QMainWindow, QTabWidget
+from PySide6.QtCore import Slot
+from PySide6.QtWidgets import (
+    QApplication,
+    QLabel,
+    QMainWindow,
+    QTabWidget,
+    QVBoxLayout,
+    QWidget,
+)
 
+from mepcalc.common.medium import Media, media_map
+from mepcalc.gui.duct_calculator_rectangular import DuctCalculatorRectangularWidget
+from mepcalc.gui.duct_calculator_round import DuctCalculatorRoundWidget
 from mepcalc.gui.heat_calculator_mass import HeatCalculatorMassWidget
 from mepcalc.gui.heat_calculator_volume import HeatCalculatorVolumeWidget
 
+# tab title and factory of the page widget, or the pages of a nested tab widget
+Page = Tuple[str, Union[Callable[[], QWidget], Sequence["Page"]]]
+
+PAGES: Sequence[Page] = (
+    (
+        "Heat Flow",
+        (
+            (
+                "Mass Flow",
+                partial(HeatCalculatorMassWidget, medium=media_map[Media.Water]),
+            ),
+            (
+                "Volume Flow",
+                partial(HeatCalculatorVolumeWidget, medium=media_map[Media.Water]),
+            ),
+        ),
+    ),
+    (
+        "Duct",
+        (
+            (
+                "Rectangular",
+                partial(DuctCalculatorRectangularWidget, medium=media_map[Media.Air]),
+            ),
+            (
+                "Round",
+                partial(DuctCalculatorRoundWidget, medium=media_map[Media.Air]),
+            ),
+        ),
+    ),
+    (
+        "Pipe",
+        (
+            ("Pressure", partial(QLabel, "Pipe: Pressure")),
+            ("Gravitation", partial(QLabel, "Pipe: Gravitation")),
+        ),
+    ),
+)
+
+
+class LazyTabWidget(QTabWidget):
+    """Tab widget building its pages the first time they are shown."""
+
+    def __init__(self, pages: Sequence[Page], parent=None):
+        """Initializer."""
+        super().__init__(parent)
+        self.tabBar().setDocumentMode(True)
+        # tab index -> factory of pages not built yet
+        self.factories: Dict[int, Callable[[], QWidget]] = {}
+        for title, page in pages:
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            factory = page if callable(page) else partial(LazyTabWidget, page)
+            self.factories[self.addTab(placeholder, title)] = factory
+        self.currentChanged.connect(self.build_page)
+        self.build_page(self.currentIndex())
+
+    @Slot(int)
+    def build_page(self, index: int) -> None:
+        """Build the page of a tab, unless built already."""
+        factory = self.factories.pop(index, None)
+        if factory is not None:
+            self.widget(index).layout().addWidget(factory())
+
+    def page(self, index: int) -> QWidget:
+        """Page of a tab, built if necessary."""
+        self.build_page(index)
+        return self.widget(index).layout().itemAt(0).widget()
+
 
 class MEPCalc(QMainWindow):
     """MEP Calculator GUI."""
@@ -19,37 +106,12 @@ class MEPCalc(QMainWindow):
 
     def setup_ui(self):
         """Setup User Interface."""
-        self.create_calculations_widgets()
         self.setup_tab_interface()
 
-    def create_calculations_widgets(self):
-        """Create low level calculation widgets."""
-        self.heat_calculator_mass = HeatCalculatorMassWidget()
-        self.heat_calculator_volume = HeatCalculatorVolumeWidget()
-
     def setup_tab_interface(self):
-        """Setup multilayer tabbed interface."""
-        # Second Level Tabs
-        heat_flow_tabs = QTabWidget()
-        heat_flow_tabs.tabBar().setDocumentMode(True)
-        heat_flow_tabs.addTab(self.heat_calculator_mass, "Mass Flow")
-        heat_flow_tabs.addTab(self.heat_calculator_volume, "Volume Flow")
-        duct_tabs = QTabWidget()
-        duct_tabs.tabBar().setDocumentMode(True)
-        duct_tabs.addTab(QLabel("Duct: Rectangular"), "Rectangular")
-        duct_tabs.addTab(QLabel("Duct: Round"), "Round")
-        pipe_tabs = QTabWidget()
-        pipe_tabs.tabBar().setDocumentMode(True)
-        pipe_tabs.addTab(QLabel("Pipe: Pressure"), "Pressure")
-        pipe_tabs.addTab(QLabel("Pipe: Gravitation"), "Gravitation")
-        # Top Level Tabs
-        main_tabs = QTabWidget(self)
-        main_tabs.tabBar().setDocumentMode(True)
-        main_tabs.addTab(heat_flow_tabs, "Heat Flow")
-        main_tabs.addTab(duct_tabs, "Duct")
-        main_tabs.addTab(pipe_tabs, "Pipe")
-        # Central Widget
-        self.setCentralWidget(main_tabs)
+        """Setup multilayer tabbed interface, pages are built when shown."""
+        self.main_tabs = LazyTabWidget(PAGES, self)
+        self.setCentralWidget(self.main_tabs)
 
 
 def main():
@@ -0,0 +1,362 @@
+"""MEP Calculator command line interface for batch calculations.
+
+Streams the rows of a CSV or Parquet file through the heat and duct
+calculators in fixed size chunks and writes the input columns together with
+the calculated columns to a CSV or Parquet file, e.g.:
+
+    python -m mepcalc.cli schedule.csv results.csv --medium Water \\
+        --input mass_flow=m_dot:kg/h --input temp_diff=dT:K \\
+        --output Q=heat.heat_flow_from_mass_flow:kW \\
+        --output V=heat.volume_flow_from_mass_flow:m³/h
+
+Inputs map a formula parameter to a column and its unit (PARAMETER=COLUMN:UNIT),
+outputs name the result column, the calculator formula and the result unit
+(COLUMN=CALCULATOR.FORMULA:UNIT). Parameters with defaults (e.g. the
+roughness) are optional inputs. Each formula is compiled once for the given
+units, so no pint objects are created per row; formulas that are no products
+of powers of their inputs (e.g. the hydraulic diameter or the pressure
+gradient) are evaluated with pint for whole chunks instead. Parquet support
+requires the optional pyarrow package.
+"""
+
+import argparse
+import csv
+import sys
+from inspect import Parameter, signature
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional
+
+import numpy
+from pint.errors import PintError
+
+from mepcalc.common.base_calculator import BaseCalculator, shared_calculator
+from mepcalc.common.duct_calculator import DuctCalculator
+from mepcalc.common.heat_calculator import HeatCalculator
+from mepcalc.common.medium import Media, media_map
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+calculators = {"heat": HeatCalculator, "duct": DuctCalculator}
+
+# a chunk maps column names to equally long numpy arrays
+Chunk = Dict[str, numpy.ndarray]
+
+
+class InputSpec(NamedTuple):
+    """Formula parameter read from an input column in a unit."""
+
+    parameter: str
+    column: str
+    unit: str
+
+    @classmethod
+    def parse(cls, text: str) -> "InputSpec":
+        """Parse PARAMETER=COLUMN:UNIT."""
+        try:
+            parameter, rest = text.split("=", 1)
+            column, unit = rest.rsplit(":", 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"Invalid input '{text}', expected PARAMETER=COLUMN:UNIT"
+            )
+        return cls(parameter, column, unit)
+
+
+class OutputSpec(NamedTuple):
+    """Output column calculated by a calculator formula in a unit."""
+
+    column: str
+    calculator: str
+    formula: str
+    unit: str
+
+    @classmethod
+    def parse(cls, text: str) -> "OutputSpec":
+        """Parse COLUMN=CALCULATOR.FORMULA:UNIT."""
+        try:
+            column, rest = text.split("=", 1)
+            qualified_formula, unit = rest.rsplit(":", 1)
+            calculator, formula = qualified_formula.split(".", 1)
+        except ValueError:
+            raise argparse.ArgumentTypeError(
+                f"Invalid output '{text}', expected COLUMN=CALCULATOR.FORMULA:UNIT"
+            )
+        if calculator not in calculators:
+            raise argparse.ArgumentTypeError(
+                f"Unknown calculator '{calculator}', "
+                f"expected one of: {', '.join(calculators)}"
+            )
+        return cls(column, calculator, formula, unit)
+
+
+class BatchFormula(NamedTuple):
+    """Calculator formula evaluated with pint for whole columns of magnitudes,
+    for formulas that do not compile."""
+
+    calculator: BaseCalculator
+    formula: str
+    unit: str
+    input_units: Dict[str, str]
+
+    def __call__(self, *magnitudes: numpy.ndarray) -> numpy.ndarray:
+        """Evaluate formula on numpy arrays given in the input units."""
+        columns = {
+            name: (column, unit)
+            for (name, unit), column in zip(self.input_units.items(), magnitudes)
+        }
+        return self.calculator.batch(self.formula, unit=self.unit, **columns)
+
+
+class CompiledOutput(NamedTuple):
+    """Output column with its compiled formula and input columns."""
+
+    column: str
+    formula: Callable[..., numpy.ndarray]
+    columns: List[str]
+
+
+def positive_int(text: str) -> int:
+    """Parse a positive integer argument."""
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(
+            f"Invalid value '{text}', expected a positive integer"
+        )
+    return value
+
+
+def compile_outputs(
+    inputs: List[InputSpec], outputs: List[OutputSpec], medium_name: str
+) -> List[CompiledOutput]:
+    """Compile every output formula for the units of its input columns."""
+    medium = media_map[Media[medium_name]]
+    instances = {
+        name: shared_calculator(calculator, medium)
+        for name, calculator in calculators.items()
+    }
+    parameters = {spec.parameter: spec for spec in inputs}
+    compiled = []
+    for output in outputs:
+        calculator = instances[output.calculator]
+        method = getattr(calculator, output.formula, None)
+        if method is None:
+            raise ValueError(
+                f"Unknown formula '{output.formula}' of calculator "
+                f"'{output.calculator}'"
+            )
+        # required parameters, optional ones only if given as inputs
+        names = [
+            name
+            for name, parameter in signature(method).parameters.items()
+            if name != "unit"
+            and (parameter.default is Parameter.empty or name in parameters)
+        ]
+        missing = [name for name in names if name not in parameters]
+        if missing:
+            raise ValueError(
+                f"Formula '{output.formula}' needs inputs: {', '.join(missing)}"
+            )
+        input_units = {name: parameters[name].unit for name in names}
+        try:
+            formula = calculator.compile(
+                output.formula, unit=output.unit, **input_units
+            )
+        except ValueError:
+            formula = BatchFormula(calculator, output.formula, output.unit, input_units)
+            # fail early on bad input units, not on the first chunk
+            formula(*(numpy.ones(1) for _ in names))
+        columns = [parameters[name].column for name in names]
+        compiled.append(CompiledOutput(output.column, formula, columns))
+    return compiled
+
+
+def calculate_chunk(chunk: Chunk, outputs: List[CompiledOutput]) -> Chunk:
+    """Calculate all output columns for a chunk of input columns.
+
+    The input columns of the formulas are converted to floats, in the results
+    too.
+    """
+    results = dict(chunk)
+    for output in outputs:
+        for column in output.columns:
+            if column not in chunk:
+                raise ValueError(f"Missing input column '{column}'")
+            results[column] = chunk[column].astype(float)
+        magnitudes = [results[column] for column in output.columns]
+        results[output.column] = output.formula(*magnitudes)
+    return results
+
+
+def csv_chunk(header: List[str], rows: List[List[str]]) -> Chunk:
+    """Chunk of the string columns of CSV rows."""
+    try:
+        columns = numpy.array(rows, dtype=str).reshape(-1, len(header)).T
+    except ValueError:
+        raise ValueError(f"CSV rows do not match the header {header}") from None
+    return dict(zip(header, columns))
+
+
+def read_csv(path: Path, chunk_size: int) -> Iterator[Chunk]:
+    """Read a CSV file with a header line in chunks of rows.
+
+    A file with a header line only gives one empty chunk, so its header is
+    still written. Raises ValueError for a file without header line.
+    """
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"Empty CSV file '{path}', expected a header line")
+        rows = []
+        chunks = 0
+        for row in reader:
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield csv_chunk(header, rows)
+                chunks += 1
+                rows = []
+        if rows or not chunks:
+            yield csv_chunk(header, rows)
+
+
+def write_csv(path: Path, chunks: Iterator[Chunk]) -> int:
+    """Write chunks to a CSV file and return the number of rows written."""
+    rows_written = 0
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file)
+        for index, chunk in enumerate(chunks):
+            if not index:
+                writer.writerow(chunk.keys())
+            columns = [column.tolist() for column in chunk.values()]
+            writer.writerows(zip(*columns))
+            rows_written += len(columns[0])
+    return rows_written
+
+
+def read_parquet(path: Path, chunk_size: int) -> Iterator[Chunk]:
+    """Read a Parquet file in chunks of rows."""
+    from pyarrow import parquet
+
+    for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        yield {
+            name: column.to_numpy(zero_copy_only=False)
+            for name, column in zip(batch.schema.names, batch.columns)
+        }
+
+
+def write_parquet(path: Path, chunks: Iterator[Chunk]) -> int:
+    """Write chunks to a Parquet file and return the number of rows written."""
+    import pyarrow
+    from pyarrow import parquet
+
+    rows_written = 0
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pyarrow.table(chunk)
+            if writer is None:
+                writer = parquet.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            rows_written += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows_written
+
+
+readers = {".csv": read_csv, ".parquet": read_parquet}
+writers = {".csv": write_csv, ".parquet": write_parquet}
+
+
+def run(
+    source: Path,
+    target: Path,
+    inputs: List[InputSpec],
+    outputs: List[OutputSpec],
+    medium: str = Media.Water.name,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """Run a batch calculation and return the number of rows written."""
+    if chunk_size < 1:
+        raise ValueError(f"Invalid chunk size {chunk_size}, expected at least 1")
+    try:
+        reader = readers[source.suffix.lower()]
+        writer = writers[target.suffix.lower()]
+    except KeyError as error:
+        raise ValueError(
+            f"Unsupported file type '{error.args[0]}', "
+            f"expected one of: {', '.join(readers)}"
+        )
+    compiled = compile_outputs(inputs, outputs, medium)
+    chunks = (calculate_chunk(chunk, compiled) for chunk in reader(source, chunk_size))
+    return writer(target, chunks)
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m mepcalc.cli",
+        description="Batch heat and duct calculations over CSV or Parquet files.",
+    )
+    parser.add_argument("source", type=Path, help="input file (.csv or .parquet)")
+    parser.add_argument("target", type=Path, help="output file (.csv or .parquet)")
+    parser.add_argument(
+        "-i",
+        "--input",
+        dest="inputs",
+        metavar="PARAMETER=COLUMN:UNIT",
+        type=InputSpec.parse,
+        action="append",
+        required=True,
+        help="formula parameter read from a column in a unit",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="outputs",
+        metavar="COLUMN=CALCULATOR.FORMULA:UNIT",
+        type=OutputSpec.parse,
+        action="append",
+        required=True,
+        help="column calculated by a formula in a unit",
+    )
+    parser.add_argument(
+        "-m",
+        "--medium",
+        choices=[medium.name for medium in Media],
+        default=Media.Water.name,
+        help="medium (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-size",
+        type=positive_int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="rows per chunk (default: %(default)s)",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None):
+    """Main program."""
+    arguments = parse_args(args)
+    try:
+        rows = run(
+            arguments.source,
+            arguments.target,
+            arguments.inputs,
+            arguments.outputs,
+            medium=arguments.medium,
+            chunk_size=arguments.chunk_size,
+        )
+    except (OSError, ValueError, PintError) as error:
+        # e.g. unknown units or units of the wrong dimensionality
+        sys.exit(f"error: {error}")
+    print(f"{rows} rows written to {arguments.target}")
+
+
+if __name__ == "__main__":
+    main()
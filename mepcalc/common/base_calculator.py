@@ -1,6 +1,66 @@
 """Base Calculator"""
+import math
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple, Type, TypeVar, Union
+
+import numpy
+from numpy.typing import ArrayLike
+from pint import Quantity, Unit
+
 from mepcalc import ureg
-from mepcalc.common.medium import Medium
+from mepcalc.common.medium import BaseMedium, FrozenMedium
+
+# a batch column is either an array backed quantity or magnitudes plus one unit
+Column = Union[Quantity, Tuple[ArrayLike, Union[Unit, str]]]
+
+CALCULATOR_CACHE_SIZE = 64
+
+
+def as_column(column: Column) -> Quantity:
+    """Convert a batch column to a numpy array backed quantity."""
+    if isinstance(column, Quantity):
+        return Quantity(numpy.asarray(column.magnitude, dtype=float), column.units)
+    magnitudes, unit = column
+    return Quantity(numpy.asarray(magnitudes, dtype=float), unit)
+
+
+class CompiledFormula:
+    """Calculator formula evaluated on raw magnitudes, bypassing pint.
+
+    All calculator formulas are products of powers of their inputs and fixed
+    medium properties, so for fixed input and output units they reduce to:
+        result = scale * x1**p1 * x2**p2 * ...
+    with a single scale factor that includes all unit conversions and medium
+    properties.
+    """
+
+    def __init__(
+        self, inputs: Tuple[str, ...], exponents: Tuple[int, ...], scale: float
+    ):
+        """Initializer."""
+        self.inputs = inputs
+        self.exponents = exponents
+        self.scale = scale
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """String representation."""
+        terms = " * ".join(
+            f"{name}**{exponent}" for name, exponent in zip(self.inputs, self.exponents)
+        )
+        return f"{self.__class__.__name__}({self.scale!r} * {terms})"
+
+    def __call__(self, *args, **kwargs):
+        """Evaluate formula on floats or numpy arrays given in the input units."""
+        magnitudes = args + tuple(kwargs[name] for name in self.inputs[len(args) :])
+        result = self.scale
+        for magnitude, exponent in zip(magnitudes, self.exponents):
+            if exponent == 1:
+                result = result * magnitude
+            elif exponent == -1:
+                result = result / magnitude
+            else:
+                result = result * magnitude**exponent
+        return result
 
 
 class BaseCalculator:
@@ -12,8 +72,15 @@ class BaseCalculator:
     DEFAULT_VELOCITY_UNIT = ureg.meter / ureg.second
     DEFAULT_AREA_UNIT = ureg.meter**2
     DEFAULT_LENGTH_UNIT = ureg.meter
+    DEFAULT_PRESSURE_UNIT = ureg.pascal
+    DEFAULT_PRESSURE_GRADIENT_UNIT = ureg.pascal / ureg.meter
+    DEFAULT_DIMENSIONLESS_UNIT = ureg.dimensionless
 
-    def __init__(self, medium: Medium) -> None:
+    # formulas switching between regimes (e.g. laminar and turbulent flow),
+    # products of powers within a regime only, so they never compile
+    PIECEWISE_FORMULAS: FrozenSet[str] = frozenset()
+
+    def __init__(self, medium: BaseMedium) -> None:
         """Initializer."""
         self._medium = medium
 
@@ -25,3 +92,122 @@ class BaseCalculator:
     def medium(self):
         """Getter for medium."""
         return self._medium
+
+    def _fluid_magnitudes(self):
+        """Density in kg/m³ and kinematic viscosity in m²/s of the medium."""
+        si = self.medium.si
+        if si.kinematic_viscosity is None:
+            raise ValueError(f"No viscosity given for medium '{self.medium.name}'")
+        return si.density, si.kinematic_viscosity
+
+    def batch(
+        self, formula: str, unit: Union[Unit, str, None] = None, **columns: Column
+    ) -> numpy.ndarray:
+        """Evaluate a calculator formula for whole columns of inputs at once.
+
+        The formula is given by its method name, e.g. "heat_flow_from_mass_flow",
+        the inputs as keyword arguments named like the method's parameters.
+        Every column is checked for its dimensionality and converted only once,
+        instead of once per element, and the results are identical to calling
+        the scalar method for each row.
+
+        Returns the result magnitudes in unit (or the formula's default unit).
+        """
+        method = getattr(self, formula)
+        quantities = {name: as_column(column) for name, column in columns.items()}
+        if unit is not None:
+            quantities["unit"] = unit
+        return method(**quantities).magnitude
+
+    def sweep(
+        self, formula: str, unit: Union[Unit, str, None] = None, **columns: Column
+    ) -> numpy.ndarray:
+        """Evaluate a calculator formula for every combination of the inputs.
+
+        Like batch, but each column is placed on its own axis, so that the
+        columns broadcast against each other into a grid. The result has one
+        axis per column, in the order the columns are given, e.g. sweeping
+        velocity (n), width (m) and height (k) gives a (n, m, k) array.
+        """
+        dimensions = len(columns)
+        grid = {}
+        for axis, (name, column) in enumerate(columns.items()):
+            quantity = as_column(column)
+            shape = [1] * dimensions
+            shape[axis] = -1
+            grid[name] = Quantity(quantity.magnitude.reshape(shape), quantity.units)
+        return self.batch(formula, unit=unit, **grid)
+
+    def compile(
+        self, formula: str, unit: Union[Unit, str, None] = None, **input_units
+    ) -> CompiledFormula:
+        """Compile a calculator formula for fixed input and output units.
+
+        The formula is evaluated with pint a few times to validate the input
+        dimensionalities and to derive the scale factor and the exponents of
+        the inputs. The returned CompiledFormula then runs on raw floats or
+        numpy arrays given in the input units and returns magnitudes in unit.
+        The medium properties are captured at compile time.
+
+        Raises ValueError for formulas that are no products of powers, and for
+        the PIECEWISE_FORMULAS, which the probes cannot tell apart.
+        """
+        if formula in self.PIECEWISE_FORMULAS:
+            raise ValueError(
+                f"Formula '{formula}' is piecewise, not a product of powers of "
+                f"its inputs"
+            )
+        method = getattr(self, formula)
+        extra = {} if unit is None else {"unit": unit}
+        names = tuple(input_units)
+
+        def probe(values: Dict[str, float]) -> float:
+            inputs = {name: Quantity(values[name], input_units[name]) for name in names}
+            return method(**inputs, **extra).magnitude
+
+        ones = dict.fromkeys(names, 1.0)
+        scale = probe(ones)
+        exponents = tuple(
+            round(math.log2(probe({**ones, name: 2.0}) / scale)) for name in names
+        )
+        compiled = CompiledFormula(names, exponents, scale)
+        threes = dict.fromkeys(names, 3.0)
+        if not math.isclose(compiled(**threes), probe(threes), rel_tol=1e-12):
+            raise ValueError(
+                f"Formula '{formula}' is not a product of powers of its inputs "
+                f"in units {input_units}"
+            )
+        return compiled
+
+
+Calculator = TypeVar("Calculator", bound=BaseCalculator)
+
+
+@lru_cache(maxsize=CALCULATOR_CACHE_SIZE)
+def _shared_calculator(calculator: Type[Calculator], medium: FrozenMedium):
+    """Calculator of a class for a frozen medium (cached)."""
+    return calculator(medium)
+
+
+def shared_calculator(calculator: Type[Calculator], medium: BaseMedium) -> Calculator:
+    """Calculator of a class for a medium, shared by all users of equal media.
+
+    The calculator gets an immutable copy of the medium, so later changes of a
+    mutable medium give a new calculator instead of changing the shared one.
+    Media at arrays of states are unhashable and get an unshared calculator.
+    """
+    frozen = medium.freeze()
+    try:
+        return _shared_calculator(calculator, frozen)
+    except TypeError:
+        return calculator(frozen)
+
+
+def calculator_cache_info():
+    """Hits, misses, maximum and current size of the calculator cache."""
+    return _shared_calculator.cache_info()
+
+
+def calculator_cache_clear() -> None:
+    """Clear the calculator cache and its statistics."""
+    _shared_calculator.cache_clear()
@@ -5,6 +5,10 @@ V = v * A
         A_round = pi/4 * D^2
 (V = m / ϱ)
 
+-> Area
+A = B * H
+A = pi/4 * D^2
+
 -> Volume Flow
 V = v * A
 V = v * B * H
@@ -17,23 +21,80 @@ v = V / (pi/4 * D^2)
 
 -> Mass Flow
 m = V * ϱ
+
+-> Hydraulic Diameter
+d_h = 4 * A / U
+d_h = 2 * B * H / (B + H)
+d_h = D
+
+-> Friction Pressure Drop per Length (Darcy–Weisbach)
+R = λ / d_h * ϱ * v² / 2
+        Re = v * d_h / ν
+with the velocity v = V / A of the actual cross section and the friction
+factor λ after Colebrook–White, see mepcalc.common.friction. Density ϱ and
+viscosity come from the medium.
+
+All formulas also accept numpy array backed quantities. Parameter sweeps over
+grids of inputs use BaseCalculator.sweep, e.g. every standard duct size against
+every design air flow:
+    calculator.sweep(
+        "velocity_from_width_height",
+        volume_flow=(air_flows, "m³/h"),
+        width=(widths, "mm"),
+        height=(heights, "mm"),
+    )
+The pressure drop formulas evaluate the friction factor on the raw magnitudes
+of whole duct networks at once, e.g. the segments of a ventilation system:
+    calculator.pressure_gradient_from_width_height(
+        volume_flow=Quantity(air_flows, "m³/h"),
+        width=Quantity(widths, "mm"),
+        height=Quantity(heights, "mm"),
+    )
 """
 import math
 
+import numpy
 from pint import Quantity, Unit
 
 from mepcalc.common.base_calculator import BaseCalculator
-from mepcalc.common.medium import Medium
+from mepcalc.common.friction import pressure_gradient, reynolds_number
+from mepcalc.common.medium import BaseMedium
 from mepcalc.common.units import check_dimensionality
 
 
 class DuctCalculator(BaseCalculator):
     """Calculator for duct air flow."""
 
-    def __init__(self, medium: Medium) -> None:
+    DEFAULT_ROUGHNESS = Quantity(0.15, "mm")  # galvanized sheet steel
+
+    PIECEWISE_FORMULAS = frozenset(
+        ["pressure_gradient_from_width_height", "pressure_gradient_from_diameter"]
+    )
+
+    def __init__(self, medium: BaseMedium) -> None:
         """Initializer."""
         super().__init__(medium=medium)
 
+    def area_from_width_height(
+        self,
+        width: Quantity,
+        height: Quantity,
+        unit: Unit = BaseCalculator.DEFAULT_AREA_UNIT,
+    ):
+        """A = B * H"""
+        check_dimensionality(width, self.DEFAULT_LENGTH_UNIT)
+        check_dimensionality(height, self.DEFAULT_LENGTH_UNIT)
+        area = width * height
+        return area.to(unit)
+
+    def area_from_diameter(
+        self, diameter: Quantity, unit: Unit = BaseCalculator.DEFAULT_AREA_UNIT
+    ):
+        """A = pi/4 * D^2"""
+        check_dimensionality(diameter, self.DEFAULT_LENGTH_UNIT)
+        area = (math.pi / 4) * diameter**2
+        return area.to(unit)
+
     def volume_flow_from_area(
         self,
         velocity: Quantity,
@@ -125,3 +186,103 @@ class DuctCalculator(BaseCalculator):
         check_dimensionality(mass_flow, self.DEFAULT_MASS_FLOW_UNIT)
         volume_flow = mass_flow / self.medium.density
         return volume_flow.to(unit)
+
+    def hydraulic_diameter_from_width_height(
+        self,
+        width: Quantity,
+        height: Quantity,
+        unit: Unit = BaseCalculator.DEFAULT_LENGTH_UNIT,
+    ):
+        """d_h = 2 * B * H / (B + H)"""
+        check_dimensionality(width, self.DEFAULT_LENGTH_UNIT)
+        check_dimensionality(height, self.DEFAULT_LENGTH_UNIT)
+        hydraulic_diameter = 2 * width * height / (width + height)
+        return hydraulic_diameter.to(unit)
+
+    def reynolds_number_from_width_height(
+        self,
+        volume_flow: Quantity,
+        width: Quantity,
+        height: Quantity,
+        unit: Unit = BaseCalculator.DEFAULT_DIMENSIONLESS_UNIT,
+    ):
+        """Re = V / (B * H) * d_h / ν"""
+        velocity, hydraulic_diameter = self._rectangular_magnitudes(
+            volume_flow, width, height
+        )
+        return self._reynolds_number(velocity, hydraulic_diameter, unit)
+
+    def reynolds_number_from_diameter(
+        self,
+        volume_flow: Quantity,
+        diameter: Quantity,
+        unit: Unit = BaseCalculator.DEFAULT_DIMENSIONLESS_UNIT,
+    ):
+        """Re = V / (pi/4 * D^2) * D / ν"""
+        velocity, diameter = self._round_magnitudes(volume_flow, diameter)
+        return self._reynolds_number(velocity, diameter, unit)
+
+    def pressure_gradient_from_width_height(
+        self,
+        volume_flow: Quantity,
+        width: Quantity,
+        height: Quantity,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = BaseCalculator.DEFAULT_PRESSURE_GRADIENT_UNIT,
+    ):
+        """R = λ / d_h * ϱ * v² / 2, v = V / (B * H), d_h = 2 * B * H / (B + H)"""
+        velocity, hydraulic_diameter = self._rectangular_magnitudes(
+            volume_flow, width, height
+        )
+        return self._pressure_gradient(velocity, hydraulic_diameter, roughness, unit)
+
+    def pressure_gradient_from_diameter(
+        self,
+        volume_flow: Quantity,
+        diameter: Quantity,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = BaseCalculator.DEFAULT_PRESSURE_GRADIENT_UNIT,
+    ):
+        """R = λ / D * ϱ * v² / 2, v = V / (pi/4 * D^2)"""
+        velocity, diameter = self._round_magnitudes(volume_flow, diameter)
+        return self._pressure_gradient(velocity, diameter, roughness, unit)
+
+    def _rectangular_magnitudes(
+        self, volume_flow: Quantity, width: Quantity, height: Quantity
+    ):
+        """Velocity in m/s and hydraulic diameter in m of rectangular ducts."""
+        check_dimensionality(volume_flow, self.DEFAULT_VOLUME_FLOW_UNIT)
+        check_dimensionality(width, self.DEFAULT_LENGTH_UNIT)
+        check_dimensionality(height, self.DEFAULT_LENGTH_UNIT)
+        volume_flow = volume_flow.m_as(self.DEFAULT_VOLUME_FLOW_UNIT)
+        width = numpy.asarray(width.m_as(self.DEFAULT_LENGTH_UNIT))
+        height = numpy.asarray(height.m_as(self.DEFAULT_LENGTH_UNIT))
+        velocity = volume_flow / (width * height)
+        return velocity, 2 * width * height / (width + height)
+
+    def _round_magnitudes(self, volume_flow: Quantity, diameter: Quantity):
+        """Velocity in m/s and diameter in m of round ducts."""
+        check_dimensionality(volume_flow, self.DEFAULT_VOLUME_FLOW_UNIT)
+        check_dimensionality(diameter, self.DEFAULT_LENGTH_UNIT)
+        volume_flow = volume_flow.m_as(self.DEFAULT_VOLUME_FLOW_UNIT)
+        diameter = numpy.asarray(diameter.m_as(self.DEFAULT_LENGTH_UNIT))
+        return volume_flow / ((math.pi / 4) * diameter**2), diameter
+
+    def _reynolds_number(self, velocity, hydraulic_diameter, unit: Unit):
+        """Reynolds number quantity of magnitudes in SI units."""
+        _, kinematic_viscosity = self._fluid_magnitudes()
+        reynolds = reynolds_number(velocity, hydraulic_diameter, kinematic_viscosity)
+        return Quantity(reynolds, self.DEFAULT_DIMENSIONLESS_UNIT).to(unit)
+
+    def _pressure_gradient(
+        self, velocity, hydraulic_diameter, roughness: Quantity, unit: Unit
+    ):
+        """Pressure drop per length quantity of magnitudes in SI units."""
+        check_dimensionality(roughness, self.DEFAULT_LENGTH_UNIT)
+        gradient = pressure_gradient(
+            velocity,
+            hydraulic_diameter,
+            roughness.m_as(self.DEFAULT_LENGTH_UNIT),
+            *self._fluid_magnitudes(),
+        )
+        return Quantity(gradient, self.DEFAULT_PRESSURE_GRADIENT_UNIT).to(unit)
@@ -0,0 +1,276 @@
+"""Equation Graph.
+
+The calculator formulas form a graph of variables, e.g. the heat and duct
+formulas:
+    heat_flow_from_mass_flow:       (mass_flow, temp_diff)   -> heat_flow
+    volume_flow_from_mass_flow:     (mass_flow)              -> volume_flow
+    velocity_from_width_height:     (volume_flow, width, height) -> velocity
+    ...
+linked by their shared variable names (e.g. volume_flow). For any set of known
+variables the graph plans which formulas compute the unknown variables, in an
+order where every formula's inputs are known or computed before. Formulas are
+picked by forward chaining from the known variables, so every unknown variable
+is computed over the fewest steps. Of formulas ready in the same step, the one
+with the fewest computed inputs wins, e.g. velocity from the known width and
+height rather than from a computed area.
+
+A Solution evaluates such a plan and keeps all values. Updating known values
+recomputes only the formulas downstream of the changed variables, e.g.:
+
+    solution = FLOW_GRAPH.solve(
+        Medium.air(),
+        volume_flow=Quantity(1000, "m³/h"),
+        width=Quantity(400, "mm"),
+        height=Quantity(200, "mm"),
+    )
+    solution.values["velocity"]
+    solution.update(width=Quantity(500, "mm"))  # velocity, not mass_flow
+"""
+
+from copy import copy
+from inspect import Parameter, signature
+from typing import (
+    AbstractSet,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from pint import Quantity
+
+from mepcalc.common.base_calculator import BaseCalculator, shared_calculator
+from mepcalc.common.duct_calculator import DuctCalculator
+from mepcalc.common.heat_calculator import HeatCalculator
+from mepcalc.common.medium import BaseMedium
+
+FORMULA_SEPARATOR = "_from_"
+
+
+class Formula(NamedTuple):
+    """Calculator method computing an output variable from input variables."""
+
+    output: str
+    inputs: Tuple[str, ...]
+    calculator: Type[BaseCalculator]
+    method: str
+
+
+def calculator_formulas(calculator: Type[BaseCalculator]) -> Tuple[Formula, ...]:
+    """Formulas of a calculator class, its methods named <output>_from_<...>.
+
+    The inputs are the method's parameters without default values, optional
+    parameters (the result unit, a roughness, ...) keep their defaults.
+    """
+    formulas = []
+    for method in dir(calculator):
+        output, separator, _ = method.partition(FORMULA_SEPARATOR)
+        if not separator or method.startswith("_"):
+            continue
+        parameters = list(signature(getattr(calculator, method)).parameters.values())
+        inputs = tuple(
+            parameter.name
+            for parameter in parameters[1:]  # skip self
+            if parameter.default is Parameter.empty
+        )
+        formulas.append(Formula(output, inputs, calculator, method))
+    return tuple(formulas)
+
+
+class EquationGraph:
+    """Graph of the formulas of calculators, linked by their variables."""
+
+    def __init__(self, formulas: Iterable[Formula]) -> None:
+        """Initializer.
+
+        Formulas of equal output and inputs (e.g. m = V * ϱ of several
+        calculators) are kept once, the first one given.
+        """
+        unique: Dict[Tuple[str, FrozenSet[str]], Formula] = {}
+        for formula in formulas:
+            unique.setdefault((formula.output, frozenset(formula.inputs)), formula)
+        self.formulas = tuple(unique.values())
+        self.variables = frozenset(
+            name
+            for formula in self.formulas
+            for name in (formula.output, *formula.inputs)
+        )
+        # variables some formula computes, the others are inputs only
+        self.outputs = frozenset(formula.output for formula in self.formulas)
+        self._plans: Dict[
+            Tuple[FrozenSet[str], Optional[FrozenSet[str]]], Tuple[Formula, ...]
+        ] = {}
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """String representation."""
+        return f"{self.__class__.__name__}(formulas={len(self.formulas)})"
+
+    def plan(
+        self, known: Iterable[str], unknown: Optional[Iterable[str]] = None
+    ) -> Tuple[Formula, ...]:
+        """Formulas computing the unknown variables from the known ones, in
+        evaluation order. Without unknown variables, every variable that can
+        be computed is.
+
+        Raises ValueError for unknown variables that are known too, not in the
+        graph or not computable from the known variables.
+        """
+        known = frozenset(known)
+        unknown = None if unknown is None else frozenset(unknown)
+        key = (known, unknown)
+        if key not in self._plans:
+            self._plans[key] = self._plan(known, unknown)
+        return self._plans[key]
+
+    def _plan(
+        self, known: FrozenSet[str], unknown: Optional[FrozenSet[str]]
+    ) -> Tuple[Formula, ...]:
+        """Plan formulas by forward chaining, then drop unneeded ones."""
+        if unknown is not None:
+            if known & unknown:
+                raise ValueError(
+                    f"Variables both known and unknown: {sorted(known & unknown)}"
+                )
+            if unknown - self.variables:
+                raise ValueError(
+                    f"Unknown variables: {sorted(unknown - self.variables)}"
+                )
+        # forward chaining, a round computes all outputs of the known variables
+        available = set(known)
+        computed: Dict[str, Formula] = {}
+        order: List[Formula] = []
+        pending = [formula for formula in self.formulas if formula.output not in known]
+        while pending:
+            ready = [
+                formula
+                for formula in pending
+                if formula.output not in computed
+                and available.issuperset(formula.inputs)
+            ]
+            # prefer formulas of known inputs, the sort keeps the formula order
+            ready.sort(key=lambda formula: len(set(formula.inputs) - known))
+            for formula in ready:
+                if formula.output not in computed:
+                    computed[formula.output] = formula
+                    order.append(formula)
+            if not ready:
+                break
+            available.update(formula.output for formula in ready)
+            pending = [formula for formula in pending if formula.output not in computed]
+        if unknown is None:
+            return tuple(order)
+        missing = unknown - available
+        if missing:
+            raise ValueError(f"Cannot calculate {sorted(missing)} from {sorted(known)}")
+        # keep formulas the unknown variables depend on
+        needed = set()
+        stack = list(unknown)
+        while stack:
+            name = stack.pop()
+            if name in needed or name in known:
+                continue
+            needed.add(name)
+            stack.extend(computed[name].inputs)
+        return tuple(formula for formula in order if formula.output in needed)
+
+    def solve(
+        self,
+        medium: BaseMedium,
+        unknown: Optional[Iterable[str]] = None,
+        **known: Quantity,
+    ) -> "Solution":
+        """Solution for the known values, see plan."""
+        return Solution(self, medium, known, unknown)
+
+
+class Solution:
+    """Values of the known and computed variables of an equation graph."""
+
+    def __init__(
+        self,
+        graph: EquationGraph,
+        medium: BaseMedium,
+        known: Mapping[str, Quantity],
+        unknown: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Initializer, computes all unknown variables."""
+        self.graph = graph
+        self.medium = medium
+        self.plan = graph.plan(known, unknown)
+        self.known = frozenset(known)
+        # requested variables, all computed ones by default
+        self.unknown = frozenset(
+            (formula.output for formula in self.plan) if unknown is None else unknown
+        )
+        self.values: Dict[str, Quantity] = dict(known)
+        self._calculators = {
+            formula.calculator: shared_calculator(formula.calculator, medium)
+            for formula in self.plan
+        }
+        self._evaluate(self.known)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """String representation."""
+        return f"{self.__class__.__name__}(values={self.values})"
+
+    @property
+    def results(self) -> Dict[str, Quantity]:
+        """Values of the requested unknown variables."""
+        return {name: self.values[name] for name in self.unknown}
+
+    def matches(
+        self, medium: BaseMedium, known: Iterable[str], unknown: Iterable[str]
+    ) -> bool:
+        """Whether the solution solves for the same variables and medium, so
+        that it can be updated instead of solved anew."""
+        return (
+            self.known == frozenset(known)
+            and self.unknown == frozenset(unknown)
+            and self.medium == medium
+        )
+
+    def updated(self, **changes: Quantity) -> "Solution":
+        """Copy of the solution with changed known values, recomputing only the
+        variables downstream of them. The solution itself is left as is."""
+        solution = copy(self)
+        solution.values = dict(self.values)
+        solution.update(**changes)
+        return solution
+
+    def update(self, **changes: Quantity) -> Dict[str, Quantity]:
+        """Change known values and recompute the variables downstream of them.
+
+        Returns the recomputed values. Raises ValueError for changes of
+        variables that are not known ones.
+        """
+        if not self.known.issuperset(changes):
+            raise ValueError(
+                f"Only known variables can change, not: "
+                f"{sorted(set(changes) - self.known)}"
+            )
+        self.values.update(changes)
+        return self._evaluate(changes.keys())
+
+    def _evaluate(self, changed: AbstractSet[str]) -> Dict[str, Quantity]:
+        """Evaluate the planned formulas with changed inputs, in plan order."""
+        changed = set(changed)
+        results = {}
+        for formula in self.plan:
+            if changed.isdisjoint(formula.inputs):
+                continue
+            method = getattr(self._calculators[formula.calculator], formula.method)
+            value = method(*(self.values[name] for name in formula.inputs))
+            self.values[formula.output] = results[formula.output] = value
+            changed.add(formula.output)
+        return results
+
+
+# heat and duct formulas, linked by volume and mass flow
+FLOW_GRAPH = EquationGraph(
+    calculator_formulas(HeatCalculator) + calculator_formulas(DuctCalculator)
+)
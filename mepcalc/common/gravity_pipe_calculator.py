@@ -0,0 +1,354 @@
+"""Gravity Pipe Flow Calculator.
+
+Capacity of sloped, gravity drained pipes after Prandtl–Colebrook, for full
+flow (SI units in parentheses):
+    v_v = -2 * log10(2.51 * ν / (d * √(2 * g * d * J)) + k / (3.71 * d))
+          * √(2 * g * d * J)
+    V_v = v_v * pi/4 * d²
+and for part-filled flow with the same equation for the hydraulic diameter
+d_h = 4 * A / U of the wetted cross section:
+    V = v(d_h) * A
+with the symbols:
+    V:  volume flow                 (in m³/s)
+    v:  velocity                    (in m/s)
+    d:  inner diameter              (in m)
+    h:  filling height              (in m)
+    J:  slope                       (in m/m)
+    k:  operational roughness       (in m)
+    g:  standard gravity            (in m/s²)
+and the fluid properties:
+    ν:  kinematic viscosity         (in m²/s)
+
+The geometry of the wetted cross section depends on the fill ratio h / d only.
+It is tabulated once on a fine grid of fill ratios, as area ratio A / A_v and
+hydraulic diameter ratio d_h / d. Solving for the fill ratio of a flow then
+bisects the table, evaluating the explicit flow equation at about nine
+tabulated fill ratios for all flows at once, and interpolates linearly between
+the neighbouring ones. The flow has its maximum at a fill ratio of about 0.94,
+fill ratios are solved below.
+The slope needed for a flow is solved with a fixed number of Newton steps.
+
+Rain water flows from roofs and areas, Q = r * C * A with the rain intensity r
+(e.g. r(5 min, 2 a) from KOSTRA), the runoff coefficient C and the area A,
+feed directly into the calculator, see rain_flow and design_rain_flow.
+"""
+
+import math
+from typing import Union
+
+import numpy
+from numpy.typing import ArrayLike
+from pint import Quantity, Unit
+
+from mepcalc import ureg
+from mepcalc.common.base_calculator import BaseCalculator
+from mepcalc.common.medium import BaseMedium
+from mepcalc.common.pipe_calculator import PipeSeries, smallest_size
+from mepcalc.common.units import check_dimensionality
+from mepcalc.kostra.design_rain import DesignRain
+from mepcalc.kostra.store import INTENSITY_UNIT
+
+STANDARD_GRAVITY = 9.80665  # m/s²
+
+# KG drain pipes (EN 1401, SN 4), nominal size DN -> inner diameter in mm
+DRAIN_PIPE_SERIES: PipeSeries = {
+    100: 103.6,
+    125: 118.6,
+    150: 152.0,
+    200: 190.2,
+    250: 237.6,
+    300: 299.6,
+    400: 380.4,
+    500: 475.4,
+}
+
+FILL_RATIO_STEPS = 500
+# below the fill ratio of the maximum flow (0.936 to 0.940), where the flow
+# stops rising with the fill ratio
+MAX_SOLVED_FILL_RATIO = 0.93
+SLOPE_NEWTON_STEPS = 4
+
+_LN_10 = math.log(10)
+
+
+def cross_section_ratios(fill_ratio: ArrayLike):
+    """Area ratio A / A_v and hydraulic diameter ratio d_h / d of a circular
+    cross section filled up to fill ratios h / d."""
+    # central angle of the water surface
+    angle = 2 * numpy.arccos(1 - 2 * numpy.clip(fill_ratio, 0, 1))
+    segment = angle - numpy.sin(angle)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        diameter_ratio = numpy.where(angle > 0, segment / angle, 0.0)
+    return segment / (2 * math.pi), diameter_ratio
+
+
+# fill ratios, denser towards the empty pipe, where the flow changes fastest
+FILL_RATIOS = (1 - numpy.cos(numpy.linspace(0, math.pi, FILL_RATIO_STEPS + 1))) / 2
+AREA_RATIOS, DIAMETER_RATIOS = cross_section_ratios(FILL_RATIOS)
+SOLVED_FILL_RATIOS = FILL_RATIOS[FILL_RATIOS <= MAX_SOLVED_FILL_RATIO]
+
+
+def prandtl_colebrook_velocity(
+    diameter: ArrayLike,
+    slope: ArrayLike,
+    roughness: ArrayLike,
+    kinematic_viscosity: float,
+) -> numpy.ndarray:
+    """Mean velocity in m/s of the (hydraulic) diameters in m, slopes in m/m
+    and roughnesses in m.
+
+    Zero for diameters too small for the equation, i.e. for nearly empty
+    pipes, where it would give negative velocities.
+    """
+    diameter = numpy.asarray(diameter, dtype=float)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        root = numpy.sqrt(2 * STANDARD_GRAVITY * diameter * slope)
+        velocity = (
+            -2
+            * numpy.log10(
+                2.51 * kinematic_viscosity / (diameter * root)
+                + roughness / (3.71 * diameter)
+            )
+            * root
+        )
+    return numpy.where(diameter > 0, numpy.maximum(velocity, 0.0), 0.0)
+
+
+class GravityPipeCalculator(BaseCalculator):
+    """Calculator for the capacity of sloped gravity drain pipes."""
+
+    DEFAULT_ROUGHNESS = Quantity(1.0, "mm")  # operational roughness of drains
+    DEFAULT_SLOPE_UNIT = ureg.meter / ureg.meter
+    DEFAULT_INTENSITY_UNIT = ureg.Unit(INTENSITY_UNIT)
+
+    def __init__(self, medium: BaseMedium) -> None:
+        """Initializer."""
+        super().__init__(medium=medium)
+
+    def _kinematic_viscosity(self) -> float:
+        """Kinematic viscosity of the medium in m²/s."""
+        return self._fluid_magnitudes()[1]
+
+    def _magnitudes(self, diameter: Quantity, slope: Quantity, roughness: Quantity):
+        """Diameter in m, slope in m/m and roughness in m."""
+        check_dimensionality(diameter, self.DEFAULT_LENGTH_UNIT)
+        check_dimensionality(slope, self.DEFAULT_SLOPE_UNIT)
+        check_dimensionality(roughness, self.DEFAULT_LENGTH_UNIT)
+        return (
+            numpy.asarray(diameter.m_as(self.DEFAULT_LENGTH_UNIT)),
+            numpy.asarray(slope.m_as(self.DEFAULT_SLOPE_UNIT)),
+            roughness.m_as(self.DEFAULT_LENGTH_UNIT),
+        )
+
+    def _part_flow(
+        self,
+        diameter: numpy.ndarray,
+        slope: numpy.ndarray,
+        roughness: float,
+        area_ratio: ArrayLike,
+        diameter_ratio: ArrayLike,
+    ) -> numpy.ndarray:
+        """Volume flow in m³/s of part-filled pipes."""
+        velocity = prandtl_colebrook_velocity(
+            diameter * diameter_ratio, slope, roughness, self._kinematic_viscosity()
+        )
+        return velocity * area_ratio * (math.pi / 4) * diameter**2
+
+    def full_velocity(
+        self,
+        diameter: Quantity,
+        slope: Quantity,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = BaseCalculator.DEFAULT_VELOCITY_UNIT,
+    ) -> Quantity:
+        """v_v = -2 * log10(2.51 ν / (d √(2 g d J)) + k / (3.71 d)) * √(2 g d J)"""
+        diameter, slope, roughness = self._magnitudes(diameter, slope, roughness)
+        velocity = prandtl_colebrook_velocity(
+            diameter, slope, roughness, self._kinematic_viscosity()
+        )
+        return Quantity(velocity, self.DEFAULT_VELOCITY_UNIT).to(unit)
+
+    def full_flow(
+        self,
+        diameter: Quantity,
+        slope: Quantity,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = BaseCalculator.DEFAULT_VOLUME_FLOW_UNIT,
+    ) -> Quantity:
+        """V_v = v_v * pi/4 * d²"""
+        return self.part_flow(
+            diameter, slope, Quantity(1.0, ""), roughness=roughness, unit=unit
+        )
+
+    def part_flow(
+        self,
+        diameter: Quantity,
+        slope: Quantity,
+        fill_ratio: Quantity,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = BaseCalculator.DEFAULT_VOLUME_FLOW_UNIT,
+    ) -> Quantity:
+        """V = v(d_h) * A at the fill ratio h / d"""
+        check_dimensionality(fill_ratio, self.DEFAULT_DIMENSIONLESS_UNIT)
+        diameter, slope, roughness = self._magnitudes(diameter, slope, roughness)
+        area_ratio, diameter_ratio = cross_section_ratios(fill_ratio.m_as(""))
+        volume_flow = self._part_flow(
+            diameter, slope, roughness, area_ratio, diameter_ratio
+        )
+        return Quantity(volume_flow, self.DEFAULT_VOLUME_FLOW_UNIT).to(unit)
+
+    def fill_ratio(
+        self,
+        volume_flow: Quantity,
+        diameter: Quantity,
+        slope: Quantity,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = BaseCalculator.DEFAULT_DIMENSIONLESS_UNIT,
+    ) -> Quantity:
+        """Fill ratio h / d of a volume flow, interpolated between the flows
+        at the tabulated fill ratios.
+
+        NaN for flows above the capacity at MAX_SOLVED_FILL_RATIO, which is
+        about 7 % above the full flow capacity.
+        """
+        check_dimensionality(volume_flow, self.DEFAULT_VOLUME_FLOW_UNIT)
+        diameter, slope, roughness = self._magnitudes(diameter, slope, roughness)
+        volume_flow = numpy.asarray(volume_flow.m_as(self.DEFAULT_VOLUME_FLOW_UNIT))
+        shape = numpy.broadcast(volume_flow, diameter, slope).shape
+        volume_flow = numpy.broadcast_to(volume_flow, shape).ravel()
+        diameter = numpy.broadcast_to(diameter, shape).ravel()
+        slope = numpy.broadcast_to(slope, shape).ravel()
+
+        def flow(index: numpy.ndarray) -> numpy.ndarray:
+            return self._part_flow(
+                diameter, slope, roughness, AREA_RATIOS[index], DIAMETER_RATIOS[index]
+            )
+
+        # bisect the rising branch of the table for the first fill ratio with
+        # at least the volume flow, for all flows at once
+        last = len(SOLVED_FILL_RATIOS) - 1
+        low = numpy.ones(volume_flow.shape, dtype=int)
+        high = numpy.full(volume_flow.shape, last)
+        for _ in range(last.bit_length()):
+            middle = (low + high) // 2
+            enough = flow(middle) >= volume_flow
+            high = numpy.where(enough, middle, high)
+            low = numpy.where(enough, low, middle + 1)
+        lower_flow, upper_flow = flow(low - 1), flow(low)
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            fraction = (volume_flow - lower_flow) / (upper_flow - lower_flow)
+        fill_ratio = FILL_RATIOS[low - 1] + fraction * (
+            FILL_RATIOS[low] - FILL_RATIOS[low - 1]
+        )
+        fill_ratio = numpy.where(volume_flow > upper_flow, numpy.nan, fill_ratio)
+        fill_ratio = numpy.where(volume_flow == 0, 0.0, fill_ratio).reshape(shape)
+        return Quantity(fill_ratio, self.DEFAULT_DIMENSIONLESS_UNIT).to(unit)
+
+    def slope(
+        self,
+        volume_flow: Quantity,
+        diameter: Quantity,
+        fill_ratio: Quantity = Quantity(1.0, ""),
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = DEFAULT_SLOPE_UNIT,
+    ) -> Quantity:
+        """Slope J needed for a volume flow at the fill ratio h / d (default:
+        full flow).
+
+        Solves v(d_h, J) = V / A for s = √J with one fixed-point and a few
+        Newton steps, which converge to machine precision.
+        """
+        check_dimensionality(volume_flow, self.DEFAULT_VOLUME_FLOW_UNIT)
+        check_dimensionality(diameter, self.DEFAULT_LENGTH_UNIT)
+        check_dimensionality(fill_ratio, self.DEFAULT_DIMENSIONLESS_UNIT)
+        check_dimensionality(roughness, self.DEFAULT_LENGTH_UNIT)
+        diameter = numpy.asarray(diameter.m_as(self.DEFAULT_LENGTH_UNIT))
+        area_ratio, diameter_ratio = cross_section_ratios(fill_ratio.m_as(""))
+        velocity = volume_flow.m_as(self.DEFAULT_VOLUME_FLOW_UNIT) / (
+            area_ratio * (math.pi / 4) * diameter**2
+        )
+        # v = -2 * log10(a / s + b) * c * s
+        hydraulic_diameter = diameter * diameter_ratio
+        c = numpy.sqrt(2 * STANDARD_GRAVITY * hydraulic_diameter)
+        a = 2.51 * self._kinematic_viscosity() / (hydraulic_diameter * c)
+        b = roughness.m_as(self.DEFAULT_LENGTH_UNIT) / (3.71 * hydraulic_diameter)
+        root = velocity / (-2 * numpy.log10(a / 0.1 + b) * c)
+        for _ in range(SLOPE_NEWTON_STEPS):
+            inner = a / root + b
+            logarithm = numpy.log10(inner)
+            root = root - (-2 * c * root * logarithm - velocity) / (
+                -2 * c * (logarithm - a / (root * _LN_10 * inner))
+            )
+        return Quantity(root**2, self.DEFAULT_SLOPE_UNIT).to(unit)
+
+    def nominal_size(
+        self,
+        volume_flow: Quantity,
+        slope: Quantity,
+        max_fill_ratio: Quantity = Quantity(1.0, ""),
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        series: PipeSeries = DRAIN_PIPE_SERIES,
+    ) -> Union[int, numpy.ndarray]:
+        """Smallest nominal sizes DN of a pipe series that drain the volume
+        flows at the slopes without exceeding the maximum fill ratio h / d
+        (default: full flow).
+
+        NO_SIZE if no size fits. The slopes broadcast against the flows.
+        """
+        check_dimensionality(volume_flow, self.DEFAULT_VOLUME_FLOW_UNIT)
+        check_dimensionality(slope, self.DEFAULT_SLOPE_UNIT)
+        check_dimensionality(max_fill_ratio, self.DEFAULT_DIMENSIONLESS_UNIT)
+        check_dimensionality(roughness, self.DEFAULT_LENGTH_UNIT)
+        volume_flow = numpy.asarray(volume_flow.m_as(self.DEFAULT_VOLUME_FLOW_UNIT))
+        slope = numpy.asarray(slope.m_as(self.DEFAULT_SLOPE_UNIT))
+        shape = numpy.broadcast(volume_flow, slope).shape
+        volume_flow = numpy.broadcast_to(volume_flow, shape).ravel()
+        slope = numpy.broadcast_to(slope, shape).ravel()
+        roughness = roughness.m_as(self.DEFAULT_LENGTH_UNIT)
+        area_ratio, diameter_ratio = cross_section_ratios(max_fill_ratio.m_as(""))
+
+        def fits(diameter: numpy.ndarray) -> numpy.ndarray:
+            capacity = self._part_flow(
+                diameter, slope, roughness, area_ratio, diameter_ratio
+            )
+            return volume_flow <= capacity
+
+        return smallest_size(fits, series, shape)
+
+    def rain_flow(
+        self,
+        intensity: Quantity,
+        area: Quantity,
+        runoff_coefficient: Quantity = Quantity(1.0, ""),
+        unit: Unit = BaseCalculator.DEFAULT_VOLUME_FLOW_UNIT,
+    ) -> Quantity:
+        """Q = r * C * A"""
+        check_dimensionality(intensity, self.DEFAULT_INTENSITY_UNIT)
+        check_dimensionality(area, self.DEFAULT_AREA_UNIT)
+        check_dimensionality(runoff_coefficient, self.DEFAULT_DIMENSIONLESS_UNIT)
+        volume_flow = intensity * runoff_coefficient * area
+        return volume_flow.to(unit)
+
+    def design_rain_flow(
+        self,
+        design_rain: DesignRain,
+        latitude: ArrayLike,
+        longitude: ArrayLike,
+        area: Quantity,
+        runoff_coefficient: Quantity = Quantity(1.0, ""),
+        duration: ArrayLike = 5,
+        return_period: ArrayLike = 2,
+        unit: Unit = BaseCalculator.DEFAULT_VOLUME_FLOW_UNIT,
+    ) -> Quantity:
+        """Q = r(D, T) * C * A with the KOSTRA rain intensity of sites given by
+        their coordinates in ° (default: r(5 min, 2 a)).
+
+        NaN for sites without KOSTRA data.
+        """
+        intensity = Quantity(
+            numpy.asarray(
+                design_rain.intensity(latitude, longitude, duration, return_period)
+            ),
+            self.DEFAULT_INTENSITY_UNIT,
+        )
+        return self.rain_flow(intensity, area, runoff_coefficient, unit)
@@ -26,13 +26,22 @@ as inputs, since they are assumed to be fixed):
     (F) V = f(m) = m / ϱ
     (G) 𝛥T = f(Q, m) = Q / (m * cp)
     (H) 𝛥T = f(Q, V) = Q / (V * C)
+
+All formulas also accept numpy array backed quantities. For whole columns of
+inputs use BaseCalculator.batch, e.g.:
+    calculator.batch(
+        "heat_flow_from_mass_flow",
+        mass_flow=(mass_flows, "kg/h"),
+        temp_diff=(temp_diffs, "K"),
+        unit="kW",
+    )
 """
 
 from pint import Quantity, Unit
 
 from mepcalc import ureg
 from mepcalc.common.base_calculator import BaseCalculator
-from mepcalc.common.medium import Medium
+from mepcalc.common.medium import BaseMedium
 from mepcalc.common.units import check_dimensionality
 
 
@@ -45,7 +54,7 @@ class HeatCalculator(BaseCalculator):
     (V)    Q = V * C * 𝛥T       (III) in (IV)
     """
 
-    def __init__(self, medium: Medium) -> None:
+    def __init__(self, medium: BaseMedium) -> None:
         """Initializer."""
         super().__init__(medium=medium)
 
@@ -1,43 +1,128 @@
 """Medium class and medium mapping."""
 
 from enum import Enum, auto
-from typing import Self
+from typing import Dict, NamedTuple, Optional, Self
 
+import numpy
 from pint import Quantity
 
 from mepcalc import ureg
+from mepcalc.common.properties import (
+    DEFAULT_INTERPOLATION_METHOD,
+    Glycol,
+    PropertyTable,
+    air_properties,
+    glycol_properties,
+    water_properties,
+)
 from mepcalc.common.units import check_dimensionality
 
 
-class Medium:
-    """Medium Properties."""
+class MediumSI(NamedTuple):
+    """Medium properties as SI magnitudes, floats (or arrays for media at
+    arrays of states): heat capacity in J/(kg K), density in kg/m³,
+    volumetric heat capacity in J/(m³ K), viscosity in Pa s and kinematic
+    viscosity in m²/s (None without viscosity)."""
+
+    heat_capacity: float
+    density: float
+    volumetric_heat_capacity: float
+    viscosity: Optional[float]
+    kinematic_viscosity: Optional[float]
+
+
+class BaseMedium:
+    """Medium Properties.
+
+    Derived properties (volumetric heat capacity, kinematic viscosity and the
+    SI magnitudes) are computed once and kept until a property changes.
+    """
+
+    __slots__ = (
+        "_name",
+        "_heat_capacity",
+        "_density",
+        "_viscosity",
+        "_properties",
+        "_state",
+        "_derived",
+    )
 
     HEAT_CAPACITY_UNIT = ureg.joule / (ureg.kilogram * ureg.kelvin)  # Unit("J/(kg K)")
     DENSITY_UNIT = ureg.kilogram / ureg.meter**3  # Unit("kg/m³")
+    VOLUMETRIC_HEAT_CAPACITY_UNIT = ureg.joule / (ureg.meter**3 * ureg.kelvin)
+    VISCOSITY_UNIT = ureg.pascal * ureg.second  # Unit("Pa s")
+    KINEMATIC_VISCOSITY_UNIT = ureg.meter**2 / ureg.second  # Unit("m²/s")
+    REFERENCE_TEMPERATURE = Quantity(20.0, "degC")
 
     @classmethod
     def water(cls) -> Self:
         return cls(
             name="Water",
-            heat_cap=Quantity(4148.0, "kJ/(kg K)"),
+            heat_cap=Quantity(4184.0, "J/(kg K)"),
             density=Quantity(998.2, "kg/m³"),
+            viscosity=Quantity(1.002, "mPa s"),
+            properties=water_properties(),
         )
 
     @classmethod
     def air(cls) -> Self:
         return cls(
             name="Air",
-            heat_cap=Quantity(1006.0, "kJ/(kg K)"),
+            heat_cap=Quantity(1006.0, "J/(kg K)"),
             density=Quantity(1.205, "kg/m³"),
+            viscosity=Quantity(18.2, "µPa s"),
+            properties=air_properties(),
         )
 
-    def __init__(self, name: str, heat_cap: Quantity, density: Quantity) -> None:
-        """Initializer."""
+    @classmethod
+    def glycol(cls, glycol: Glycol, concentration: Quantity) -> Self:
+        """Glycol/water mixture of a concentration (mass fraction of glycol),
+        with the properties at 20 °C.
+
+        All mixtures of a glycol share one property surface of concentration
+        and temperature, and evaluates it at the mixture's concentration.
+        """
+        check_dimensionality(concentration, ureg.dimensionless)
+        state = {"concentration": concentration}
+        properties = glycol_properties(glycol).evaluate(
+            temperature=cls.REFERENCE_TEMPERATURE, **state
+        )
+        return cls(
+            name=f"{glycol.name} Glycol {concentration.m_as('percent'):g} %",
+            heat_cap=properties["heat_capacity"],
+            density=properties["density"],
+            viscosity=properties["viscosity"],
+            properties=glycol_properties(glycol),
+            state=state,
+        )
+
+    def __init__(
+        self,
+        name: str,
+        heat_cap: Quantity,
+        density: Quantity,
+        viscosity: Optional[Quantity] = None,
+        properties: Optional[PropertyTable] = None,
+        state: Optional[Dict[str, Quantity]] = None,
+    ) -> None:
+        """Initializer.
+
+        viscosity: optional dynamic viscosity, needed for friction losses only
+        properties: optional table of the properties by state, see at
+        state: fixed state variables of the table, e.g. the concentration
+        """
         self._name = name
         check_dimensionality(heat_cap, self.HEAT_CAPACITY_UNIT)
         check_dimensionality(density, self.DENSITY_UNIT)
+        if viscosity is not None:
+            check_dimensionality(viscosity, self.VISCOSITY_UNIT)
         self._heat_capacity = heat_cap
         self._density = density
+        self._viscosity = viscosity
+        self._properties = properties
+        self._state = {} if state is None else dict(state)
+        self._derived = None
 
     def __repr__(self) -> str:  # pragma: no cover
         """String representation."""
@@ -45,7 +130,8 @@ class Medium:
             f"{self.__class__.__name__}("
             f"name={self._name},"
             f"heat_capacity={self._heat_capacity:~P},"
-            f"density={self._density:~P}"
+            f"density={self._density:~P},"
+            f"viscosity={self._viscosity}"
             f")"
         )
 
@@ -59,32 +145,212 @@ class Medium:
         """Getter for (isobaric) heat capacity property."""
         return self._heat_capacity
 
-    @heat_capacity.setter
-    def heat_capacity(self, value: Quantity) -> None:
-        """Setter for (isobaric) heat capacity property."""
-        check_dimensionality(value, self.HEAT_CAPACITY_UNIT)
-        self._heat_capacity = value
-
     @property
     def density(self) -> Quantity:
         """Getter for density property."""
         return self._density
 
-    @density.setter
+    @property
+    def viscosity(self) -> Optional[Quantity]:
+        """Getter for (dynamic) viscosity property."""
+        return self._viscosity
+
+    @property
+    def properties(self) -> Optional[PropertyTable]:
+        """Getter for the property table."""
+        return self._properties
+
+    @property
+    def state(self) -> Dict[str, Quantity]:
+        """Getter for the fixed state variables (a copy)."""
+        return dict(self._state)
+
+    def at(self, method: str = DEFAULT_INTERPOLATION_METHOD, **state: Quantity) -> Self:
+        """Medium with the tabulated properties at a state, e.g.
+        Medium.water().at(temperature=Quantity(temperatures, "°C")).
+
+        The state variables (temperature and, for air, pressure and humidity)
+        may be numpy array backed quantities, then the properties are arrays
+        too and the calculators evaluate every state at once. Properties the
+        table lacks keep their value, fixed state variables of the medium
+        (e.g. the concentration of mixtures) apply unless given.
+        """
+        if self.properties is None:
+            raise ValueError(f"No property table given for medium '{self.name}'")
+        state = {**self._state, **state}
+        properties = self.properties.evaluate(method, **state)
+        return self.__class__(
+            name=self.name,
+            heat_cap=properties.get("heat_capacity", self.heat_capacity),
+            density=properties.get("density", self.density),
+            viscosity=properties.get("viscosity", self.viscosity),
+            properties=self.properties,
+            state=self._state,
+        )
+
+    def freeze(self) -> "FrozenMedium":
+        """Immutable, hashable copy of the medium."""
+        return FrozenMedium(
+            name=self.name,
+            heat_cap=self.heat_capacity,
+            density=self.density,
+            viscosity=self.viscosity,
+            properties=self.properties,
+            state=self._state,
+        )
+
+    @property
+    def volumetric_heat_capacity(self) -> Quantity:
+        """Getter for volumetric heat capacity C = cp * ϱ."""
+        return self._derive()[0]
+
+    @property
+    def kinematic_viscosity(self) -> Quantity:
+        """Getter for kinematic viscosity ν = η / ϱ."""
+        kinematic_viscosity = self._derive()[1]
+        if kinematic_viscosity is None:
+            raise ValueError(f"No viscosity given for medium '{self.name}'")
+        return kinematic_viscosity
+
+    @property
+    def si(self) -> MediumSI:
+        """Getter for the properties as SI magnitudes."""
+        return self._derive()[2]
+
+    def _derive(self):
+        """Volumetric heat capacity, kinematic viscosity and SI magnitudes,
+        computed on first use after a change."""
+        if self._derived is None:
+            volumetric_heat_capacity = self._heat_capacity * self._density
+            viscosity = kinematic_viscosity = None
+            if self._viscosity is not None:
+                viscosity = self._viscosity.m_as(self.VISCOSITY_UNIT)
+                kinematic_viscosity = self._viscosity / self._density
+            si = MediumSI(
+                heat_capacity=self._heat_capacity.m_as(self.HEAT_CAPACITY_UNIT),
+                density=self._density.m_as(self.DENSITY_UNIT),
+                volumetric_heat_capacity=volumetric_heat_capacity.m_as(
+                    self.VOLUMETRIC_HEAT_CAPACITY_UNIT
+                ),
+                viscosity=viscosity,
+                kinematic_viscosity=None
+                if kinematic_viscosity is None
+                else kinematic_viscosity.m_as(self.KINEMATIC_VISCOSITY_UNIT),
+            )
+            # plain object.__setattr__, FrozenMedium blocks attribute changes
+            object.__setattr__(
+                self, "_derived", (volumetric_heat_capacity, kinematic_viscosity, si)
+            )
+        return self._derived
+
+
+class Medium(BaseMedium):
+    """Medium Properties, mutable.
+
+    The setters drop the derived properties, which are recomputed on their
+    next use.
+    """
+
+    __slots__ = ()
+
+    @BaseMedium.heat_capacity.setter
+    def heat_capacity(self, value: Quantity) -> None:
+        """Setter for (isobaric) heat capacity property."""
+        check_dimensionality(value, self.HEAT_CAPACITY_UNIT)
+        self._heat_capacity = value
+        self._derived = None
+
+    @BaseMedium.density.setter
     def density(self, value: Quantity) -> None:
         """Setter for density property."""
         check_dimensionality(value, self.DENSITY_UNIT)
         self._density = value
+        self._derived = None
 
-    @property
-    def volumetric_heat_capacity(self) -> Quantity:
-        """Getter for volumetric heat capacity."""
-        return self.heat_capacity * self.density
+    @BaseMedium.viscosity.setter
+    def viscosity(self, value: Optional[Quantity]) -> None:
+        """Setter for (dynamic) viscosity property."""
+        if value is not None:
+            check_dimensionality(value, self.VISCOSITY_UNIT)
+        self._viscosity = value
+        self._derived = None
+
+
+class FrozenMedium(BaseMedium):
+    """Medium Properties, immutable and hashable, e.g. to key caches.
+
+    The derived properties are computed once, on creation. Media at arrays of
+    states are immutable, but not hashable.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initializer, see BaseMedium."""
+        super().__init__(*args, **kwargs)
+        self._derive()
+
+    def __setattr__(self, name: str, value) -> None:
+        """Block attribute changes once initialized, BaseMedium.__init__ sets
+        _derived last."""
+        try:
+            object.__getattribute__(self, "_derived")
+        except AttributeError:
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Block attribute deletion."""
+        raise AttributeError(f"{self.__class__.__name__} is immutable")
+
+    def __eq__(self, other) -> bool:
+        """Equal names, properties, property tables and state variables."""
+        if not isinstance(other, FrozenMedium):
+            return NotImplemented
+        try:
+            return self._key() == other._key()
+        except TypeError:
+            return self is other
+
+    def __hash__(self) -> int:
+        """Hash of names, properties, property tables and state variables."""
+        return hash(self._key())
+
+    def freeze(self) -> "FrozenMedium":
+        """The medium itself, it is immutable already."""
+        return self
+
+    def _key(self):
+        """Comparison key, TypeError for media at arrays of states."""
+        if any(numpy.ndim(value) for value in self.si if value is not None):
+            raise TypeError(
+                f"Unhashable {self.__class__.__name__} '{self.name}' at an array "
+                f"of states"
+            )
+        state = tuple(
+            sorted(
+                (name, float(value.to_base_units().m))
+                for name, value in self._state.items()
+            )
+        )
+        return self.name, self.si, id(self.properties), state
 
 
 class Media(Enum):
     Water = auto()
     Air = auto()
+    EthyleneGlycol30 = auto()
+    EthyleneGlycol40 = auto()
+    PropyleneGlycol30 = auto()
+    PropyleneGlycol40 = auto()
 
 
-media_map = {Media.Water: Medium.water(), Media.Air: Medium.air()}
+media_map = {
+    Media.Water: Medium.water(),
+    Media.Air: Medium.air(),
+    Media.EthyleneGlycol30: Medium.glycol(Glycol.Ethylene, Quantity(30, "%")),
+    Media.EthyleneGlycol40: Medium.glycol(Glycol.Ethylene, Quantity(40, "%")),
+    Media.PropyleneGlycol30: Medium.glycol(Glycol.Propylene, Quantity(30, "%")),
+    Media.PropyleneGlycol40: Medium.glycol(Glycol.Propylene, Quantity(40, "%")),
+}
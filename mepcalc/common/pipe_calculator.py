@@ -0,0 +1,218 @@
+"""Pipe Flow Calculator.
+
+Pressure loss of pressurized (full) pipes after Darcy–Weisbach:
+    R = λ / d * ϱ * v² / 2
+    𝛥p = R * l
+    v = V / (pi/4 * d²)
+    Re = v * d / ν
+with the friction factor λ after Colebrook–White for turbulent flow and
+λ = 64 / Re for laminar flow, see mepcalc.common.friction, and the symbols
+(SI units in parentheses):
+    R:  pressure drop per length (in Pa/m)
+    𝛥p: pressure drop            (in Pa)
+    l:  pipe length              (in m)
+    V:  volume flow              (in m³/s)
+    v:  velocity                 (in m/s)
+    d:  inner diameter           (in m)
+    k:  pipe roughness           (in m)
+and the fluid properties:
+    ϱ:  density                  (in kg/m³)
+    ν:  kinematic viscosity      (in m²/s)
+
+All formulas also accept numpy array backed quantities, e.g. with
+BaseCalculator.batch. Pipe sizing selects the smallest nominal size of a pipe
+series that keeps the pressure drop per length (and optionally the velocity)
+within limits. It bisects the series for all segments at once:
+    calculator.nominal_size(
+        volume_flow=Quantity(volume_flows, "m³/h"),
+        max_pressure_gradient=Quantity(100, "Pa/m"),
+    )
+"""
+
+import math
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import numpy
+from pint import Quantity, Unit
+
+from mepcalc.common import friction
+from mepcalc.common.base_calculator import BaseCalculator
+from mepcalc.common.medium import BaseMedium
+from mepcalc.common.units import check_dimensionality
+
+# nominal size DN -> inner diameter in mm
+PipeSeries = Dict[int, float]
+
+# medium series steel pipes (EN 10255) up to DN 150, seamless steel pipes
+# (EN 10220) above
+STEEL_PIPE_SERIES: PipeSeries = {
+    10: 12.5,
+    15: 16.1,
+    20: 21.7,
+    25: 27.3,
+    32: 36.0,
+    40: 41.9,
+    50: 53.1,
+    65: 68.9,
+    80: 80.9,
+    100: 105.3,
+    125: 129.7,
+    150: 155.4,
+    200: 206.5,
+    250: 260.4,
+    300: 309.7,
+}
+
+# nominal size of segments no size of the series fits
+NO_SIZE = 0
+
+
+class PipeCalculator(BaseCalculator):
+    """Calculator for pressure losses of pressurized pipe flow."""
+
+    DEFAULT_ROUGHNESS = Quantity(0.045, "mm")  # commercial steel
+
+    def __init__(self, medium: BaseMedium) -> None:
+        """Initializer."""
+        super().__init__(medium=medium)
+
+    def _flow_magnitudes(self, volume_flow: Quantity, diameter: Quantity):
+        """Velocity in m/s and diameter in m of a volume flow through a pipe."""
+        check_dimensionality(volume_flow, self.DEFAULT_VOLUME_FLOW_UNIT)
+        check_dimensionality(diameter, self.DEFAULT_LENGTH_UNIT)
+        volume_flow = volume_flow.m_as(self.DEFAULT_VOLUME_FLOW_UNIT)
+        diameter = diameter.m_as(self.DEFAULT_LENGTH_UNIT)
+        return volume_flow / ((math.pi / 4) * diameter**2), diameter
+
+    def reynolds_number(
+        self,
+        volume_flow: Quantity,
+        diameter: Quantity,
+        unit: Unit = BaseCalculator.DEFAULT_DIMENSIONLESS_UNIT,
+    ) -> Quantity:
+        """Re = v * d / ν"""
+        velocity, diameter = self._flow_magnitudes(volume_flow, diameter)
+        _, kinematic_viscosity = self._fluid_magnitudes()
+        reynolds = friction.reynolds_number(velocity, diameter, kinematic_viscosity)
+        return Quantity(reynolds, self.DEFAULT_DIMENSIONLESS_UNIT).to(unit)
+
+    def friction_factor(
+        self,
+        volume_flow: Quantity,
+        diameter: Quantity,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = BaseCalculator.DEFAULT_DIMENSIONLESS_UNIT,
+    ) -> Quantity:
+        """λ = f(Re, k / d) after Colebrook–White, 64 / Re if laminar"""
+        check_dimensionality(roughness, self.DEFAULT_LENGTH_UNIT)
+        velocity, diameter = self._flow_magnitudes(volume_flow, diameter)
+        _, kinematic_viscosity = self._fluid_magnitudes()
+        factor = friction.friction_factor(
+            friction.reynolds_number(velocity, diameter, kinematic_viscosity),
+            roughness.m_as(self.DEFAULT_LENGTH_UNIT) / diameter,
+        )
+        return Quantity(factor, self.DEFAULT_DIMENSIONLESS_UNIT).to(unit)
+
+    def pressure_gradient(
+        self,
+        volume_flow: Quantity,
+        diameter: Quantity,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = BaseCalculator.DEFAULT_PRESSURE_GRADIENT_UNIT,
+    ) -> Quantity:
+        """R = λ / d * ϱ * v² / 2"""
+        check_dimensionality(roughness, self.DEFAULT_LENGTH_UNIT)
+        velocity, diameter = self._flow_magnitudes(volume_flow, diameter)
+        gradient = friction.pressure_gradient(
+            velocity,
+            diameter,
+            roughness.m_as(self.DEFAULT_LENGTH_UNIT),
+            *self._fluid_magnitudes(),
+        )
+        return Quantity(gradient, self.DEFAULT_PRESSURE_GRADIENT_UNIT).to(unit)
+
+    def pressure_drop(
+        self,
+        volume_flow: Quantity,
+        diameter: Quantity,
+        length: Quantity,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        unit: Unit = BaseCalculator.DEFAULT_PRESSURE_UNIT,
+    ) -> Quantity:
+        """𝛥p = R * l"""
+        check_dimensionality(length, self.DEFAULT_LENGTH_UNIT)
+        pressure_drop = (
+            self.pressure_gradient(volume_flow, diameter, roughness) * length
+        )
+        return pressure_drop.to(unit)
+
+    def nominal_size(
+        self,
+        volume_flow: Quantity,
+        max_pressure_gradient: Quantity,
+        max_velocity: Optional[Quantity] = None,
+        roughness: Quantity = DEFAULT_ROUGHNESS,
+        series: PipeSeries = STEEL_PIPE_SERIES,
+    ) -> Union[int, numpy.ndarray]:
+        """Smallest nominal sizes DN of a pipe series within the limits.
+
+        Selects for every volume flow the smallest size whose pressure drop per
+        length does not exceed max_pressure_gradient and, if given, whose
+        velocity does not exceed max_velocity. NO_SIZE if no size fits. The
+        limits broadcast against the volume flows.
+        """
+        check_dimensionality(volume_flow, self.DEFAULT_VOLUME_FLOW_UNIT)
+        check_dimensionality(max_pressure_gradient, self.DEFAULT_PRESSURE_GRADIENT_UNIT)
+        check_dimensionality(roughness, self.DEFAULT_LENGTH_UNIT)
+        volume_flow = numpy.asarray(volume_flow.m_as(self.DEFAULT_VOLUME_FLOW_UNIT))
+        shape = volume_flow.shape
+        volume_flow = volume_flow.ravel()
+        gradient_limit = numpy.broadcast_to(
+            max_pressure_gradient.m_as(self.DEFAULT_PRESSURE_GRADIENT_UNIT), shape
+        ).ravel()
+        velocity_limit = numpy.inf
+        if max_velocity is not None:
+            check_dimensionality(max_velocity, self.DEFAULT_VELOCITY_UNIT)
+            velocity_limit = numpy.broadcast_to(
+                max_velocity.m_as(self.DEFAULT_VELOCITY_UNIT), shape
+            ).ravel()
+        roughness = roughness.m_as(self.DEFAULT_LENGTH_UNIT)
+        fluid = self._fluid_magnitudes()
+
+        def fits(diameter: numpy.ndarray) -> numpy.ndarray:
+            velocity = volume_flow / ((math.pi / 4) * diameter**2)
+            gradient = friction.pressure_gradient(velocity, diameter, roughness, *fluid)
+            return (numpy.abs(gradient) <= gradient_limit) & (
+                numpy.abs(velocity) <= velocity_limit
+            )
+
+        return smallest_size(fits, series, shape)
+
+
+def smallest_size(
+    fits: Callable[[numpy.ndarray], numpy.ndarray],
+    series: PipeSeries,
+    shape: Tuple[int, ...],
+) -> Union[int, numpy.ndarray]:
+    """Smallest nominal sizes of a series that fit, NO_SIZE if none fits.
+
+    fits checks for all segments at once whether they fit into pipes of the
+    given inner diameters in m, one per segment. Pipes must fit better with
+    growing diameter, so the series is bisected for all segments at once with
+    about log2(sizes) calls of fits. The segments are flattened, the result
+    has the given shape.
+    """
+    sizes = numpy.array(sorted(series))
+    diameters = numpy.array([series[size] for size in sizes]) / 1000
+    count = int(numpy.prod(shape))
+    low = numpy.zeros(count, dtype=int)
+    high = numpy.full(count, len(sizes))
+    for _ in range(len(sizes).bit_length()):
+        middle = (low + high) // 2
+        fit = fits(diameters[numpy.minimum(middle, len(sizes) - 1)])
+        fit &= middle < len(sizes)
+        high = numpy.where(fit, middle, high)
+        # converged segments (low == high) must not step past their size
+        low = numpy.where(fit | (low == high), low, middle + 1)
+    result = numpy.append(sizes, NO_SIZE)[low].reshape(shape)
+    return int(result) if result.ndim == 0 else result
@@ -0,0 +1,464 @@
+"""Medium property tables.
+
+Medium properties (heat capacity, density, viscosity) depend on the state of
+the medium, i.e. on its temperature and, for air, on its pressure and
+relative humidity. Equations of state such as IAPWS are far too slow to
+evaluate per row of a calculation, so the properties are tabulated once on a
+uniform grid of the state variables and interpolated, for whole numpy arrays
+of states at once:
+
+    table = water_properties()
+    properties = table.evaluate(temperature=Quantity(temperatures, "°C"))
+
+The grid is uniform along every axis, so locating the cell of a state is
+plain arithmetic and the interpolation is a fixed number of gathers from the
+table, linear (2 per axis) or cubic (4 per axis, Catmull–Rom). All properties
+of a table are stored in one flat array and gathered together.
+
+Any property function can be tabulated with PropertyTable.from_function, e.g.
+an equation of state from iapws. The built-in tables use:
+    water:  reference values at 1 atm (IAPWS-95), 0 to 100 °C
+    air:    humid air as a mixture of ideal gases, saturation pressure after
+            Magnus, viscosity of dry air after Sutherland,
+            -20 to 60 °C, 80 to 110 kPa, 0 to 100 % relative humidity
+    glycol: ethylene and propylene glycol/water mixtures from the pure
+            components with excess terms fitted to typical mixture data,
+            0 to 60 % glycol by mass, -20 to 100 °C
+
+Every table is built once and shared by all media using it, e.g. the glycol
+surface of concentration and temperature serves the glycol media of every
+concentration. States below the freezing point of a mixture are not checked.
+"""
+
+from enum import Enum, auto
+from functools import lru_cache
+from typing import Callable, Dict, NamedTuple, Optional, Sequence
+
+import numpy
+from pint import Quantity
+
+from mepcalc import ureg
+from mepcalc.common.units import check_dimensionality
+
+INTERPOLATION_METHODS = ("linear", "cubic")
+DEFAULT_INTERPOLATION_METHOD = "cubic"
+
+
+class Axis(NamedTuple):
+    """Uniform grid of a state variable from start to stop in steps."""
+
+    name: str
+    start: float
+    stop: float
+    steps: int
+    unit: str
+    default: Optional[float] = None
+
+    @property
+    def values(self) -> numpy.ndarray:
+        """Grid values in unit."""
+        return numpy.linspace(self.start, self.stop, self.steps + 1)
+
+    @property
+    def step(self) -> float:
+        """Grid spacing in unit."""
+        return (self.stop - self.start) / self.steps
+
+
+def _pad(values: numpy.ndarray, axis: int) -> numpy.ndarray:
+    """Values with one quadratically extrapolated ghost layer at both ends of
+    an axis, so cubic interpolation needs no special case at the table ends
+    and stays exact for quadratic functions there."""
+    head = numpy.take(values, [0, 1, 2], axis=axis)
+    tail = numpy.take(values, [-1, -2, -3], axis=axis)
+    ghosts = [
+        3 * numpy.take(ends, [0], axis=axis)
+        - 3 * numpy.take(ends, [1], axis=axis)
+        + numpy.take(ends, [2], axis=axis)
+        for ends in (head, tail)
+    ]
+    return numpy.concatenate([ghosts[0], values, ghosts[1]], axis=axis)
+
+
+def _weights(fraction: numpy.ndarray, method: str):
+    """Index offsets and interpolation weights of the fractional positions
+    within their grid cells."""
+    if method == "linear":
+        return (0, 1), (1 - fraction, fraction)
+    # Catmull–Rom: cubic Hermite with central difference slopes
+    t, t2 = fraction, fraction * fraction
+    t3 = t2 * fraction
+    return (-1, 0, 1, 2), (
+        (-t + 2 * t2 - t3) / 2,
+        (2 - 5 * t2 + 3 * t3) / 2,
+        (t + 4 * t2 - 3 * t3) / 2,
+        (t3 - t2) / 2,
+    )
+
+
+class PropertyTable:
+    """Medium properties tabulated on a uniform grid of state variables."""
+
+    def __init__(
+        self,
+        axes: Sequence[Axis],
+        tables: Dict[str, numpy.ndarray],
+        units: Dict[str, str],
+    ):
+        """Initializer.
+
+        axes: state variables of the grid
+        tables: property name -> values on the grid, shape (steps + 1, ...)
+        units: property name -> unit of its values
+        """
+        self.axes = tuple(axes)
+        self.names = tuple(tables)
+        self.units = {name: ureg.Unit(units[name]) for name in self.names}
+        self.shape = tuple(axis.steps + 1 for axis in self.axes)
+        if min(self.shape) < 3:
+            raise ValueError("Property tables need at least 2 steps per axis")
+        for name, table in tables.items():
+            if numpy.shape(table) != self.shape:
+                raise ValueError(
+                    f"Table of property '{name}' has shape {numpy.shape(table)}, "
+                    f"expected: {self.shape}"
+                )
+        # all properties in one array, so one gather fetches all of them
+        values = numpy.stack(
+            [numpy.asarray(tables[name], dtype=float) for name in self.names],
+            axis=-1,
+        )
+        for axis in range(len(self.axes)):
+            values = _pad(values, axis)
+        self.values = values
+        # property-major flat copy for gathering all properties at once
+        self._flat = numpy.ascontiguousarray(values.reshape(-1, len(self.names)).T)
+        self._strides = [
+            int(numpy.prod(values.shape[axis + 1 : -1]))
+            for axis in range(len(self.axes))
+        ]
+        self._axis_units = [ureg.Unit(axis.unit) for axis in self.axes]
+
+    @classmethod
+    def from_function(
+        cls,
+        axes: Sequence[Axis],
+        function: Callable[..., Dict[str, numpy.ndarray]],
+        units: Dict[str, str],
+    ) -> "PropertyTable":
+        """Tabulate a property function once on the grid.
+
+        function is called with the grid values of all axes as keyword
+        arguments (broadcast arrays in the axis units) and returns the
+        property values by name.
+        """
+        grids = numpy.meshgrid(*(axis.values for axis in axes), indexing="ij")
+        tables = function(**{axis.name: grid for axis, grid in zip(axes, grids)})
+        shape = grids[0].shape
+        return cls(
+            axes,
+            {name: numpy.broadcast_to(table, shape) for name, table in tables.items()},
+            units,
+        )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """String representation."""
+        axes = ", ".join(f"{axis.name}[{axis.steps + 1}]" for axis in self.axes)
+        return f"{self.__class__.__name__}({', '.join(self.names)} of {axes})"
+
+    def evaluate(
+        self, method: str = DEFAULT_INTERPOLATION_METHOD, **state: Quantity
+    ) -> Dict[str, Quantity]:
+        """Properties at states, interpolated linearly or cubically.
+
+        The state variables broadcast against each other, variables with a
+        default may be omitted. States outside the table fail.
+        """
+        magnitudes = self._magnitudes(state)
+        return {
+            name: Quantity(magnitude, self.units[name])
+            for name, magnitude in self.interpolate(method, *magnitudes).items()
+        }
+
+    def interpolate(
+        self, method: str, *magnitudes: numpy.ndarray
+    ) -> Dict[str, numpy.ndarray]:
+        """Properties at states given as magnitudes in the axis units, one per
+        axis, see evaluate. Floats for scalar states."""
+        if method not in INTERPOLATION_METHODS:
+            raise ValueError(
+                f"Unknown interpolation method '{method}', "
+                f"expected one of: {', '.join(INTERPOLATION_METHODS)}"
+            )
+        magnitudes = numpy.broadcast_arrays(
+            *(numpy.asarray(magnitude, dtype=float) for magnitude in magnitudes)
+        )
+        shape = magnitudes[0].shape
+        # flat table index of the states' grid cells and (flat index offset,
+        # weight) of every neighbour that takes part in the interpolation
+        base = 0
+        neighbours = [(0, 1.0)]
+        for axis, magnitude, stride in zip(self.axes, magnitudes, self._strides):
+            position = (magnitude.ravel() - axis.start) / axis.step
+            if numpy.any(position < 0) or numpy.any(position > axis.steps):
+                raise ValueError(
+                    f"State variable '{axis.name}' outside of the table, "
+                    f"expected: {axis.start} to {axis.stop} {axis.unit}"
+                )
+            # the last grid point belongs to the last cell
+            index = numpy.minimum(position.astype(int), axis.steps - 1)
+            offsets, weights = _weights(position - index, method)
+            # + 1 for the ghost layer
+            base = base + (index + 1) * stride
+            neighbours = [
+                (offset + axis_offset * stride, weight * axis_weight)
+                for offset, weight in neighbours
+                for axis_offset, axis_weight in zip(offsets, weights)
+            ]
+        result = 0.0
+        for offset, weight in neighbours:
+            result = result + weight * numpy.take(self._flat, base + offset, axis=1)
+        if not shape:
+            return {
+                name: float(result[position, 0])
+                for position, name in enumerate(self.names)
+            }
+        return {
+            name: result[position].reshape(shape)
+            for position, name in enumerate(self.names)
+        }
+
+    def _magnitudes(self, state: Dict[str, Quantity]):
+        """Magnitudes of the state variables in the axis units."""
+        unknown = set(state) - {axis.name for axis in self.axes}
+        if unknown:
+            raise ValueError(
+                f"Unknown state variables: {', '.join(sorted(unknown))}, "
+                f"expected: {', '.join(axis.name for axis in self.axes)}"
+            )
+        magnitudes = []
+        for axis, unit in zip(self.axes, self._axis_units):
+            if axis.name in state:
+                check_dimensionality(state[axis.name], unit)
+                magnitudes.append(state[axis.name].m_as(unit))
+            elif axis.default is not None:
+                magnitudes.append(axis.default)
+            else:
+                raise ValueError(f"Missing state variable '{axis.name}'")
+        return magnitudes
+
+
+# water at 1 atm (IAPWS-95) from 0 to 100 °C: temperature in °C, heat
+# capacity in J/(kg K), density in kg/m³, viscosity in mPa s
+WATER_REFERENCE = numpy.array(
+    [
+        [0, 4219.9, 999.84, 1.7914],
+        [10, 4195.5, 999.70, 1.3060],
+        [20, 4184.4, 998.21, 1.0016],
+        [30, 4180.1, 995.65, 0.7972],
+        [40, 4179.6, 992.22, 0.6527],
+        [50, 4181.5, 988.04, 0.5465],
+        [60, 4185.1, 983.20, 0.4660],
+        [70, 4190.2, 977.76, 0.4035],
+        [80, 4196.9, 971.79, 0.3540],
+        [90, 4205.3, 965.31, 0.3145],
+        [100, 4215.7, 958.35, 0.2818],
+    ]
+)
+
+STANDARD_PRESSURE = 101325.0  # Pa
+ZERO_CELSIUS = 273.15  # K
+DRY_AIR_GAS_CONSTANT = 287.058  # J/(kg K)
+VAPOUR_GAS_CONSTANT = 461.523  # J/(kg K)
+DRY_AIR_HEAT_CAPACITY = 1006.0  # J/(kg K)
+VAPOUR_HEAT_CAPACITY = 1860.0  # J/(kg K)
+# Sutherland: η = η0 * (T / T0)^1.5 * (T0 + S) / (T + S)
+SUTHERLAND_VISCOSITY = 1.716e-5  # Pa s at T0 = 0 °C
+SUTHERLAND_CONSTANT = 110.4  # K
+
+
+def saturation_pressure(temperature: numpy.ndarray) -> numpy.ndarray:
+    """Saturation vapour pressure over water in Pa of temperatures in °C after
+    Magnus."""
+    return 611.2 * numpy.exp(17.62 * temperature / (243.12 + temperature))
+
+
+def humid_air(
+    temperature: numpy.ndarray, pressure: numpy.ndarray, humidity: numpy.ndarray
+) -> Dict[str, numpy.ndarray]:
+    """Properties of humid air at temperatures in °C, pressures in Pa and
+    relative humidities (0 to 1).
+
+    Heat capacity in J/(kg K) and density in kg/m³ of the mixture of dry air
+    and vapour, viscosity in Pa s of dry air (the vapour changes it by less
+    than 1 % in the range of the table).
+    """
+    kelvin = temperature + ZERO_CELSIUS
+    vapour_pressure = humidity * saturation_pressure(temperature)
+    density = (pressure - vapour_pressure) / (
+        DRY_AIR_GAS_CONSTANT * kelvin
+    ) + vapour_pressure / (VAPOUR_GAS_CONSTANT * kelvin)
+    # humidity ratio in kg vapour per kg dry air
+    ratio = (
+        DRY_AIR_GAS_CONSTANT
+        / VAPOUR_GAS_CONSTANT
+        * vapour_pressure
+        / (pressure - vapour_pressure)
+    )
+    heat_capacity = (DRY_AIR_HEAT_CAPACITY + VAPOUR_HEAT_CAPACITY * ratio) / (1 + ratio)
+    viscosity = (
+        SUTHERLAND_VISCOSITY
+        * (kelvin / ZERO_CELSIUS) ** 1.5
+        * (ZERO_CELSIUS + SUTHERLAND_CONSTANT)
+        / (kelvin + SUTHERLAND_CONSTANT)
+    )
+    return {"heat_capacity": heat_capacity, "density": density, "viscosity": viscosity}
+
+
+@lru_cache(maxsize=None)
+def water_properties() -> PropertyTable:
+    """Properties of liquid water by temperature (built once)."""
+    temperature, heat_capacity, density, viscosity = WATER_REFERENCE.T
+    return PropertyTable(
+        axes=[Axis("temperature", temperature[0], temperature[-1], 10, "degC")],
+        tables={
+            "heat_capacity": heat_capacity,
+            "density": density,
+            "viscosity": viscosity,
+        },
+        units={"heat_capacity": "J/(kg K)", "density": "kg/m³", "viscosity": "mPa s"},
+    )
+
+
+@lru_cache(maxsize=None)
+def air_properties() -> PropertyTable:
+    """Properties of humid air by temperature, pressure (default: 1 atm) and
+    relative humidity (default: dry air) (built once)."""
+    return PropertyTable.from_function(
+        axes=[
+            Axis("temperature", -20, 60, 80, "degC"),
+            Axis("pressure", 80000, 110000, 12, "Pa", default=STANDARD_PRESSURE),
+            Axis("humidity", 0, 1, 10, "", default=0.0),
+        ],
+        function=humid_air,
+        units={"heat_capacity": "J/(kg K)", "density": "kg/m³", "viscosity": "Pa s"},
+    )
+
+
+class Glycol(Enum):
+    Ethylene = auto()
+    Propylene = auto()
+
+
+class GlycolParameters(NamedTuple):
+    """Pure glycol and mixture parameters, temperatures t in °C, T in K.
+
+    density:        ϱ_g = density + density_slope * t  (in kg/m³)
+    heat capacity:  cp_g = heat_capacity + heat_capacity_slope * t
+                    (in J/(kg K))
+    viscosity:      ln(η_g / mPa s) = viscosity_a + viscosity_b / (T - viscosity_c)
+    mixture of the mass fraction ξ of glycol with water:
+        1 / ϱ = (1 - ξ) / ϱ_w + ξ / ϱ_g - excess_volume * ξ * (1 - ξ)
+        cp = (1 - ξ) * cp_w + ξ * cp_g + excess_heat_capacity * ξ * (1 - ξ)
+        ln η = (1 - ξ) * ln η_w + ξ * ln η_g + excess_viscosity * ξ * (1 - ξ)
+    """
+
+    density: float
+    density_slope: float
+    heat_capacity: float
+    heat_capacity_slope: float
+    viscosity_a: float
+    viscosity_b: float
+    viscosity_c: float
+    excess_volume: float  # m³/kg
+    excess_heat_capacity: float
+    excess_viscosity: float
+
+
+GLYCOL_PARAMETERS = {
+    Glycol.Ethylene: GlycolParameters(
+        1127.7, -0.70, 2310.0, 4.5, -3.236, 919.3, 145.0, 4.8e-5, 0.0, -0.65
+    ),
+    Glycol.Propylene: GlycolParameters(
+        1052.0, -0.75, 2380.0, 6.0, -3.362, 865.4, 175.5, 8.6e-5, 800.0, -0.75
+    ),
+}
+
+
+def water_density(temperature: numpy.ndarray) -> numpy.ndarray:
+    """Density of (supercooled) liquid water in kg/m³ of temperatures in °C
+    after Kell."""
+    t = temperature
+    return (
+        999.83952
+        + 16.945176 * t
+        - 7.9870401e-3 * t**2
+        - 46.170461e-6 * t**3
+        + 105.56302e-9 * t**4
+        - 280.54253e-12 * t**5
+    ) / (1 + 16.879850e-3 * t)
+
+
+def water_heat_capacity(temperature: numpy.ndarray) -> numpy.ndarray:
+    """Heat capacity of liquid water in J/(kg K) of temperatures in °C, fitted
+    to WATER_REFERENCE."""
+    return numpy.polyval(
+        [2.870e-6, -7.2341e-4, 7.27188e-2, -2.941424, 4219.4133], temperature
+    )
+
+
+def water_viscosity(temperature: numpy.ndarray) -> numpy.ndarray:
+    """Viscosity of liquid water in mPa s of temperatures in °C after Vogel."""
+    return 2.414e-2 * 10 ** (247.8 / (temperature + ZERO_CELSIUS - 140))
+
+
+def glycol_mixture(
+    glycol: Glycol, concentration: numpy.ndarray, temperature: numpy.ndarray
+) -> Dict[str, numpy.ndarray]:
+    """Properties of glycol/water mixtures at mass fractions of glycol (0 to 1)
+    and temperatures in °C, see GlycolParameters.
+
+    Heat capacity in J/(kg K), density in kg/m³, viscosity in mPa s.
+    """
+    parameters = GLYCOL_PARAMETERS[glycol]
+    fraction = concentration
+    mixing = fraction * (1 - fraction)
+    glycol_density = parameters.density + parameters.density_slope * temperature
+    density = 1 / (
+        (1 - fraction) / water_density(temperature)
+        + fraction / glycol_density
+        - parameters.excess_volume * mixing
+    )
+    glycol_heat_capacity = (
+        parameters.heat_capacity + parameters.heat_capacity_slope * temperature
+    )
+    heat_capacity = (
+        (1 - fraction) * water_heat_capacity(temperature)
+        + fraction * glycol_heat_capacity
+        + parameters.excess_heat_capacity * mixing
+    )
+    glycol_viscosity = parameters.viscosity_a + parameters.viscosity_b / (
+        temperature + ZERO_CELSIUS - parameters.viscosity_c
+    )
+    viscosity = numpy.exp(
+        (1 - fraction) * numpy.log(water_viscosity(temperature))
+        + fraction * glycol_viscosity
+        + parameters.excess_viscosity * mixing
+    )
+    return {"heat_capacity": heat_capacity, "density": density, "viscosity": viscosity}
+
+
+@lru_cache(maxsize=None)
+def glycol_properties(glycol: Glycol) -> PropertyTable:
+    """Properties of glycol/water mixtures by concentration (mass fraction of
+    glycol) and temperature (built once per glycol)."""
+    return PropertyTable.from_function(
+        axes=[
+            Axis("concentration", 0, 0.6, 24, ""),
+            Axis("temperature", -20, 100, 120, "degC"),
+        ],
+        function=lambda concentration, temperature: glycol_mixture(
+            glycol, concentration, temperature
+        ),
+        units={"heat_capacity": "J/(kg K)", "density": "kg/m³", "viscosity": "mPa s"},
+    )
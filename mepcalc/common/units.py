@@ -1,20 +1,55 @@
-"""Unit kinds and mapping"""
+"""Unit kinds and mapping
+
+The units of units_map convert to SI base units with a scale and offset
+(unit_conversion), so reading and writing values of GUI fields is a
+multiplication instead of parsing the unit name with pint every time. A
+conversion is derived with pint the first time its unit is used and cached,
+so importing the module parses no units.
+"""
 
 from enum import Enum, auto
+from functools import lru_cache
+from typing import NamedTuple
 
+from numpy.typing import ArrayLike
 from pint import Quantity, Unit
 
+DIMENSIONALITY_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=DIMENSIONALITY_CACHE_SIZE)
+def _matching_dimensionality(registry, units, unit_registry, unit_units) -> bool:
+    """Compare the dimensionality of two unit containers (cached)."""
+    return registry.get_dimensionality(units) == unit_registry.get_dimensionality(
+        unit_units
+    )
+
 
 def check_dimensionality(quantity: Quantity, unit: Unit) -> None:
-    """Check that quantity is of the same dimension as unit."""
-    expected_dimensionality = unit.dimensionality
-    if not quantity.dimensionality == expected_dimensionality:
+    """Check that quantity is of the same dimension as unit.
+
+    The result is cached by the quantity's unit container, so repeated checks
+    with the same units are a single dictionary lookup.
+    """
+    if not _matching_dimensionality(
+        quantity._REGISTRY, quantity._units, unit._REGISTRY, unit._units
+    ):
         raise ValueError(
             f"Unexpected dimensionality '{quantity.dimensionality}', "
-            f"expected: '{expected_dimensionality}'"
+            f"expected: '{unit.dimensionality}'"
         )
 
 
+def dimensionality_cache_info():
+    """Hits, misses, maximum and current size of the dimensionality cache."""
+    return _matching_dimensionality.cache_info()
+
+
+def dimensionality_cache_clear() -> None:
+    """Clear the dimensionality cache and its statistics."""
+    _matching_dimensionality.cache_clear()
+
+
 class Units(Enum):
     HeatCapacity = auto()
     Density = auto()
@@ -52,3 +87,49 @@ units_map = {
         "cm/h",
     ],
 }
+
+
+class Conversion(NamedTuple):
+    """Conversion of magnitudes in a unit to the SI base unit:
+    si = magnitude * scale + offset."""
+
+    scale: float
+    offset: float
+    unit: Unit  # SI base unit
+
+    @classmethod
+    def of(cls, name: str) -> "Conversion":
+        """Conversion of a unit name, derived with pint."""
+        unit = Unit(name)
+        zero = Quantity(0.0, unit).to_base_units()
+        one = Quantity(1.0, unit).to_base_units()
+        return cls(one.magnitude - zero.magnitude, zero.magnitude, one.units)
+
+    def to_si(self, magnitude: ArrayLike) -> ArrayLike:
+        """Magnitude in the SI base unit."""
+        return magnitude * self.scale + self.offset
+
+    def from_si(self, magnitude: ArrayLike) -> ArrayLike:
+        """Magnitude in the unit, from one in the SI base unit."""
+        return (magnitude - self.offset) / self.scale
+
+    def quantity(self, magnitude: ArrayLike) -> Quantity:
+        """Quantity in the SI base unit of a magnitude in the unit."""
+        return Quantity(self.to_si(magnitude), self.unit)
+
+    def magnitude(self, quantity: Quantity) -> ArrayLike:
+        """Magnitude of a quantity in the unit."""
+        return self.from_si(quantity.m_as(self.unit))
+
+
+@lru_cache(maxsize=None)
+def unit_conversion(kind: Units, name: str) -> Conversion:
+    """Conversion of a unit of units_map, derived on first use (cached)."""
+    if name not in units_map.get(kind, ()):
+        raise ValueError(f"Unexpected unit '{name}' for {kind.name}")
+    return Conversion.of(name)
+
+
+def unit_conversion_cache_info():
+    """Hits, misses, maximum and current size of the unit conversion cache."""
+    return unit_conversion.cache_info()
@@ -1,26 +1,151 @@
-"""Base Calculator."""
+"""Base Calculator.
+
+Calculator widgets recalculate off the Qt main thread:
+
+    edit -> inputs_changed -> debounce timer -> recalculate -> worker thread
+         -> calculation_finished -> show_results (main thread)
+
+inputs_changed only (re)starts a short single-shot timer, so a burst of
+keystrokes results in a single calculation. recalculate reads the input
+fields on the main thread, snapshots the medium and hands a pure calculation
+to a QThreadPool worker. Every calculation carries a generation number, and
+results of calculations superseded by newer edits are dropped, so stale
+results never overwrite newer ones. Inputs that are no numbers yet (e.g. "-"
+or "1e" in the middle of an edit) start no calculation. A failed calculation
+clears the calculated fields and shows its error below the fields.
+
+The fields of a calculator are declared in a table of FieldSpec, from which
+the base class creates, lays out and connects the widgets, one grid row per
+field:
+
+    col | 0     | 1     | 2      | 3    | 4     |
+    row |-------|-------|--------|------|-------|
+      n | Radio | Label | Symbol | Edit | Combo |
+
+The radio buttons select the calculated field (the output), which dispatches
+to the method calculate_<name> of the field. Calculators with a GRAPH
+instead solve the output and the DERIVED fields from all other fields with the
+equation graph, and fields the graph cannot calculate are inputs only. They
+keep the last solution and, while the output stays, only recompute the fields
+downstream of the edited ones.
+"""
 
 import sys
-from typing import List
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
-from PySide6.QtCore import Slot
+from PySide6.QtCore import (
+    QLocale,
+    QObject,
+    QRunnable,
+    QStringListModel,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QDoubleValidator
 from PySide6.QtWidgets import (
     QApplication,
+    QButtonGroup,
+    QComboBox,
+    QGridLayout,
+    QLabel,
+    QLineEdit,
+    QRadioButton,
     QWidget,
 )
+from pint import Quantity
+
+from mepcalc.common.equation_graph import EquationGraph, Solution
+from mepcalc.common.medium import BaseMedium, Medium
+from mepcalc.common.units import Conversion, Units, unit_conversion, units_map
+
+# field name -> value
+Values = Dict[str, Quantity]
+# calculation run by a worker, returns the calculated fields or a solution
+Calculation = Callable[[], Union[Values, Solution]]
+
+
+class FieldSpec(NamedTuple):
+    """Declaration of a calculator field."""
+
+    name: str  # key of the field's values, e.g. "heat_flow"
+    label: str
+    symbol: str
+    units: Units
+    placeholder: str = ""  # defaults to the label
+
+
+class FieldRow(NamedTuple):
+    """Widgets of a calculator field, in the order of the grid columns."""
+
+    radio: QRadioButton
+    label: QLabel
+    symbol: QLabel
+    edit: QLineEdit
+    combo: QComboBox
+
+
+@lru_cache(maxsize=None)
+def unit_model(units: Units) -> QStringListModel:
+    """Unit names of a unit kind, one model shared by all unit combo boxes."""
+    return QStringListModel(units_map[units])
+
 
-from mepcalc.common.medium import Medium
+class CalculationSignals(QObject):
+    """Signals of a calculation worker, emitted with its generation."""
+
+    finished = Signal(int, object)
+    failed = Signal(int, str)
+
+
+class CalculationWorker(QRunnable):
+    """Runs a calculation in a thread pool."""
+
+    def __init__(self, generation: int, calculation: Calculation) -> None:
+        """Initializer."""
+        super().__init__()
+        self.generation = generation
+        self.calculation = calculation
+        self.signals = CalculationSignals()
+
+    def run(self) -> None:
+        """Run the calculation and emit its results or error."""
+        try:
+            results = self.calculation()
+        except Exception as error:  # reported to the widget, not raised in the pool
+            self.signals.failed.emit(self.generation, str(error))
+        else:
+            self.signals.finished.emit(self.generation, results)
 
 
 class BaseCalculatorWidget(QWidget):
     """Base class for calculator ."""
 
     OUTPUT_FORMAT_SPEC = ".6g"
+    RECALCULATION_DELAY = 150  # ms without edits before recalculating
+    DEFAULT_MAGNITUDE = "1.0"
+    FIELDS: Tuple[FieldSpec, ...] = ()
+    GRAPH: Optional[EquationGraph] = None
+    DERIVED: Tuple[str, ...] = ()  # fields always calculated, never inputs
 
-    def __init__(self, medium: Medium, parent=None) -> None:
+    def __init__(self, medium: BaseMedium, parent=None) -> None:
         super().__init__(parent)
         self.medium = medium
         self.permanently_disabled: List[QWidget] = []
+        # generation of the latest calculation, older results are stale
+        self.generation = 0
+        self.error: Optional[str] = None
+        self.solution: Optional[Solution] = None
+        # signals of running workers, kept alive until their results arrive
+        self.pending: Dict[int, CalculationSignals] = {}
+        self.thread_pool = QThreadPool.globalInstance()
+        self.recalculation_timer = QTimer(self)
+        self.recalculation_timer.setSingleShot(True)
+        self.recalculation_timer.setInterval(self.RECALCULATION_DELAY)
+        self.recalculation_timer.timeout.connect(self.recalculate)
         self.setup_ui()
 
     def setup_ui(self) -> None:
@@ -34,26 +159,191 @@ class BaseCalculatorWidget(QWidget):
         self.output_changed()
 
     def create_widgets(self) -> None:
-        pass
+        """Create the widgets of the fields, see FIELDS."""
+        self.rows: Dict[str, FieldRow] = {
+            spec.name: FieldRow(
+                radio=QRadioButton(self),
+                label=QLabel(spec.label, self),
+                symbol=QLabel(spec.symbol, self),
+                edit=QLineEdit(self.DEFAULT_MAGNITUDE, self),
+                combo=QComboBox(self),
+            )
+            for spec in self.FIELDS
+        }
+        self.output_group = QButtonGroup(self)
+        self.status = QLabel(self)
 
     def initialize_widgets(self) -> None:
-        pass
+        """Setup widgets for the user interface."""
+        # Setup double validator
+        c_locale = QLocale.c()
+        c_locale.setNumberOptions(QLocale.NumberOption.RejectGroupSeparator)
+        double_validator = QDoubleValidator(self)
+        double_validator.setLocale(c_locale)
+        double_validator.setNotation(QDoubleValidator.Notation.StandardNotation)
+        # Fields, the radio button ids index FIELDS
+        for index, spec in enumerate(self.FIELDS):
+            row = self.rows[spec.name]
+            self.output_group.addButton(row.radio, index)
+            row.edit.setAlignment(Qt.AlignmentFlag.AlignRight)
+            row.edit.setPlaceholderText(spec.placeholder or spec.label)
+            row.edit.setValidator(double_validator)
+            row.combo.setModel(unit_model(spec.units))
+        # derived fields are never inputs, nor outputs
+        for name in self.DERIVED:
+            self.permanently_disable(self.rows[name].radio)
+            self.permanently_disable(self.rows[name].edit)
+        # fields the graph cannot calculate are never outputs
+        if self.GRAPH is not None:
+            for spec in self.FIELDS:
+                if spec.name not in self.GRAPH.outputs:
+                    self.permanently_disable(self.rows[spec.name].radio)
+        # first field that can be calculated is the output
+        for spec in self.FIELDS:
+            radio = self.rows[spec.name].radio
+            if radio not in self.permanently_disabled:
+                radio.setChecked(True)
+                break
 
     def build_layout(self) -> None:
-        pass
+        """Setup layout of the user interface in a grid, a row per field."""
+        layout = QGridLayout(self)
+        for row_index, row in enumerate(self.rows.values()):
+            for column, widget in enumerate(row):
+                layout.addWidget(widget, row_index, column)
+        # errors of failed calculations, below the fields
+        layout.addWidget(self.status, len(self.rows), 0, 1, len(FieldRow._fields))
 
     def connect_signals_and_slots(self) -> None:
-        pass
+        """Connect signals to slots."""
+        for row in self.rows.values():
+            # radio buttons -> calculation output changed -> recalculate
+            row.radio.toggled.connect(self.output_changed)
+            # magnitudes and units -> inputs changed -> recalculate
+            row.edit.textEdited.connect(self.inputs_changed)
+            row.combo.currentTextChanged.connect(self.inputs_changed)
+
+    def output(self) -> Optional[FieldSpec]:
+        """Field selected as output, None without fields."""
+        index = self.output_group.checkedId()
+        return None if index < 0 else self.FIELDS[index]
 
     @Slot()
     def output_changed(self, checked=True) -> None:
+        """Disable the output field and recalculate."""
         if not checked:
             return
-        pass
+        output = self.output()
+        # enable all line edit fields, but the output
+        for name, row in self.rows.items():
+            row.edit.setEnabled(output is None or name != output.name)
+        # disable permanently disabled widgets
+        for widget in self.permanently_disabled:
+            widget.setDisabled(True)
+        # recalculate right away, there is no burst of edits to wait for
+        self.recalculate()
 
     @Slot()
     def inputs_changed(self) -> None:
-        pass
+        """Recalculate once the inputs stop changing."""
+        self.recalculation_timer.start()
+
+    @Slot()
+    def recalculate(self) -> None:
+        """Start a calculation of the current inputs in a worker thread."""
+        self.recalculation_timer.stop()
+        inputs = self.read_inputs()
+        if inputs is None:
+            return  # not ready, the edit completing the number recalculates
+        self.generation += 1
+        calculation = self.calculation(inputs, self.medium.freeze())
+        if calculation is None:
+            return
+        worker = CalculationWorker(self.generation, calculation)
+        worker.signals.finished.connect(self.calculation_finished)
+        worker.signals.failed.connect(self.calculation_failed)
+        self.pending[self.generation] = worker.signals
+        self.thread_pool.start(worker)
+
+    def calculation(self, inputs: Values, medium: BaseMedium) -> Optional[Calculation]:
+        """Calculation of the selected output from the inputs, run in a worker
+        thread, so it must not touch any widgets. It returns the calculated
+        values or a Solution of the GRAPH. None if there is nothing to
+        calculate."""
+        output = self.output()
+        if output is None:
+            return None
+        if self.GRAPH is None:
+            calculate = getattr(self, f"calculate_{output.name}")
+            return partial(calculate, inputs, medium)
+        unknown = frozenset((output.name, *self.DERIVED))
+        known = {name: value for name, value in inputs.items() if name not in unknown}
+        previous = self.solution
+        if previous is not None and previous.matches(medium, known, unknown):
+            changes = {
+                name: value
+                for name, value in known.items()
+                if value != previous.values[name]
+            }
+            return partial(previous.updated, **changes)
+        return partial(self.GRAPH.solve, medium, unknown, **known)
+
+    @Slot(int, object)
+    def calculation_finished(
+        self, generation: int, results: Union[Values, Solution]
+    ) -> None:
+        """Show the results of the latest calculation, drop stale ones."""
+        self.pending.pop(generation, None)
+        if generation != self.generation:
+            return
+        self.error = None
+        self.status.clear()
+        if isinstance(results, Solution):
+            self.solution = results
+            results = results.results
+        self.show_results(results)
+
+    @Slot(int, str)
+    def calculation_failed(self, generation: int, error: str) -> None:
+        """Show the error of the latest calculation and clear the calculated
+        fields, so they show no values of former inputs."""
+        self.pending.pop(generation, None)
+        if generation != self.generation:
+            return
+        self.error = error
+        self.status.setText(f"Error: {error}")
+        for name in self.calculated():
+            self.rows[name].edit.clear()
+
+    def calculated(self) -> Tuple[str, ...]:
+        """Names of the calculated fields, the output and the DERIVED ones."""
+        output = self.output()
+        return self.DERIVED if output is None else (output.name, *self.DERIVED)
+
+    def read_inputs(self) -> Optional[Values]:
+        """Values of all fields, empty fields are zero. None while a field
+        holds no number yet, e.g. "-" or "1e" in the middle of an edit."""
+        inputs = {}
+        for spec in self.FIELDS:
+            try:
+                magnitude = float(self.rows[spec.name].edit.text() or 0)
+            except ValueError:
+                return None
+            inputs[spec.name] = self.conversion(spec).quantity(magnitude)
+        return inputs
+
+    def show_results(self, results: Values) -> None:
+        """Write calculated values into their fields, in the selected units."""
+        for spec in self.FIELDS:
+            if spec.name in results:
+                magnitude = self.conversion(spec).magnitude(results[spec.name])
+                self.rows[spec.name].edit.setText(
+                    f"{magnitude:{self.OUTPUT_FORMAT_SPEC}}"
+                )
+
+    def conversion(self, spec: FieldSpec) -> Conversion:
+        """Conversion of the unit selected for a field."""
+        return unit_conversion(spec.units, self.rows[spec.name].combo.currentText())
 
     def permanently_disable(self, widget: QWidget) -> None:
         """Permanently disable widget."""
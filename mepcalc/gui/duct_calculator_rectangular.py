@@ -2,29 +2,24 @@
 
 import sys
 
-from PySide6.QtWidgets import QApplication, QWidget
-from pint import Quantity
+from PySide6.QtWidgets import QApplication
 
 from mepcalc.common.medium import Medium
 from mepcalc.gui.duct_calculator_base import DuctCalculatorWidget
 
 
 class DuctCalculatorRectangularWidget(DuctCalculatorWidget):
-    """Duct air flow calculator widget."""
+    """Rectangular duct air flow calculator widget."""
 
-    def initialize_widgets(self) -> None:
-        """Setup widgets for the user interface."""
-        ...
-
-    def calculate_(self):
-        """."""
-        ...
+    FIELDS = tuple(
+        spec for spec in DuctCalculatorWidget.FIELDS if spec.name != "diameter"
+    )
 
 
 def main():
     """Main program."""
     app = QApplication()
-    window = DuctCalculatorRectangularWidget()
+    window = DuctCalculatorRectangularWidget(medium=Medium.air())
     window.setWindowTitle("Duct Calculator Rectangular")
     window.show()
     sys.exit(app.exec())
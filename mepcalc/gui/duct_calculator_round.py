@@ -2,30 +2,27 @@
 
 import sys
 
-from PySide6.QtWidgets import QApplication, QWidget
-from pint import Quantity
+from PySide6.QtWidgets import QApplication
 
 from mepcalc.common.medium import Medium
 from mepcalc.gui.duct_calculator_base import DuctCalculatorWidget
 
 
 class DuctCalculatorRoundWidget(DuctCalculatorWidget):
-    """Duct air flow calculator widget."""
+    """Round duct air flow calculator widget."""
 
-    def initialize_widgets(self) -> None:
-        """Setup widgets for the user interface."""
-        ...
-
-    def calculate_(self):
-        """."""
-        ...
+    FIELDS = tuple(
+        spec
+        for spec in DuctCalculatorWidget.FIELDS
+        if spec.name not in ("width", "height")
+    )
 
 
 def main():
     """Main program."""
     app = QApplication()
-    window = DuctCalculatorRoundWidget()
-    window.setWindowTitle("Duct Calculator Rectangular")
+    window = DuctCalculatorRoundWidget(medium=Medium.air())
+    window.setWindowTitle("Duct Calculator Round")
     window.show()
     sys.exit(app.exec())
 
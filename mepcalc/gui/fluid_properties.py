@@ -16,7 +16,7 @@ from PySide6.QtWidgets import (
 from pint import Quantity
 
 from mepcalc.common.medium import Medium, media_map
-from mepcalc.common.units import Units, units_map
+from mepcalc.common.units import Units, unit_conversion, units_map
 
 
 class FluidPropertyWidget(QWidget):
@@ -167,10 +167,12 @@ class FluidPropertyWidget(QWidget):
         density_unit = self.combo_density_unit.currentText()
         # read the values from internal storage (combo box data)
         current_medium = self.combo_fluid_type.currentData()
-        heat_capacity = current_medium.heat_capacity
-        heat_capacity_value = heat_capacity.to(heat_capacity_unit).magnitude
-        density = current_medium.density
-        density_value = density.to(density_unit).magnitude
+        heat_capacity_value = unit_conversion(
+            Units.HeatCapacity, heat_capacity_unit
+        ).magnitude(current_medium.heat_capacity)
+        density_value = unit_conversion(Units.Density, density_unit).magnitude(
+            current_medium.density
+        )
         # write the values to the widgets
         self.edit_heat_capacity_magnitude.setText(str(heat_capacity_value))
         self.edit_density_magnitude.setText(str(density_value))
@@ -186,14 +188,12 @@ class FluidPropertyWidget(QWidget):
     @Slot()
     def custom_fluid_properties_changed(self):
         """Change fluid parameter magnitude slot."""
-        self.combo_fluid_type.currentData().heat_capacity = Quantity(
-            float(self.edit_heat_capacity_magnitude.text() or 0),
-            self.combo_heat_capacity_unit.currentText(),
-        )
-        self.combo_fluid_type.currentData().density = Quantity(
-            float(self.edit_density_magnitude.text() or 0),
-            self.combo_density_unit.currentText(),
-        )
+        self.combo_fluid_type.currentData().heat_capacity = unit_conversion(
+            Units.HeatCapacity, self.combo_heat_capacity_unit.currentText()
+        ).quantity(float(self.edit_heat_capacity_magnitude.text() or 0))
+        self.combo_fluid_type.currentData().density = unit_conversion(
+            Units.Density, self.combo_density_unit.currentText()
+        ).quantity(float(self.edit_density_magnitude.text() or 0))
         self.calculate_volumetric_heat_capacity()
 
     @Slot()
@@ -241,19 +241,17 @@ class FluidPropertyWidget(QWidget):
 
         C = cp * rho.
         """
-        heat_capacity = Quantity(
-            float(self.edit_heat_capacity_magnitude.text() or 0),
-            self.combo_heat_capacity_unit.currentText(),
-        )
-        density = Quantity(
-            float(self.edit_density_magnitude.text() or 0),
-            self.combo_density_unit.currentText(),
-        )
-        vol_heat_cap = heat_capacity * density
-        vol_heat_cap_unit = self.combo_vol_heat_cap_unit.currentText()
-        self.edit_vol_heat_cap_magnitude.setText(
-            str(vol_heat_cap.to(vol_heat_cap_unit).magnitude)
-        )
+        # SI magnitudes, C in J/(m³ K) = cp in J/(kg K) * rho in kg/m³
+        heat_capacity = unit_conversion(
+            Units.HeatCapacity, self.combo_heat_capacity_unit.currentText()
+        ).to_si(float(self.edit_heat_capacity_magnitude.text() or 0))
+        density = unit_conversion(
+            Units.Density, self.combo_density_unit.currentText()
+        ).to_si(float(self.edit_density_magnitude.text() or 0))
+        vol_heat_cap = unit_conversion(
+            Units.VolumetricHeatCapacity, self.combo_vol_heat_cap_unit.currentText()
+        ).from_si(heat_capacity * density)
+        self.edit_vol_heat_cap_magnitude.setText(str(vol_heat_cap))
 
 
 def main():
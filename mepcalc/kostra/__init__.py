@@ -0,0 +1,6 @@
+"""DWD KOSTRA-DWD-2010R rainfall data.
+
+Precipitation depths hN for 18 durations and 9 return periods on a raster of
+79 x 107 cells covering Germany, converted once from the CSV files in the
+repository's kostra directory into a memory-mappable binary store.
+"""
@@ -0,0 +1,140 @@
+"""KOSTRA design rain of sites.
+
+Looks up the design rain, i.e. the precipitation depth hN or rain intensity r
+of a duration and return period, for whole arrays of sites given by their
+coordinates, e.g. r(5 min, 5 a) and r(15 min, 100 a) of a project portfolio,
+one row per site and one column per duration:
+
+    design_rain = DesignRain.load()
+    r = design_rain.intensity(
+        latitudes[:, None], longitudes[:, None], [5, 15], [5, 100]
+    )
+
+The sites are resolved to raster cells with the RasterIndex and the values are
+gathered from the memory-mapped store tables with a single fancy indexing
+operation, so no Python code runs per site. Durations and return periods must
+be tabulated, see DepthInterpolator for others.
+"""
+
+from typing import Optional, Union
+
+import numpy
+from numpy.typing import ArrayLike
+from pint import Unit
+
+from mepcalc.kostra.raster import RasterIndex
+from mepcalc.kostra.store import (
+    DEPTH_UNIT,
+    INTENSITY_UNIT,
+    NO_DATA,
+    KostraStore,
+    broadcast_shape,
+    in_unit,
+    load_store,
+)
+
+
+class DesignRain:
+    """Design rain of sites given by their coordinates."""
+
+    def __init__(self, store: KostraStore, index: Optional[RasterIndex] = None):
+        """Initializer.
+
+        index: raster index of the store's cells with corners (default: built
+            from the store)
+        """
+        self.store = store
+        self.index = RasterIndex.from_store(store) if index is None else index
+        # slots of all cell positions and NO_DATA for NO_CELL (position -1)
+        self.slots = numpy.append(store.slots, NO_DATA)
+
+    @classmethod
+    def load(cls) -> "DesignRain":
+        """Design rain of the default KOSTRA store."""
+        return cls(load_store())
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """String representation."""
+        return f"{self.__class__.__name__}(store={self.store!r})"
+
+    def slot(
+        self, latitude: ArrayLike, longitude: ArrayLike
+    ) -> Union[int, numpy.ndarray]:
+        """Store rows of the cells containing coordinates in °, NO_DATA for
+        sites outside the raster or in cells without data."""
+        positions = self.index.containing_position(latitude, longitude)
+        slots = self.slots[positions].reshape(numpy.shape(latitude))
+        return int(slots) if slots.ndim == 0 else slots
+
+    def depth(
+        self,
+        latitude: ArrayLike,
+        longitude: ArrayLike,
+        duration: ArrayLike,
+        return_period: ArrayLike,
+        unit: Union[Unit, str, None] = None,
+    ) -> Union[float, numpy.ndarray]:
+        """Precipitation depths hN of sites, durations in min and return
+        periods in a.
+
+        In unit (default: mm), NaN for sites without data. The coordinates
+        in ° broadcast against the durations and return periods, e.g.
+        coordinates of shape (n, 1) and durations of shape (k,) give the
+        depths of every site and duration, shape (n, k). Raises ValueError
+        for arguments that do not broadcast.
+        """
+        return self._lookup(
+            self.store.hn,
+            DEPTH_UNIT,
+            latitude,
+            longitude,
+            duration,
+            return_period,
+            unit,
+        )
+
+    def intensity(
+        self,
+        latitude: ArrayLike,
+        longitude: ArrayLike,
+        duration: ArrayLike,
+        return_period: ArrayLike,
+        unit: Union[Unit, str, None] = None,
+    ) -> Union[float, numpy.ndarray]:
+        """Rain intensities r of sites, durations in min and return periods
+        in a.
+
+        In unit (default: l/(s·ha)), NaN for sites without data. Broadcasts
+        like depth.
+        """
+        return self._lookup(
+            self.store.rn,
+            INTENSITY_UNIT,
+            latitude,
+            longitude,
+            duration,
+            return_period,
+            unit,
+        )
+
+    def _lookup(
+        self,
+        table: numpy.ndarray,
+        base_unit: str,
+        latitude: ArrayLike,
+        longitude: ArrayLike,
+        duration: ArrayLike,
+        return_period: ArrayLike,
+        unit: Union[Unit, str, None],
+    ) -> Union[float, numpy.ndarray]:
+        """Values of a store table of sites in unit."""
+        # fail before resolving the sites to cells
+        broadcast_shape(
+            latitude=latitude,
+            longitude=longitude,
+            duration=duration,
+            return_period=return_period,
+        )
+        slots = self.slot(latitude, longitude)
+        values = self.store.gather(table, slots, duration, return_period)
+        return in_unit(values, base_unit, unit)
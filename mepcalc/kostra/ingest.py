@@ -0,0 +1,205 @@
+"""KOSTRA ingest of the original DWD files.
+
+Converts the original KOSTRA-DWD-2010R files in kostra/original straight into
+the binary store, without the intermediate cleaned CSV files:
+
+    python -m mepcalc.kostra.ingest [ORIGINAL_DIRECTORY] [STORE_DIRECTORY]
+
+The original files use ";" as separator and "," as decimal mark. They are read
+in buffered chunks of lines, so that only one chunk per file is held in memory,
+and the depth files of all durations are converted in parallel processes,
+which write their depths directly into a memory-mapped file of the depths of
+all cells in the store directory, with NaN for missing depths (-99.9). The
+depths of the cells with data are then copied into the store's hn.npy file.
+"""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+import numpy
+from numpy.lib.format import open_memmap
+
+from mepcalc.kostra.store import (
+    CELLS,
+    COLUMNS,
+    DATA_DIRECTORY,
+    DURATIONS,
+    INDEX_RC_ROW_FACTOR,
+    MISSING_DEPTH,
+    RASTER_CENTER_COLUMNS,
+    RASTER_CORNER_COLUMNS,
+    RETURN_PERIODS,
+    STORE_DIRECTORY,
+    cell_position,
+    save_store,
+)
+
+ORIGINAL_DIRECTORY = DATA_DIRECTORY / "original"
+ORIGINAL_RASTER_FILE_NAME = "Raster_geog_Bezug.csv"
+
+DEFAULT_CHUNK_BYTES = 1 << 20
+
+# depths of all cell positions, written by the workers
+ALL_DEPTHS_FILE_NAME = "hn_all.npy"
+
+DEPTH_HEADER = ["index_rc"] + [f"hn_{period:03d}a" for period in RETURN_PERIODS]
+
+
+def original_file_name(duration: int) -> str:
+    """File name of the original KOSTRA file for a duration in min."""
+    return f"StatRR_KOSTRA-DWD-2010R_D{duration:04d}.csv"
+
+
+def read_header(path: Path) -> List[str]:
+    """Lower case column names of an original KOSTRA file."""
+    with open(path) as file:
+        return file.readline().strip().lower().split(";")
+
+
+def read_chunks(
+    path: Path, usecols: Sequence[int], chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> Iterator[numpy.ndarray]:
+    """Read columns of an original KOSTRA file in chunks of about chunk_bytes.
+
+    Yields float arrays of shape (lines, columns).
+    """
+    with open(path) as file:
+        file.readline()  # header
+        while True:
+            lines = file.readlines(chunk_bytes)
+            if not lines:
+                break
+            text = "".join(lines).replace(",", ".")
+            yield numpy.loadtxt(
+                text.splitlines(), delimiter=";", usecols=usecols, ndmin=2
+            )
+
+
+def ingest_depths(
+    path: Path,
+    hn_path: Path,
+    duration_index: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> None:
+    """Write the depths of one original duration file into the depths file."""
+    header = read_header(path)
+    if header != DEPTH_HEADER:
+        raise ValueError(f"Unexpected columns in {path.name}: {';'.join(header)}")
+    hn = open_memmap(hn_path, mode="r+")
+    given = numpy.zeros(CELLS, dtype=bool)
+    for chunk in read_chunks(path, range(len(DEPTH_HEADER)), chunk_bytes):
+        try:
+            positions = cell_position(chunk[:, 0].astype(numpy.int64))
+        except ValueError as error:
+            raise ValueError(f"{error} in {path.name}") from None
+        depths = chunk[:, 1:]
+        depths[depths == MISSING_DEPTH] = numpy.nan
+        hn[positions, duration_index, :] = depths
+        given[positions] = True
+    hn.flush()
+    if not given.all():
+        raise ValueError(f"{numpy.count_nonzero(~given)} cells missing in {path.name}")
+
+
+def ingest_raster(
+    path: Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> Sequence[numpy.ndarray]:
+    """Read cell indices, centers and corners of the original raster file."""
+    usecols = (0, *RASTER_CENTER_COLUMNS, *RASTER_CORNER_COLUMNS)
+    raster = numpy.concatenate(list(read_chunks(path, usecols, chunk_bytes)))
+    index_rc = raster[:, 0].astype(numpy.int64)
+    positions = numpy.arange(CELLS)
+    expected = positions // COLUMNS * INDEX_RC_ROW_FACTOR + positions % COLUMNS
+    if not numpy.array_equal(index_rc, expected):
+        raise ValueError("Raster cells are not in row-major raster order")
+    return index_rc, raster[:, 1:3], raster[:, 3:].reshape(-1, 4, 2)
+
+
+def ingest(
+    original_directory: Path = ORIGINAL_DIRECTORY,
+    store_directory: Path = STORE_DIRECTORY,
+    workers: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> None:
+    """Convert the original KOSTRA files into the binary store.
+
+    The durations are converted by up to workers processes (default: one per
+    CPU).
+    """
+    store_directory.mkdir(parents=True, exist_ok=True)
+    hn_path = store_directory / ALL_DEPTHS_FILE_NAME
+    shape = (CELLS, len(DURATIONS), len(RETURN_PERIODS))
+    open_memmap(hn_path, mode="w+", dtype=numpy.float32, shape=shape).flush()
+    try:
+        sources = [original_directory / original_file_name(d) for d in DURATIONS]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(ingest_depths, source, hn_path, index, chunk_bytes)
+                for index, source in enumerate(sources)
+            ]
+            for future in futures:
+                future.result()
+        raster = ingest_raster(
+            original_directory / ORIGINAL_RASTER_FILE_NAME, chunk_bytes
+        )
+        save_store(store_directory, numpy.load(hn_path, mmap_mode="r"), *raster)
+    finally:
+        hn_path.unlink()
+
+
+def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="python -m mepcalc.kostra.ingest",
+        description="Convert the original KOSTRA files into the binary store.",
+    )
+    parser.add_argument(
+        "original_directory",
+        nargs="?",
+        type=Path,
+        default=ORIGINAL_DIRECTORY,
+        help="directory of the original files (default: %(default)s)",
+    )
+    parser.add_argument(
+        "store_directory",
+        nargs="?",
+        type=Path,
+        default=STORE_DIRECTORY,
+        help="store directory (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        help="number of worker processes (default: one per CPU)",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-bytes",
+        type=int,
+        default=DEFAULT_CHUNK_BYTES,
+        help="approximate bytes read per chunk (default: %(default)s)",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: Optional[List[str]] = None):
+    """Main program."""
+    arguments = parse_args(args)
+    try:
+        ingest(
+            arguments.original_directory,
+            arguments.store_directory,
+            workers=arguments.workers,
+            chunk_bytes=arguments.chunk_bytes,
+        )
+    except (OSError, ValueError) as error:
+        sys.exit(f"error: {error}")
+    print(f"Store written to {arguments.store_directory}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""KOSTRA precipitation depth interpolation.
+
+The KOSTRA tables give the precipitation depths hN at 18 durations and 9 return
+periods only. Following the DWD documentation of KOSTRA-DWD-2010R, the depths
+of one duration D grow linearly with the logarithm of the return period T:
+    hN(D, T) = u(D) + w(D) * ln(T)
+so between the tabulated return periods the depths are interpolated linearly
+over ln T, and between the tabulated durations linearly on double logarithmic
+scales (ln hN over ln D). The interpolation passes through the tabulated
+depths, so at tabulated durations and return periods it gives the depths of
+the store.
+
+A query reduces to a few float operations on the depths of the tabulated
+durations and return periods around it. All arguments broadcast against each
+other, so whole arrays of cells, durations and return periods are interpolated
+at once.
+
+Rain intensities r follow from the interpolated depths as r = hN / D.
+"""
+
+from typing import Union
+
+import numpy
+from numpy.typing import ArrayLike
+from pint import Unit
+
+from mepcalc.kostra.store import (
+    DEPTH_UNIT,
+    INTENSITY_UNIT,
+    KostraStore,
+    in_unit,
+    intensity,
+)
+
+
+class DepthInterpolator:
+    """Precipitation depths hN for any duration and return period."""
+
+    def __init__(self, store: KostraStore) -> None:
+        """Initializer."""
+        self.durations = numpy.asarray(store.durations, dtype=float)
+        self.return_periods = numpy.asarray(store.return_periods, dtype=float)
+        self.log_durations = numpy.log(self.durations)
+        self.log_periods = numpy.log(self.return_periods)
+        self.store = store
+        # cells with data and a NaN cell for NO_DATA (slot -1)
+        nan_cell = numpy.full((1, *store.hn.shape[1:]), numpy.nan)
+        self.hn = numpy.concatenate((store.hn, nan_cell))
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """String representation."""
+        return f"{self.__class__.__name__}(cells={len(self.hn) - 1})"
+
+    def depth(
+        self,
+        index_rc: ArrayLike,
+        duration: ArrayLike,
+        return_period: ArrayLike,
+        unit: Union[Unit, str, None] = None,
+    ) -> Union[float, numpy.ndarray]:
+        """Precipitation depth hN of cells, durations in min and return periods
+        in a.
+
+        In unit (default: mm). Arguments broadcast against each other. Cells
+        without data give NaN.
+        """
+        return in_unit(self._depth(index_rc, duration, return_period), DEPTH_UNIT, unit)
+
+    def intensity(
+        self,
+        index_rc: ArrayLike,
+        duration: ArrayLike,
+        return_period: ArrayLike,
+        unit: Union[Unit, str, None] = None,
+    ) -> Union[float, numpy.ndarray]:
+        """Rain intensity r of cells, durations in min and return periods in a.
+
+        In unit (default: l/(s·ha)). Arguments broadcast against each other.
+        Cells without data give NaN.
+        """
+        result = intensity(self._depth(index_rc, duration, return_period), duration)
+        return in_unit(result, INTENSITY_UNIT, unit)
+
+    def _depth(
+        self, index_rc: ArrayLike, duration: ArrayLike, return_period: ArrayLike
+    ) -> numpy.ndarray:
+        """Precipitation depths hN in mm, NaN for NO_CELL and cells without
+        data, which both look up the NaN cell."""
+        duration = numpy.asarray(duration, dtype=float)
+        return_period = numpy.asarray(return_period, dtype=float)
+        self._check_range(duration, self.durations, "duration", "min")
+        self._check_range(return_period, self.return_periods, "return period", "a")
+        slot = self.store.slot(index_rc)
+        lower, fraction = self._segment(self.log_durations, numpy.log(duration))
+        period, period_fraction = self._segment(
+            self.log_periods, numpy.log(return_period)
+        )
+
+        def depth(duration_index):
+            """Depths at a tabulated duration, linear over ln T."""
+            lower_depth = self.hn[slot, duration_index, period]
+            upper_depth = self.hn[slot, duration_index, period + 1]
+            return lower_depth + (upper_depth - lower_depth) * period_fraction
+
+        lower_depth, upper_depth = depth(lower), depth(lower + 1)
+        return lower_depth * (upper_depth / lower_depth) ** fraction
+
+    @staticmethod
+    def _segment(tabulated: numpy.ndarray, values: numpy.ndarray):
+        """Index of the tabulated interval of values, and their fraction of
+        the interval (0 at its lower, 1 at its upper end)."""
+        lower = numpy.searchsorted(tabulated, values, side="right") - 1
+        lower = numpy.clip(lower, 0, len(tabulated) - 2)
+        fraction = (values - tabulated[lower]) / (
+            tabulated[lower + 1] - tabulated[lower]
+        )
+        return lower, fraction
+
+    @staticmethod
+    def _check_range(
+        values: numpy.ndarray, tabulated: numpy.ndarray, name: str, unit: str
+    ) -> None:
+        """Check that values lie within the tabulated range."""
+        if numpy.any(values < tabulated[0]) or numpy.any(values > tabulated[-1]):
+            raise ValueError(
+                f"The {name} must be between {tabulated[0]:g} {unit} "
+                f"and {tabulated[-1]:g} {unit}"
+            )
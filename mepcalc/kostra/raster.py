@@ -0,0 +1,231 @@
+"""KOSTRA raster cell lookup.
+
+Finds the KOSTRA cell (index_rc) for geographic coordinates using a grid hash
+over the cell centers: the centers are bucketed into square bins at least as
+large as a raster cell, so the nearest center of any point on the raster lies
+in the point's bin or one of its eight neighbours. A lookup then compares the
+distances to only a handful of candidate centers, independent of the number of
+cells, and whole batches of coordinates are resolved with array operations.
+
+Distances are measured in a local equirectangular projection, i.e. longitude
+differences are scaled by the cosine of the raster's mean latitude.
+
+The nearest center is not necessarily the center of the cell containing a
+point near a cell border. With the cell corners given, the exact cell is
+resolved by a point-in-quadrilateral test against the same candidates, since
+the center of the containing cell is always among them.
+"""
+
+import math
+from typing import Optional, Tuple, Union
+
+import numpy
+from numpy.typing import ArrayLike
+
+from mepcalc.kostra.store import NO_CELL, KostraStore
+
+# offsets of a bin and its eight neighbours
+NEIGHBOURS = numpy.array([(i, j) for i in (-1, 0, 1) for j in (-1, 0, 1)])
+
+
+class RasterIndex:
+    """Grid hash over the KOSTRA cell centers for nearest cell lookups."""
+
+    def __init__(
+        self,
+        centers: ArrayLike,
+        index_rc: ArrayLike,
+        corners: Optional[ArrayLike] = None,
+    ) -> None:
+        """Initializer.
+
+        centers: cell center coordinates (longitude, latitude) in °
+        index_rc: KOSTRA cell index of each cell
+        corners: optional cell corner coordinates (longitude, latitude) in °,
+            shape (cells, 4, 2), in order around the cell
+        """
+        centers = numpy.asarray(centers, dtype=float)
+        self.index_rc = numpy.asarray(index_rc)
+        self.longitude_scale = math.cos(math.radians(centers[:, 1].mean()))
+        self.points = self.project(centers[:, 1], centers[:, 0])
+        # bins as large as the typical distance between neighbouring centers,
+        # which exceeds the distance of any raster point to its nearest center
+        spacing = numpy.abs(numpy.diff(self.points, axis=0)).max(axis=1)
+        self.bin_size = float(numpy.median(spacing))
+        # one empty border bin on each side
+        self.origin = self.points.min(axis=0) - self.bin_size
+        self.bins_shape = tuple(
+            (numpy.ceil((self.points.max(axis=0) - self.origin) / self.bin_size) + 2)
+            .astype(int)
+            .tolist()
+        )
+        self.candidate_table = self._build_candidate_table()
+        # center coordinates with a point at infinity for NO_CELL (index -1)
+        self.x = numpy.append(self.points[:, 0], numpy.inf)
+        self.y = numpy.append(self.points[:, 1], numpy.inf)
+        self.corners = None
+        if corners is not None:
+            corners = numpy.asarray(corners, dtype=float)
+            projected = self.project(corners[..., 1], corners[..., 0])
+            # corners with a NaN cell for NO_CELL (index -1), which contains nothing
+            self.corners = numpy.concatenate(
+                (projected, numpy.full((1, 4, 2), numpy.nan))
+            )
+
+    @classmethod
+    def from_store(cls, store: KostraStore) -> "RasterIndex":
+        """Create index of the cells in a KOSTRA store."""
+        return cls(store.centers, store.index_rc, store.corners)
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """String representation."""
+        return (
+            f"{self.__class__.__name__}("
+            f"cells={len(self.index_rc)}, bins={self.bins_shape})"
+        )
+
+    def project(self, latitude: ArrayLike, longitude: ArrayLike) -> numpy.ndarray:
+        """Project coordinates in ° to the index' planar (x, y) coordinates."""
+        latitude = numpy.asarray(latitude, dtype=float)
+        longitude = numpy.asarray(longitude, dtype=float)
+        return numpy.stack((longitude * self.longitude_scale, latitude), axis=-1)
+
+    def _bin(self, points: numpy.ndarray) -> numpy.ndarray:
+        """Bin coordinates (i, j) of projected points."""
+        return numpy.floor((points - self.origin) / self.bin_size).astype(int)
+
+    def _flat_bin(self, bins: numpy.ndarray) -> numpy.ndarray:
+        """Flat bin numbers of bin coordinates."""
+        return bins[..., 0] * self.bins_shape[1] + bins[..., 1]
+
+    def _build_candidate_table(self) -> numpy.ndarray:
+        """Positions of the cells in every bin and its neighbour bins.
+
+        Returns an array of shape (bins, k), padded with NO_CELL, so that the
+        candidates of a point are a single row lookup.
+        """
+        bins = self._flat_bin(self._bin(self.points))
+        order = numpy.argsort(bins, kind="stable")
+        counts = numpy.bincount(bins, minlength=numpy.prod(self.bins_shape))
+        starts = numpy.concatenate(([0], numpy.cumsum(counts)))
+        # all bin coordinates, except the empty border, and their neighbours
+        i, j = numpy.meshgrid(
+            numpy.arange(1, self.bins_shape[0] - 1),
+            numpy.arange(1, self.bins_shape[1] - 1),
+            indexing="ij",
+        )
+        centers = numpy.stack((i.ravel(), j.ravel()), axis=-1)
+        neighbours = self._flat_bin(centers[:, None, :] + NEIGHBOURS[None, :, :])
+        slots = starts[neighbours][..., None] + numpy.arange(counts.max())
+        valid = slots < starts[neighbours + 1][..., None]
+        positions = numpy.where(valid, order[numpy.where(valid, slots, 0)], NO_CELL)
+        positions = positions.reshape(len(centers), -1)
+        # move valid positions to the front and drop all padding columns
+        positions = -numpy.sort(-positions, axis=1)
+        width = max(int((positions != NO_CELL).sum(axis=1).max()), 1)
+        table = numpy.full((numpy.prod(self.bins_shape), width), NO_CELL)
+        table[self._flat_bin(centers)] = positions[:, :width]
+        return table
+
+    def candidates(
+        self, latitude: ArrayLike, longitude: ArrayLike
+    ) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """Candidate cell positions around coordinates.
+
+        Returns the projected query points, shape (n, 2), and the positions of
+        the cells in the query's bin and its neighbour bins, shape (n, k),
+        padded with NO_CELL. Points beyond the bins are clamped to the border
+        bins, whose candidates are all further away than one bin size.
+        """
+        points = self.project(numpy.ravel(latitude), numpy.ravel(longitude))
+        bins = numpy.clip(self._bin(points), 1, numpy.subtract(self.bins_shape, 2))
+        return points, self.candidate_table[self._flat_bin(bins)]
+
+    def nearest_position(
+        self, latitude: ArrayLike, longitude: ArrayLike
+    ) -> numpy.ndarray:
+        """Positions of the cells with the nearest centers, NO_CELL if none.
+
+        All centers within one bin size of a point are among its candidates,
+        so a nearest candidate within that distance is the nearest center.
+        """
+        points, positions = self.candidates(latitude, longitude)
+        return self._nearest_candidate(points, positions)
+
+    def _nearest_candidate(
+        self, points: numpy.ndarray, positions: numpy.ndarray
+    ) -> numpy.ndarray:
+        """Nearest of the candidate positions within one bin size, or NO_CELL."""
+        dx = self.x[positions] - points[:, 0:1]
+        dy = self.y[positions] - points[:, 1:2]
+        distances = dx * dx + dy * dy
+        nearest = numpy.argmin(distances, axis=1)
+        rows = numpy.arange(len(points))
+        return numpy.where(
+            distances[rows, nearest] <= self.bin_size**2,
+            positions[rows, nearest],
+            NO_CELL,
+        )
+
+    def nearest(
+        self, latitude: ArrayLike, longitude: ArrayLike
+    ) -> Union[int, numpy.ndarray]:
+        """KOSTRA cell indices (index_rc) of the cells with the nearest centers.
+
+        Accepts single coordinates or arrays of coordinates in °. Coordinates
+        further than one cell spacing from any cell center give NO_CELL.
+        """
+        return self._index_rc(self.nearest_position(latitude, longitude), latitude)
+
+    def _index_rc(
+        self, positions: numpy.ndarray, latitude: ArrayLike
+    ) -> Union[int, numpy.ndarray]:
+        """KOSTRA cell indices of positions, shaped like the query."""
+        index_rc = numpy.where(positions == NO_CELL, NO_CELL, self.index_rc[positions])
+        if numpy.ndim(latitude) == 0:
+            return int(index_rc[0])
+        return index_rc.reshape(numpy.shape(latitude))
+
+    def containing_position(
+        self, latitude: ArrayLike, longitude: ArrayLike
+    ) -> numpy.ndarray:
+        """Positions of the cells containing coordinates, NO_CELL if none.
+
+        Points on a border shared by two cells resolve to either cell.
+        """
+        if self.corners is None:
+            raise ValueError("Index has no cell corners")
+        points, positions = self.candidates(latitude, longitude)
+        # most points lie in the cell with the nearest center, test that first
+        result = self._nearest_candidate(points, positions)
+        inside = self._inside(points, result[:, None])[:, 0]
+        result[~inside] = NO_CELL
+        rest = numpy.flatnonzero(~inside)
+        if rest.size:
+            inside = self._inside(points[rest], positions[rest])
+            first = numpy.argmax(inside, axis=1)
+            result[rest] = numpy.where(
+                inside.any(axis=1),
+                positions[rest, first],
+                NO_CELL,
+            )
+        return result
+
+    def _inside(self, points: numpy.ndarray, positions: numpy.ndarray) -> numpy.ndarray:
+        """Check which cells at positions, shape (n, k), contain the n points."""
+        corners = self.corners[positions]  # (n, k, 4, 2)
+        edges = numpy.roll(corners, -1, axis=2) - corners
+        offsets = points[:, None, None, :] - corners
+        cross = edges[..., 0] * offsets[..., 1] - edges[..., 1] * offsets[..., 0]
+        # inside a convex cell, a point is on the same side of all edges
+        return numpy.all(cross >= 0, axis=-1) | numpy.all(cross <= 0, axis=-1)
+
+    def containing(
+        self, latitude: ArrayLike, longitude: ArrayLike
+    ) -> Union[int, numpy.ndarray]:
+        """KOSTRA cell indices (index_rc) of the cells containing coordinates.
+
+        Accepts single coordinates or arrays of coordinates in °. Coordinates
+        outside the raster give NO_CELL.
+        """
+        return self._index_rc(self.containing_position(latitude, longitude), latitude)
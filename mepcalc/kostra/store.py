@@ -0,0 +1,442 @@
+"""KOSTRA binary store.
+
+The cleaned KOSTRA CSV files (kostra/dNNNN.csv, one per duration) are converted
+once into a columnar binary store of numpy arrays, which are memory-mapped on
+loading, so that loading takes milliseconds and lookups never parse text:
+    hn.npy:             precipitation depths in mm of the cells with data only,
+                        float32, shape (data cells, durations, return periods)
+    rn.npy:             rain intensities in l/(s·ha), same layout as hn.npy
+    slots.npy:          row in hn.npy and rn.npy for every cell position,
+                        NO_DATA for cells without data
+    index_rc.npy:       KOSTRA cell index for every cell position
+    centers.npy:        cell center coordinates (longitude, latitude) in °,
+                        shape (cells, 2)
+    corners.npy:        cell corner coordinates (longitude, latitude) in °,
+                        in order NW, SW, SE, NE, shape (cells, 4, 2)
+    durations.npy:      durations in min
+    return_periods.npy: return periods in a
+    metadata.json:      store format version, written last
+
+Cells are stored in row-major raster order, the KOSTRA cell index is
+index_rc = row * 1000 + col, so the cell position is row * COLUMNS + col.
+Lookups of NO_CELL (e.g. of sites outside the raster) give no data, other
+cell indices outside the raster raise ValueError.
+
+About a third of the raster lies outside Germany and has no data (-99.9 in the
+KOSTRA files). These cells are left out of hn.npy, so that aggregates over
+all cells, e.g. maxima or quantiles, run on the depths array as it is.
+
+Stores of another format version (e.g. with -99.9 instead of NaN for missing
+depths) are rebuilt, like stores older than the CSV files.
+
+Depths and intensities are looked up in mm and l/(s·ha) by default, or in any
+other unit of the mepcalc registry.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy
+from numpy.typing import ArrayLike
+from pint import Quantity, Unit
+
+from mepcalc import ureg
+from mepcalc.common.units import check_dimensionality
+
+DATA_DIRECTORY = Path(__file__).resolve().parents[2] / "kostra"
+STORE_DIRECTORY = DATA_DIRECTORY / "store"
+
+COLUMNS = 79
+ROWS = 107
+CELLS = COLUMNS * ROWS
+INDEX_RC_ROW_FACTOR = 1000
+
+DURATIONS = (
+    5,
+    10,
+    15,
+    20,
+    30,
+    45,
+    60,
+    90,
+    120,
+    180,
+    240,
+    360,
+    540,
+    720,
+    1080,
+    1440,
+    2880,
+    4320,
+)
+RETURN_PERIODS = (1, 2, 3, 5, 10, 20, 30, 50, 100)
+
+# depth of cells without data in the KOSTRA files
+MISSING_DEPTH = -99.9
+
+# slot of cells without data
+NO_DATA = -1
+
+# cell index of no cell, e.g. of sites outside the raster
+NO_CELL = -1
+
+DEPTH_UNIT = "mm"
+INTENSITY_UNIT = "l/(s*ha)"
+# r = hN * 10000 / (60 * D): hN in mm over 1 ha is hN * 10 m³, D in min
+INTENSITY_FACTOR = 10000 / 60
+
+RASTER_FILE_NAME = "raster.csv"
+RASTER_CENTER_COLUMNS = (4, 5)  # x_cent_geo, y_cent_geo
+RASTER_CORNER_COLUMNS = tuple(range(6, 14))  # x1_nw_geo, y1_nw_geo, ..., y4_ne_geo
+
+# version of the store layout, increase on every incompatible change
+STORE_FORMAT_VERSION = 1
+METADATA_FILE_NAME = "metadata.json"
+
+STORE_FILES = (
+    "hn.npy",
+    "rn.npy",
+    "slots.npy",
+    "index_rc.npy",
+    "centers.npy",
+    "corners.npy",
+    "durations.npy",
+    "return_periods.npy",
+    METADATA_FILE_NAME,
+)
+
+
+def duration_file_name(duration: int) -> str:
+    """File name of the cleaned CSV file for a duration in min."""
+    return f"d{duration:04d}.csv"
+
+
+def cell_position(index_rc: ArrayLike) -> Union[int, numpy.ndarray]:
+    """Convert KOSTRA cell indices (index_rc) to cell positions in the store.
+
+    Raises ValueError for cell indices outside the raster, NO_CELL included.
+    """
+    index_rc = numpy.asarray(index_rc)
+    row, col = numpy.divmod(index_rc, INDEX_RC_ROW_FACTOR)
+    outside = (row < 0) | (row >= ROWS) | (col >= COLUMNS)
+    if numpy.any(outside):
+        raise ValueError(
+            f"Cell indices outside the raster: {numpy.unique(index_rc[outside])}"
+        )
+    position = row * COLUMNS + col
+    return int(position) if position.ndim == 0 else position
+
+
+def intensity(hn: ArrayLike, duration: ArrayLike) -> numpy.ndarray:
+    """Rain intensities r in l/(s·ha) of depths hN in mm and durations in min."""
+    return numpy.asarray(hn) * INTENSITY_FACTOR / numpy.asarray(duration)
+
+
+@lru_cache(maxsize=None)
+def unit_scale(unit: Union[Unit, str], base_unit: str) -> float:
+    """Factor converting magnitudes in base_unit to unit (cached)."""
+    unit = ureg.Unit(unit)
+    base = Quantity(1.0, ureg.Unit(base_unit))
+    check_dimensionality(base, unit)
+    return base.to(unit).magnitude
+
+
+def broadcast_shape(**arguments: ArrayLike) -> Tuple[int, ...]:
+    """Shape the arguments broadcast to.
+
+    Raises ValueError naming the shapes of arguments that do not broadcast.
+    """
+    shapes = {name: numpy.shape(value) for name, value in arguments.items()}
+    try:
+        return numpy.broadcast_shapes(*shapes.values())
+    except ValueError:
+        described = ", ".join(f"{name} {shape}" for name, shape in shapes.items())
+        raise ValueError(f"Shapes do not broadcast: {described}") from None
+
+
+def in_unit(
+    values: numpy.ndarray, base_unit: str, unit: Union[Unit, str, None]
+) -> Union[float, numpy.ndarray]:
+    """Convert values from base_unit to unit, floats for scalar values."""
+    if unit is not None:
+        values = values * unit_scale(unit, base_unit)
+    return float(values) if numpy.ndim(values) == 0 else values
+
+
+def build_store(
+    data_directory: Path = DATA_DIRECTORY, store_directory: Path = STORE_DIRECTORY
+) -> None:
+    """Convert the cleaned KOSTRA CSV files into the binary store."""
+    hn = numpy.empty((CELLS, len(DURATIONS), len(RETURN_PERIODS)), dtype=numpy.float32)
+    index_rc = None
+    for duration_index, duration in enumerate(DURATIONS):
+        table = numpy.loadtxt(
+            data_directory / duration_file_name(duration), delimiter=",", skiprows=1
+        )
+        indices = table[:, 0].astype(numpy.int64)
+        if index_rc is None:
+            index_rc = indices
+        elif not numpy.array_equal(indices, index_rc):
+            raise ValueError(f"Cell indices differ for duration {duration} min")
+        depths = table[:, 1:]
+        depths[depths == MISSING_DEPTH] = numpy.nan
+        hn[cell_position(indices), duration_index, :] = depths
+    if not numpy.array_equal(cell_position(index_rc), numpy.arange(CELLS)):
+        raise ValueError("Cells are not in row-major raster order")
+    raster = numpy.loadtxt(
+        data_directory / RASTER_FILE_NAME,
+        delimiter=",",
+        skiprows=1,
+        usecols=(0, *RASTER_CENTER_COLUMNS, *RASTER_CORNER_COLUMNS),
+    )
+    if not numpy.array_equal(raster[:, 0], index_rc):
+        raise ValueError("Raster cell indices differ from the depth tables")
+    centers = raster[:, 1:3]
+    corners = raster[:, 3:].reshape(-1, 4, 2)
+    save_store(store_directory, hn, index_rc, centers, corners)
+
+
+def save_store(
+    store_directory: Path,
+    hn: numpy.ndarray,
+    index_rc: numpy.ndarray,
+    centers: numpy.ndarray,
+    corners: numpy.ndarray,
+) -> None:
+    """Write the store arrays to the store directory.
+
+    hn: depths of all cell positions, NaN for missing depths
+    """
+    store_directory.mkdir(parents=True, exist_ok=True)
+    # only cells with all depths given have data
+    valid = ~numpy.isnan(hn).any(axis=(1, 2))
+    slots = numpy.full(len(hn), NO_DATA)
+    slots[valid] = numpy.arange(numpy.count_nonzero(valid))
+    hn = numpy.asarray(hn[valid], dtype=numpy.float64)
+    rn = intensity(hn, numpy.array(DURATIONS)[:, None])
+    numpy.save(store_directory / "hn.npy", hn.astype(numpy.float32))
+    numpy.save(store_directory / "rn.npy", rn.astype(numpy.float32))
+    numpy.save(store_directory / "slots.npy", slots.astype(numpy.int32))
+    numpy.save(store_directory / "index_rc.npy", index_rc.astype(numpy.int32))
+    numpy.save(store_directory / "centers.npy", centers.astype(numpy.float64))
+    numpy.save(store_directory / "corners.npy", corners.astype(numpy.float64))
+    numpy.save(store_directory / "durations.npy", numpy.array(DURATIONS))
+    numpy.save(store_directory / "return_periods.npy", numpy.array(RETURN_PERIODS))
+    metadata = {"format_version": STORE_FORMAT_VERSION}
+    (store_directory / METADATA_FILE_NAME).write_text(json.dumps(metadata))
+
+
+def store_format_version(store_directory: Path = STORE_DIRECTORY) -> Optional[int]:
+    """Format version of a store, None without (readable) metadata."""
+    try:
+        metadata = json.loads((store_directory / METADATA_FILE_NAME).read_text())
+        return metadata["format_version"]
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def store_is_current(
+    data_directory: Path = DATA_DIRECTORY, store_directory: Path = STORE_DIRECTORY
+) -> bool:
+    """Check that all store files exist, are of the current format version
+    and are newer than the CSV files."""
+    store_files = [store_directory / name for name in STORE_FILES]
+    if not all(path.exists() for path in store_files):
+        return False
+    if store_format_version(store_directory) != STORE_FORMAT_VERSION:
+        return False
+    sources = [data_directory / duration_file_name(duration) for duration in DURATIONS]
+    sources.append(data_directory / RASTER_FILE_NAME)
+    newest_source = max(path.stat().st_mtime for path in sources)
+    return min(path.stat().st_mtime for path in store_files) >= newest_source
+
+
+class KostraStore:
+    """Memory-mapped KOSTRA precipitation depths."""
+
+    def __init__(self, store_directory: Path = STORE_DIRECTORY) -> None:
+        """Initializer."""
+        self.hn = numpy.load(store_directory / "hn.npy", mmap_mode="r")
+        self.rn = numpy.load(store_directory / "rn.npy", mmap_mode="r")
+        self.slots = numpy.load(store_directory / "slots.npy")
+        self.index_rc = numpy.load(store_directory / "index_rc.npy", mmap_mode="r")
+        # KOSTRA cell indices of the rows in hn
+        self.data_index_rc = self.index_rc[self.slots != NO_DATA]
+        self.centers = numpy.load(store_directory / "centers.npy", mmap_mode="r")
+        self.corners = numpy.load(store_directory / "corners.npy", mmap_mode="r")
+        self.durations = numpy.load(store_directory / "durations.npy")
+        self.return_periods = numpy.load(store_directory / "return_periods.npy")
+
+    def __repr__(self) -> str:  # pragma: no cover
+        """String representation."""
+        return f"{self.__class__.__name__}(cells={len(self.index_rc)})"
+
+    def duration_index(self, duration: ArrayLike) -> Union[int, numpy.ndarray]:
+        """Positions of tabulated durations in min."""
+        return self._tabulated_index(self.durations, duration, "duration")
+
+    def return_period_index(
+        self, return_period: ArrayLike
+    ) -> Union[int, numpy.ndarray]:
+        """Positions of tabulated return periods in a."""
+        return self._tabulated_index(self.return_periods, return_period, "period")
+
+    @staticmethod
+    def _tabulated_index(
+        values: numpy.ndarray, value: ArrayLike, name: str
+    ) -> Union[int, numpy.ndarray]:
+        """Positions of values in the sorted tabulated values."""
+        value = numpy.asarray(value)
+        positions = numpy.searchsorted(values, value).clip(max=len(values) - 1)
+        untabulated = values[positions] != value
+        if numpy.any(untabulated):
+            raise ValueError(
+                f"No tabulated {name} {numpy.unique(value[untabulated])}, "
+                f"expected one of {values}"
+            )
+        return int(positions) if positions.ndim == 0 else positions
+
+    def slot(self, index_rc: ArrayLike) -> Union[int, numpy.ndarray]:
+        """Rows in hn of KOSTRA cell indices, NO_DATA for cells without data
+        and NO_CELL.
+
+        Raises ValueError for other cell indices outside the raster.
+        """
+        index_rc = numpy.asarray(index_rc)
+        no_cell = index_rc == NO_CELL
+        slots = self.slots[cell_position(numpy.where(no_cell, 0, index_rc))]
+        slots = numpy.where(no_cell, NO_DATA, slots)
+        return int(slots) if slots.ndim == 0 else slots
+
+    def depth(
+        self,
+        index_rc: ArrayLike,
+        duration: ArrayLike,
+        return_period: ArrayLike,
+        unit: Union[Unit, str, None] = None,
+    ) -> Union[float, numpy.ndarray]:
+        """Precipitation depth hN of cells, durations and return periods.
+
+        In unit (default: mm), NaN for cells without data. Arguments
+        broadcast against each other.
+        """
+        values = self.gather(self.hn, self.slot(index_rc), duration, return_period)
+        return in_unit(values, DEPTH_UNIT, unit)
+
+    def intensity(
+        self,
+        index_rc: ArrayLike,
+        duration: ArrayLike,
+        return_period: ArrayLike,
+        unit: Union[Unit, str, None] = None,
+    ) -> Union[float, numpy.ndarray]:
+        """Rain intensity r of cells, durations and return periods.
+
+        In unit (default: l/(s·ha)), NaN for cells without data. Arguments
+        broadcast against each other.
+        """
+        values = self.gather(self.rn, self.slot(index_rc), duration, return_period)
+        return in_unit(values, INTENSITY_UNIT, unit)
+
+    def gather(
+        self,
+        table: numpy.ndarray,
+        slots: ArrayLike,
+        duration: ArrayLike,
+        return_period: ArrayLike,
+    ) -> numpy.ndarray:
+        """Values of a table (hn or rn) for rows, durations and return periods.
+
+        A single fancy indexing operation on the memory-mapped table, NaN for
+        NO_DATA slots. Arguments broadcast against each other, ValueError if
+        they do not.
+        """
+        broadcast_shape(slots=slots, duration=duration, return_period=return_period)
+        slots = numpy.asarray(slots)
+        values = table[
+            slots,
+            self.duration_index(duration),
+            self.return_period_index(return_period),
+        ]
+        return numpy.where(slots == NO_DATA, numpy.nan, values)
+
+    def cell_depths(self, index_rc: int) -> numpy.ndarray:
+        """All precipitation depths in mm of a cell, shape (durations, return
+        periods).
+
+        NaN for cells without data.
+        """
+        return self._cell_values(self.hn, index_rc)
+
+    def cell_intensities(self, index_rc: int) -> numpy.ndarray:
+        """All rain intensities in l/(s·ha) of a cell, shape (durations, return
+        periods).
+
+        NaN for cells without data.
+        """
+        return self._cell_values(self.rn, index_rc)
+
+    def _cell_values(self, table: numpy.ndarray, index_rc: int) -> numpy.ndarray:
+        """All values of a table for a cell, NaN for cells without data."""
+        slot = self.slot(index_rc)
+        if slot == NO_DATA:
+            return numpy.full(table.shape[1:], numpy.nan)
+        return numpy.asarray(table[slot])
+
+    def depths(
+        self,
+        duration: int,
+        return_period: int,
+        index_rc: Optional[ArrayLike] = None,
+    ) -> numpy.ndarray:
+        """Precipitation depths in mm of all cells with data for a duration
+        and return period.
+
+        Given the KOSTRA cell indices of a region, only the depths of the
+        region's cells with data.
+        """
+        slots = slice(None)
+        if index_rc is not None:
+            slots = self.slot(numpy.ravel(index_rc))
+            slots = slots[slots != NO_DATA]
+        return numpy.asarray(
+            self.hn[
+                slots,
+                self.duration_index(duration),
+                self.return_period_index(return_period),
+            ]
+        )
+
+    def maximum(
+        self,
+        duration: int,
+        return_period: int,
+        index_rc: Optional[ArrayLike] = None,
+    ) -> float:
+        """Maximum precipitation depth in mm of all or a region's cells."""
+        return float(self.depths(duration, return_period, index_rc).max())
+
+    def quantile(
+        self,
+        q: ArrayLike,
+        duration: int,
+        return_period: int,
+        index_rc: Optional[ArrayLike] = None,
+    ) -> Union[float, numpy.ndarray]:
+        """Quantiles q (0 to 1) of the precipitation depths in mm of all or a
+        region's cells."""
+        quantiles = numpy.quantile(self.depths(duration, return_period, index_rc), q)
+        return float(quantiles) if quantiles.ndim == 0 else quantiles
+
+
+def load_store(
+    data_directory: Path = DATA_DIRECTORY, store_directory: Path = STORE_DIRECTORY
+) -> KostraStore:
+    """Load the KOSTRA store, (re)building it if it is missing or outdated."""
+    if not store_is_current(data_directory, store_directory):
+        build_store(data_directory, store_directory)
+    return KostraStore(store_directory)
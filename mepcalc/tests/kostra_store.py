@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""KOSTRA store shared by the tests, built from the CSV files once per test
+run into a temporary directory, which is removed at exit."""
+
+import atexit
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+
+from mepcalc.kostra.store import KostraStore, build_store, load_store
+
+
+@lru_cache(maxsize=None)
+def shared_store_directory() -> Path:
+    """Directory of the shared store, built on first use."""
+    directory = tempfile.TemporaryDirectory()
+    atexit.register(directory.cleanup)
+    store_directory = Path(directory.name) / "store"
+    build_store(store_directory=store_directory)
+    return store_directory
+
+
+@lru_cache(maxsize=None)
+def shared_store() -> KostraStore:
+    """The shared store."""
+    return load_store(store_directory=shared_store_directory())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+from unittest import TestCase
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QLabel, QWidget  # noqa: E402
+
+from mepcalc.app import PAGES, LazyTabWidget, MEPCalc  # noqa: E402
+from mepcalc.gui.heat_calculator_mass import HeatCalculatorMassWidget  # noqa: E402
+from mepcalc.tests.test_gui_base_calculator import application  # noqa: E402
+
+
+class CountingFactory:
+    """Page factory counting the pages it builds."""
+
+    def __init__(self, text: str):
+        """Initializer."""
+        self.text = text
+        self.calls = 0
+
+    def __call__(self) -> QWidget:
+        """Build a page."""
+        self.calls += 1
+        return QLabel(self.text)
+
+
+class TestLazyTabWidget(TestCase):
+    """Unit tests for LazyTabWidget."""
+
+    def setUp(self):
+        application()
+        self.factories = [CountingFactory(text) for text in ("A", "B", "C")]
+        self.tabs = LazyTabWidget(
+            [("Tab A", self.factories[0]), ("Tab B", self.factories[1])]
+            + [("Nested", [("Tab C", self.factories[2])])]
+        )
+
+    def tearDown(self):
+        self.tabs.deleteLater()
+
+    def calls(self):
+        return [factory.calls for factory in self.factories]
+
+    def test_only_current_page_is_built(self):
+        self.assertEqual(self.tabs.count(), 3)
+        self.assertEqual(self.tabs.tabText(2), "Nested")
+        self.assertEqual(self.calls(), [1, 0, 0])
+        self.assertEqual(sorted(self.tabs.factories), [1, 2])
+        for index in (1, 2):
+            self.assertEqual(self.tabs.widget(index).layout().count(), 0)
+
+    def test_switching_tab_builds_page_once(self):
+        self.tabs.setCurrentIndex(1)
+        self.tabs.setCurrentIndex(0)
+        self.tabs.setCurrentIndex(1)
+        self.assertEqual(self.calls(), [1, 1, 0])
+        self.assertEqual(self.tabs.page(1).text(), "B")
+        self.assertEqual(sorted(self.tabs.factories), [2])
+
+    def test_page_builds_nested_tabs_on_demand(self):
+        nested = self.tabs.page(2)
+        self.assertIsInstance(nested, LazyTabWidget)
+        self.assertEqual(self.calls(), [1, 0, 1])
+        self.assertEqual(nested.page(0).text(), "C")
+        self.assertIs(self.tabs.page(2), nested)
+        self.assertEqual(self.calls(), [1, 0, 1])
+
+
+class TestMEPCalc(TestCase):
+    """Unit tests for the main window."""
+
+    def setUp(self):
+        application()
+        self.window = MEPCalc()
+
+    def tearDown(self):
+        self.window.deleteLater()
+
+    def test_main_tabs_follow_pages(self):
+        tabs = self.window.main_tabs
+        self.assertEqual(
+            [tabs.tabText(index) for index in range(tabs.count())],
+            [title for title, _ in PAGES],
+        )
+
+    def test_startup_builds_visible_calculator_only(self):
+        tabs = self.window.main_tabs
+        self.assertEqual(sorted(tabs.factories), list(range(1, len(PAGES))))
+        heat = tabs.page(0)
+        self.assertEqual(sorted(heat.factories), [1])
+        self.assertIsInstance(heat.page(0), HeatCalculatorMassWidget)
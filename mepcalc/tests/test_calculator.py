@@ -3,10 +3,19 @@
 import math
 from unittest import TestCase
 
+import numpy
 from pint import Quantity
 
 from mepcalc.common.medium import Medium
-from mepcalc.common.base_calculator import BaseCalculator
+from mepcalc.common.base_calculator import (
+    BaseCalculator,
+    as_column,
+    calculator_cache_clear,
+    calculator_cache_info,
+    shared_calculator,
+)
+from mepcalc.common.duct_calculator import DuctCalculator
+from mepcalc.common.heat_calculator import HeatCalculator
 
 
 class TestBaseCalculator(TestCase):
@@ -26,3 +35,121 @@ class TestBaseCalculator(TestCase):
         """Check that medium is a read only property."""
         with self.assertRaises(AttributeError):
             self.calc.medium = Medium.air()
+
+
+class TestSharedCalculator(TestCase):
+    """Unit tests for shared_calculator function."""
+
+    def setUp(self):
+        calculator_cache_clear()
+
+    def test_equal_media_share_calculator(self):
+        calculator = shared_calculator(HeatCalculator, Medium.water())
+        self.assertIs(shared_calculator(HeatCalculator, Medium.water()), calculator)
+        self.assertIsNot(shared_calculator(DuctCalculator, Medium.water()), calculator)
+        self.assertIsNot(shared_calculator(HeatCalculator, Medium.air()), calculator)
+        self.assertEqual(calculator_cache_info().hits, 1)
+
+    def test_changed_medium_gets_new_calculator(self):
+        medium = Medium.water()
+        calculator = shared_calculator(HeatCalculator, medium)
+        medium.density = Quantity(1000, "kg/m³")
+        changed = shared_calculator(HeatCalculator, medium)
+        self.assertIsNot(changed, calculator)
+        self.assertAlmostEqual(calculator.medium.density.m_as("kg/m³"), 998.2)
+        self.assertAlmostEqual(changed.medium.density.m_as("kg/m³"), 1000)
+
+    def test_medium_at_array_of_states_is_not_shared(self):
+        medium = Medium.water().at(temperature=Quantity([10, 20], "degC"))
+        calculator = shared_calculator(HeatCalculator, medium)
+        self.assertIsNot(shared_calculator(HeatCalculator, medium), calculator)
+        self.assertEqual(calculator_cache_info().currsize, 0)
+
+
+class TestAsColumn(TestCase):
+    """Unit tests for as_column function."""
+
+    def test_quantity_column_succeeds(self):
+        column = as_column(Quantity([1, 2, 3], "m"))
+        self.assertIsInstance(column.magnitude, numpy.ndarray)
+        self.assertEqual(column.magnitude.dtype, numpy.float64)
+        self.assertEqual(str(column.units), "meter")
+
+    def test_magnitudes_and_unit_column_succeeds(self):
+        column = as_column(([1.0, 2.0, 3.0], "kg/s"))
+        numpy.testing.assert_array_equal(column.magnitude, [1.0, 2.0, 3.0])
+        self.assertEqual(column.units, Quantity(1, "kg/s").units)
+
+
+class TestCompiledFormula(TestCase):
+    """Unit tests for compiled calculator formulas."""
+
+    def setUp(self):
+        self.q = HeatCalculator(medium=Medium.water())
+        self.d = DuctCalculator(medium=Medium.air())
+
+    def test_compile_heat_flow_from_mass_flow_succeeds(self):
+        compiled = self.q.compile(
+            "heat_flow_from_mass_flow", unit="kW", mass_flow="kg/h", temp_diff="K"
+        )
+        self.assertEqual(compiled.exponents, (1, 1))
+        expected = self.q.heat_flow_from_mass_flow(
+            Quantity(1500.0, "kg/h"), Quantity(5.0, "K"), unit="kW"
+        )
+        self.assertAlmostEqual(compiled(1500.0, 5.0), expected.magnitude)
+        self.assertAlmostEqual(
+            compiled(mass_flow=1500.0, temp_diff=5.0), expected.magnitude
+        )
+
+    def test_compile_temp_diff_from_volume_flow_succeeds(self):
+        compiled = self.q.compile(
+            "temp_diff_from_volume_flow", heat_flow="kW", volume_flow="m³/h"
+        )
+        self.assertEqual(compiled.exponents, (1, -1))
+        expected = self.q.temp_diff_from_volume_flow(
+            Quantity(20.0, "kW"), Quantity(3.0, "m³/h")
+        )
+        self.assertAlmostEqual(compiled(20.0, 3.0), expected.magnitude)
+
+    def test_compile_velocity_from_diameter_succeeds(self):
+        compiled = self.d.compile(
+            "velocity_from_diameter", volume_flow="m³/h", diameter="mm"
+        )
+        self.assertEqual(compiled.exponents, (1, -2))
+        expected = self.d.velocity_from_diameter(
+            Quantity(800.0, "m³/h"), Quantity(250.0, "mm")
+        )
+        self.assertAlmostEqual(compiled(800.0, 250.0), expected.magnitude)
+
+    def test_compiled_formula_accepts_arrays(self):
+        compiled = self.d.compile(
+            "volume_flow_from_width_height",
+            unit="m³/h",
+            velocity="m/s",
+            width="mm",
+            height="mm",
+        )
+        velocities = numpy.array([1.0, 2.0, 3.0])
+        results = compiled(velocities, 400.0, 200.0)
+        expected = self.d.batch(
+            "volume_flow_from_width_height",
+            unit="m³/h",
+            velocity=(velocities, "m/s"),
+            width=([400.0], "mm"),
+            height=([200.0], "mm"),
+        )
+        numpy.testing.assert_allclose(results, expected, rtol=1e-14)
+
+    def test_compile_fails_on_bad_input_unit(self):
+        with self.assertRaises(ValueError):
+            self.q.compile("heat_flow_from_mass_flow", mass_flow="m³/h", temp_diff="K")
+
+    def test_compile_fails_on_piecewise_formula(self):
+        """Laminar pressure gradients are products of powers, turbulent ones
+        not, so probes in laminar flow would compile a wrong formula."""
+        with self.assertRaises(ValueError):
+            self.d.compile(
+                "pressure_gradient_from_diameter",
+                volume_flow="m³/h",
+                diameter="m",
+            )
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import csv
+import io
+import importlib.util
+import tempfile
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from unittest import TestCase, skipUnless
+
+from pint import Quantity
+
+from mepcalc.cli import InputSpec, OutputSpec, main, parse_args, run
+from mepcalc.common.duct_calculator import DuctCalculator
+from mepcalc.common.heat_calculator import HeatCalculator
+from mepcalc.common.medium import Medium
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestSpecs(TestCase):
+    """Unit tests for input and output column specifications."""
+
+    def test_input_spec_succeeds(self):
+        spec = InputSpec.parse("mass_flow=m_dot:kg/h")
+        self.assertEqual(spec, InputSpec("mass_flow", "m_dot", "kg/h"))
+
+    def test_input_spec_fails(self):
+        with self.assertRaises(argparse.ArgumentTypeError):
+            InputSpec.parse("mass_flow")
+
+    def test_output_spec_succeeds(self):
+        spec = OutputSpec.parse("Q=heat.heat_flow_from_mass_flow:kW")
+        self.assertEqual(
+            spec, OutputSpec("Q", "heat", "heat_flow_from_mass_flow", "kW")
+        )
+
+    def test_output_spec_fails_on_unknown_calculator(self):
+        with self.assertRaises(argparse.ArgumentTypeError):
+            OutputSpec.parse("Q=pipe.heat_flow_from_mass_flow:kW")
+
+    def test_chunk_size_fails_below_one(self):
+        for chunk_size in ("0", "-1", "many"):
+            with self.subTest(chunk_size=chunk_size), self.assertRaises(SystemExit):
+                with redirect_stderr(io.StringIO()):
+                    parse_args(
+                        [
+                            "source.csv",
+                            "target.csv",
+                            "--input=mass_flow=m_dot:kg/h",
+                            "--output=V=heat.volume_flow_from_mass_flow:m³/h",
+                            f"--chunk-size={chunk_size}",
+                        ]
+                    )
+
+
+class TestRun(TestCase):
+    """Unit tests for batch calculation runs."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        self.source = self.path / "source.csv"
+        self.rows = [(str(i), 100.0 * (i + 1), 2.0 + i % 7) for i in range(25)]
+        with open(self.source, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["name", "m_dot", "dT"])
+            writer.writerows(self.rows)
+        self.inputs = [
+            InputSpec("mass_flow", "m_dot", "kg/h"),
+            InputSpec("temp_diff", "dT", "K"),
+        ]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_target(self, target):
+        with open(target, newline="") as file:
+            return list(csv.DictReader(file))
+
+    def test_heat_calculation_succeeds(self):
+        target = self.path / "target.csv"
+        outputs = [OutputSpec("Q", "heat", "heat_flow_from_mass_flow", "kW")]
+        rows = run(self.source, target, self.inputs, outputs, chunk_size=10)
+        self.assertEqual(rows, len(self.rows))
+        calculator = HeatCalculator(Medium.water())
+        for (name, mass_flow, temp_diff), result in zip(
+            self.rows, self.read_target(target)
+        ):
+            self.assertEqual(result["name"], name)
+            heat_flow = calculator.heat_flow_from_mass_flow(
+                Quantity(mass_flow, "kg/h"), Quantity(temp_diff, "K"), unit="kW"
+            )
+            self.assertAlmostEqual(float(result["Q"]), heat_flow.magnitude)
+
+    def test_duct_calculation_succeeds(self):
+        target = self.path / "target.csv"
+        inputs = [InputSpec("mass_flow", "m_dot", "kg/h")]
+        outputs = [OutputSpec("V", "duct", "volume_flow_from_mass_flow", "m³/h")]
+        run(self.source, target, inputs, outputs, medium="Air")
+        calculator = DuctCalculator(Medium.air())
+        result = self.read_target(target)[3]
+        volume_flow = calculator.volume_flow_from_mass_flow(
+            Quantity(400.0, "kg/h"), unit="m³/h"
+        )
+        self.assertAlmostEqual(float(result["V"]), volume_flow.magnitude)
+
+    def test_run_fails_on_missing_input(self):
+        outputs = [OutputSpec("Q", "heat", "heat_flow_from_mass_flow", "kW")]
+        with self.assertRaises(ValueError):
+            run(self.source, self.path / "target.csv", self.inputs[:1], outputs)
+
+    def test_run_fails_on_unsupported_file_type(self):
+        outputs = [OutputSpec("Q", "heat", "heat_flow_from_mass_flow", "kW")]
+        with self.assertRaises(ValueError):
+            run(self.source, self.path / "target.xlsx", self.inputs, outputs)
+
+    @skipUnless(HAS_PYARROW, "requires pyarrow")
+    def test_parquet_round_trip_succeeds(self):  # pragma: no cover
+        outputs = [OutputSpec("Q", "heat", "heat_flow_from_mass_flow", "kW")]
+        parquet = self.path / "target.parquet"
+        run(self.source, parquet, self.inputs, outputs, chunk_size=10)
+        target = self.path / "target.csv"
+        inputs = [InputSpec("heat_flow", "Q", "kW"), self.inputs[1]]
+        outputs = [OutputSpec("m", "heat", "mass_flow_from_heat_flow", "kg/h")]
+        run(parquet, target, inputs, outputs)
+        for (_, mass_flow, _), result in zip(self.rows, self.read_target(target)):
+            self.assertAlmostEqual(float(result["m"]), mass_flow)
+
+    def test_input_columns_are_floats(self):
+        target = self.path / "target.csv"
+        outputs = [OutputSpec("Q", "heat", "heat_flow_from_mass_flow", "kW")]
+        run(self.source, target, self.inputs, outputs)
+        result = self.read_target(target)[0]
+        self.assertEqual(result["name"], "0")
+        self.assertEqual(result["m_dot"], "100.0")
+        self.assertEqual(result["dT"], "2.0")
+
+    def test_uncompilable_formulas_succeed(self):
+        target = self.path / "target.csv"
+        inputs = [
+            InputSpec("volume_flow", "m_dot", "m³/h"),
+            InputSpec("width", "dT", "m"),
+            InputSpec("height", "dT", "m"),
+        ]
+        outputs = [
+            OutputSpec("d_h", "duct", "hydraulic_diameter_from_width_height", "m"),
+            OutputSpec("R", "duct", "pressure_gradient_from_width_height", "Pa/m"),
+        ]
+        run(self.source, target, inputs, outputs, medium="Air", chunk_size=10)
+        calculator = DuctCalculator(Medium.air())
+        for (_, volume_flow, size), result in zip(self.rows, self.read_target(target)):
+            self.assertAlmostEqual(float(result["d_h"]), size)
+            pressure_gradient = calculator.pressure_gradient_from_width_height(
+                Quantity(volume_flow, "m³/h"),
+                Quantity(size, "m"),
+                Quantity(size, "m"),
+                unit="Pa/m",
+            )
+            self.assertAlmostEqual(float(result["R"]), pressure_gradient.magnitude)
+
+    def test_optional_inputs_succeed(self):
+        target = self.path / "target.csv"
+        inputs = [
+            InputSpec("volume_flow", "m_dot", "m³/h"),
+            InputSpec("diameter", "dT", "m"),
+            InputSpec("roughness", "dT", "mm"),
+        ]
+        outputs = [OutputSpec("R", "duct", "pressure_gradient_from_diameter", "Pa/m")]
+        run(self.source, target, inputs, outputs, medium="Air")
+        calculator = DuctCalculator(Medium.air())
+        _, volume_flow, size = self.rows[3]
+        pressure_gradient = calculator.pressure_gradient_from_diameter(
+            Quantity(volume_flow, "m³/h"),
+            Quantity(size, "m"),
+            Quantity(size, "mm"),
+            unit="Pa/m",
+        )
+        result = self.read_target(target)[3]
+        self.assertAlmostEqual(float(result["R"]), pressure_gradient.magnitude)
+
+    def test_header_only_file_succeeds(self):
+        source = self.path / "header.csv"
+        source.write_text("name,m_dot,dT\n")
+        target = self.path / "target.csv"
+        outputs = [OutputSpec("Q", "heat", "heat_flow_from_mass_flow", "kW")]
+        self.assertEqual(run(source, target, self.inputs, outputs), 0)
+        self.assertEqual(target.read_text().split(), ["name,m_dot,dT,Q"])
+
+    def test_run_fails_on_empty_file(self):
+        source = self.path / "empty.csv"
+        source.write_text("")
+        outputs = [OutputSpec("Q", "heat", "heat_flow_from_mass_flow", "kW")]
+        with self.assertRaises(ValueError):
+            run(source, self.path / "target.csv", self.inputs, outputs)
+
+
+class TestMain(TestCase):
+    """Unit tests for the command line errors."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+        self.source = self.path / "source.csv"
+        self.source.write_text("m_dot,dT\n100,5\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def main(self, *args):
+        """Exit message of main, None on success."""
+        arguments = [str(self.source), str(self.path / "target.csv"), *args]
+        try:
+            with redirect_stdout(io.StringIO()):
+                main(arguments)
+        except SystemExit as exit:
+            return exit.code
+        return None
+
+    def test_main_succeeds(self):
+        message = self.main(
+            "--input=mass_flow=m_dot:kg/h",
+            "--output=V=heat.volume_flow_from_mass_flow:m³/h",
+        )
+        self.assertIsNone(message)
+
+    def test_main_fails_on_bad_units(self):
+        for input_unit, output_unit in (("kg/h", "kW"), ("kgg/h", "m³/h")):
+            with self.subTest(input_unit=input_unit, output_unit=output_unit):
+                message = self.main(
+                    f"--input=mass_flow=m_dot:{input_unit}",
+                    f"--output=V=heat.volume_flow_from_mass_flow:{output_unit}",
+                )
+                self.assertTrue(message.startswith("error:"), message)
+
+    def test_main_fails_on_missing_column(self):
+        message = self.main(
+            "--input=mass_flow=mass:kg/h",
+            "--output=V=heat.volume_flow_from_mass_flow:m³/h",
+        )
+        self.assertEqual(message, "error: Missing input column 'mass'")
+
+    def test_main_fails_on_empty_file(self):
+        self.source.write_text("")
+        message = self.main(
+            "--input=mass_flow=m_dot:kg/h",
+            "--output=V=heat.volume_flow_from_mass_flow:m³/h",
+        )
+        self.assertTrue(message.startswith("error: Empty CSV file"), message)
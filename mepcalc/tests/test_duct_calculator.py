@@ -3,10 +3,12 @@
 import math
 from unittest import TestCase
 
+import numpy
 from pint import Quantity
 
 from mepcalc.common.medium import Medium
 from mepcalc.common.duct_calculator import DuctCalculator
+from mepcalc.common.friction import friction_factor
 
 
 class TestDuctCalculator(TestCase):
@@ -30,6 +32,40 @@ class TestDuctCalculator(TestCase):
         self.bad_area = Quantity(1, "m")
         self.bad_length = Quantity(1, "m²")
 
+    # Area from Width and Height
+    def test_area_from_width_height_succeeds(self):
+        """Check that a calculation with good inputs succeeds.
+        A = B * H = 1 m * 1 m = 1 m²
+        """
+        area = self.d.area_from_width_height(
+            width=self.good_length, height=self.good_length
+        )
+        self.assertEqual(area, self.good_area)
+
+    def test_area_from_width_height_fails_on_bad_length(self):
+        """Check that a calculation with bad inputs fails."""
+        with self.assertRaises(ValueError):
+            self.d.area_from_width_height(
+                width=self.bad_length, height=self.good_length
+            )
+        with self.assertRaises(ValueError):
+            self.d.area_from_width_height(
+                width=self.good_length, height=self.bad_length
+            )
+
+    # Area from Diameter
+    def test_area_from_diameter_succeeds(self):
+        """Check that a calculation with good inputs succeeds.
+        A = pi/4 * D^2 = pi/4 * (1 m)^2 = pi/4 m²
+        """
+        area = self.d.area_from_diameter(diameter=self.good_length)
+        self.assertEqual(area, self.good_area * (math.pi / 4))
+
+    def test_area_from_diameter_fails_on_bad_diameter(self):
+        """Check that a calculation with bad inputs fails."""
+        with self.assertRaises(ValueError):
+            self.d.area_from_diameter(diameter=self.bad_length)
+
     # Volume Flow from Area
     def test_volume_flow_from_area_succeeds(self):
         """Check that a calculation with good inputs succeeds.
@@ -223,3 +259,165 @@ class TestDuctCalculator(TestCase):
         """Check that a calculation with bad inputs fails."""
         with self.assertRaises(ValueError):
             self.d.mass_flow_from_volume_flow(volume_flow=self.bad_volume_flow)
+
+
+class TestDuctCalculatorSweep(TestCase):
+    """Unit tests for DuctCalculator sweep calculations."""
+
+    def setUp(self):
+        self.d = DuctCalculator(medium=Medium.air())
+        self.volume_flows = (numpy.array([100.0, 250.0, 1000.0]), "m³/h")
+        self.velocities = (numpy.array([1.5, 3.0]), "m/s")
+        self.lengths = (numpy.array([100.0, 200.0, 400.0, 800.0]), "mm")
+
+    def test_volume_flow_from_width_height_sweep_succeeds(self):
+        results = self.d.sweep(
+            "volume_flow_from_width_height",
+            velocity=self.velocities,
+            width=self.lengths,
+            height=self.lengths,
+            unit="m³/h",
+        )
+        self.assertEqual(results.shape, (2, 4, 4))
+        for i, velocity in enumerate(self.velocities[0]):
+            for j, width in enumerate(self.lengths[0]):
+                for k, height in enumerate(self.lengths[0]):
+                    volume_flow = self.d.volume_flow_from_width_height(
+                        velocity=Quantity(velocity, "m/s"),
+                        width=Quantity(width, "mm"),
+                        height=Quantity(height, "mm"),
+                        unit="m³/h",
+                    )
+                    self.assertEqual(results[i, j, k], volume_flow.magnitude)
+
+    def test_velocity_from_width_height_sweep_succeeds(self):
+        results = self.d.sweep(
+            "velocity_from_width_height",
+            volume_flow=self.volume_flows,
+            width=self.lengths,
+            height=self.lengths,
+        )
+        self.assertEqual(results.shape, (3, 4, 4))
+        velocity = self.d.velocity_from_width_height(
+            volume_flow=Quantity(250.0, "m³/h"),
+            width=Quantity(400.0, "mm"),
+            height=Quantity(100.0, "mm"),
+        )
+        self.assertEqual(results[1, 2, 0], velocity.magnitude)
+
+    def test_velocity_from_diameter_sweep_succeeds(self):
+        results = self.d.sweep(
+            "velocity_from_diameter",
+            volume_flow=self.volume_flows,
+            diameter=self.lengths,
+        )
+        self.assertEqual(results.shape, (3, 4))
+        velocity = self.d.velocity_from_diameter(
+            volume_flow=Quantity(1000.0, "m³/h"), diameter=Quantity(200.0, "mm")
+        )
+        self.assertEqual(results[2, 1], velocity.magnitude)
+
+    def test_sweep_fails_on_bad_column(self):
+        with self.assertRaises(ValueError):
+            self.d.sweep(
+                "velocity_from_diameter",
+                volume_flow=self.velocities,
+                diameter=self.lengths,
+            )
+
+
+class TestDuctPressureDrop(TestCase):
+    """Unit tests for the friction pressure drop of DuctCalculator."""
+
+    def setUp(self):
+        self.medium = Medium(
+            "Test",
+            heat_cap=Quantity(1, "J/(kg K)"),
+            density=Quantity(1.2, "kg/m³"),
+            viscosity=Quantity(18, "µPa s"),
+        )
+        self.d = DuctCalculator(medium=self.medium)
+        self.volume_flow = Quantity(0.3, "m³/s")
+        self.width = Quantity(500, "mm")
+        self.height = Quantity(300, "mm")
+        self.roughness = Quantity(0.15, "mm")
+
+    def test_hydraulic_diameter_from_width_height_succeeds(self):
+        """d_h = 2 * 0.5 m * 0.3 m / 0.8 m = 0.375 m"""
+        hydraulic_diameter = self.d.hydraulic_diameter_from_width_height(
+            self.width, self.height
+        )
+        self.assertAlmostEqual(hydraulic_diameter.m_as("m"), 0.375)
+
+    def test_reynolds_number_from_width_height_succeeds(self):
+        """Re = 2 m/s * 0.375 m / 15e-6 m²/s = 50000"""
+        reynolds = self.d.reynolds_number_from_width_height(
+            self.volume_flow, self.width, self.height
+        )
+        self.assertAlmostEqual(reynolds.m_as(""), 50000)
+
+    def test_reynolds_number_from_diameter_succeeds(self):
+        reynolds = self.d.reynolds_number_from_diameter(
+            Quantity(math.pi / 4 * 0.09, "m³/s"), Quantity(300, "mm")
+        )
+        self.assertAlmostEqual(reynolds.m_as(""), 20000)
+
+    def test_pressure_gradient_from_width_height_succeeds(self):
+        """R = λ / 0.375 m * 1.2 kg/m³ * (2 m/s)² / 2, velocity of the actual
+        cross section, friction of the hydraulic diameter"""
+        gradient = self.d.pressure_gradient_from_width_height(
+            self.volume_flow, self.width, self.height, self.roughness
+        )
+        expected = friction_factor(50000, 0.15 / 375) / 0.375 * 1.2 * 2**2 / 2
+        self.assertAlmostEqual(gradient.m_as("Pa/m"), expected)
+
+    def test_pressure_gradient_of_square_duct_is_round_duct_of_side(self):
+        """A square duct has a larger area, so less velocity, than the round
+        duct of its hydraulic diameter, but the same velocity gives the same R."""
+        side = Quantity(400, "mm")
+        square = self.d.pressure_gradient_from_width_height(
+            self.volume_flow, side, side
+        )
+        round_ = self.d.pressure_gradient_from_diameter(
+            self.volume_flow * math.pi / 4, side
+        )
+        self.assertAlmostEqual(square.m_as("Pa/m"), round_.m_as("Pa/m"))
+
+    def test_pressure_gradient_of_networks_matches_segments(self):
+        rng = numpy.random.default_rng(17)
+        volume_flows = Quantity(rng.uniform(0, 5000, 1000), "m³/h")
+        widths = Quantity(rng.choice([200, 400, 800], 1000), "mm")
+        heights = Quantity(rng.choice([100, 200, 400], 1000), "mm")
+        gradients = self.d.pressure_gradient_from_width_height(
+            volume_flows, widths, heights
+        )
+        self.assertEqual(gradients.shape, (1000,))
+        self.assertEqual(gradients.u, self.d.DEFAULT_PRESSURE_GRADIENT_UNIT)
+        for index in range(0, 1000, 97):
+            gradient = self.d.pressure_gradient_from_width_height(
+                volume_flows[index], widths[index], heights[index]
+            )
+            self.assertAlmostEqual(gradients[index].m, gradient.m)
+
+    def test_pressure_gradient_fails_on_bad_inputs(self):
+        with self.assertRaises(ValueError):
+            self.d.pressure_gradient_from_width_height(
+                Quantity(1, "m³"), self.width, self.height
+            )
+        with self.assertRaises(ValueError):
+            self.d.pressure_gradient_from_width_height(
+                self.volume_flow, Quantity(1, "m²"), self.height
+            )
+        with self.assertRaises(ValueError):
+            self.d.pressure_gradient_from_diameter(
+                self.volume_flow, self.width, Quantity(1, "s")
+            )
+
+    def test_pressure_gradient_fails_without_viscosity(self):
+        medium = Medium(
+            "Test", heat_cap=Quantity(1, "J/(kg K)"), density=Quantity(1, "kg/m³")
+        )
+        with self.assertRaises(ValueError):
+            DuctCalculator(medium).pressure_gradient_from_diameter(
+                self.volume_flow, self.width
+            )
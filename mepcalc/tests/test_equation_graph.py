@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+from pint import Quantity
+
+from mepcalc.common.duct_calculator import DuctCalculator
+from mepcalc.common.equation_graph import (
+    FLOW_GRAPH,
+    EquationGraph,
+    Formula,
+    calculator_formulas,
+)
+from mepcalc.common.heat_calculator import HeatCalculator
+from mepcalc.common.medium import Medium
+
+
+class TestCalculatorFormulas(TestCase):
+    """Unit tests for calculator_formulas function."""
+
+    def test_formulas_are_named_output_from_inputs(self):
+        formulas = {
+            formula.method: formula for formula in calculator_formulas(HeatCalculator)
+        }
+        self.assertEqual(len(formulas), 8)
+        self.assertEqual(
+            formulas["heat_flow_from_mass_flow"],
+            Formula(
+                "heat_flow",
+                ("mass_flow", "temp_diff"),
+                HeatCalculator,
+                "heat_flow_from_mass_flow",
+            ),
+        )
+
+    def test_optional_parameters_are_no_inputs(self):
+        formulas = {
+            formula.method: formula for formula in calculator_formulas(DuctCalculator)
+        }
+        self.assertEqual(
+            formulas["pressure_gradient_from_diameter"].inputs,
+            ("volume_flow", "diameter"),
+        )
+
+
+class TestEquationGraph(TestCase):
+    """Unit tests for EquationGraph class."""
+
+    def test_equal_formulas_are_kept_once(self):
+        graph = EquationGraph(
+            calculator_formulas(HeatCalculator) + calculator_formulas(DuctCalculator)
+        )
+        mass_flow_formulas = [
+            formula
+            for formula in graph.formulas
+            if formula.output == "mass_flow" and formula.inputs == ("volume_flow",)
+        ]
+        self.assertEqual(len(mass_flow_formulas), 1)
+        self.assertIs(mass_flow_formulas[0].calculator, HeatCalculator)
+
+    def test_plan_is_in_evaluation_order(self):
+        plan = FLOW_GRAPH.plan(
+            known=["heat_flow", "temp_diff", "width", "height"],
+            unknown=["velocity", "mass_flow"],
+        )
+        self.assertEqual(
+            [formula.method for formula in plan],
+            [
+                "mass_flow_from_heat_flow",
+                "volume_flow_from_heat_flow",
+                "velocity_from_width_height",
+            ],
+        )
+
+    def test_plan_without_unknowns_computes_everything(self):
+        plan = FLOW_GRAPH.plan(known=["volume_flow", "diameter"])
+        self.assertEqual(
+            {formula.output for formula in plan},
+            {
+                "area",
+                "mass_flow",
+                "velocity",
+                "reynolds_number",
+                "pressure_gradient",
+            },
+        )
+
+    def test_plan_is_cached(self):
+        known, unknown = ["volume_flow", "temp_diff"], ["heat_flow"]
+        self.assertIs(FLOW_GRAPH.plan(known, unknown), FLOW_GRAPH.plan(known, unknown))
+
+    def test_inconsistent_variables_fail(self):
+        with self.assertRaises(ValueError):
+            FLOW_GRAPH.plan(known=["heat_flow"], unknown=["heat_flow"])
+        with self.assertRaises(ValueError):
+            FLOW_GRAPH.plan(known=["heat_flow"], unknown=["pressure_drop"])
+        with self.assertRaises(ValueError):
+            FLOW_GRAPH.plan(known=["heat_flow"], unknown=["mass_flow"])
+
+
+class TestSolution(TestCase):
+    """Unit tests for Solution class."""
+
+    def setUp(self):
+        self.medium = Medium.water().freeze()
+        self.heat = HeatCalculator(self.medium)
+        self.duct = DuctCalculator(self.medium)
+        self.heat_flow = Quantity(10, "kW")
+        self.temp_diff = Quantity(5, "K")
+        self.width = Quantity(100, "mm")
+        self.height = Quantity(50, "mm")
+        self.solution = FLOW_GRAPH.solve(
+            self.medium,
+            ["velocity", "mass_flow"],
+            heat_flow=self.heat_flow,
+            temp_diff=self.temp_diff,
+            width=self.width,
+            height=self.height,
+        )
+
+    def test_solution_matches_calculators(self):
+        volume_flow = self.heat.volume_flow_from_heat_flow(
+            self.heat_flow, self.temp_diff
+        )
+        self.assertEqual(set(self.solution.results), {"velocity", "mass_flow"})
+        self.assertAlmostEqual(
+            self.solution.values["velocity"].m_as("m/s"),
+            self.duct.velocity_from_width_height(
+                volume_flow, self.width, self.height
+            ).m_as("m/s"),
+        )
+        self.assertAlmostEqual(
+            self.solution.values["mass_flow"].m_as("kg/s"),
+            self.heat.mass_flow_from_heat_flow(self.heat_flow, self.temp_diff).m_as(
+                "kg/s"
+            ),
+        )
+
+    def test_update_recomputes_downstream_only(self):
+        mass_flow = self.solution.values["mass_flow"]
+        recomputed = self.solution.update(width=Quantity(200, "mm"))
+        self.assertEqual(set(recomputed), {"velocity"})
+        self.assertIs(self.solution.values["mass_flow"], mass_flow)
+        recomputed = self.solution.update(temp_diff=Quantity(10, "K"))
+        self.assertEqual(set(recomputed), {"mass_flow", "volume_flow", "velocity"})
+
+    def test_update_equals_new_solution(self):
+        self.solution.update(heat_flow=Quantity(20, "kW"), height=Quantity(80, "mm"))
+        solution = FLOW_GRAPH.solve(
+            self.medium,
+            ["velocity", "mass_flow"],
+            heat_flow=Quantity(20, "kW"),
+            temp_diff=self.temp_diff,
+            width=self.width,
+            height=Quantity(80, "mm"),
+        )
+        for name, value in solution.values.items():
+            self.assertAlmostEqual(
+                self.solution.values[name].to_base_units().m,
+                value.to_base_units().m,
+            )
+
+    def test_updated_leaves_solution_as_is(self):
+        velocity = self.solution.values["velocity"]
+        updated = self.solution.updated(width=Quantity(200, "mm"))
+        self.assertIs(self.solution.values["velocity"], velocity)
+        self.assertAlmostEqual(
+            updated.values["velocity"].m_as("m/s"), velocity.m_as("m/s") / 2
+        )
+
+    def test_matches(self):
+        known = ["heat_flow", "temp_diff", "width", "height"]
+        unknown = ["velocity", "mass_flow"]
+        self.assertTrue(self.solution.matches(Medium.water().freeze(), known, unknown))
+        self.assertFalse(self.solution.matches(Medium.air().freeze(), known, unknown))
+        self.assertFalse(self.solution.matches(self.medium, known, ["velocity"]))
+
+    def test_update_of_computed_variable_fails(self):
+        with self.assertRaises(ValueError):
+            self.solution.update(velocity=Quantity(1, "m/s"))
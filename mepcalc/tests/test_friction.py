@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+import numpy
+
+from mepcalc.common.friction import (
+    LAMINAR_REYNOLDS_NUMBER,
+    friction_factor,
+    pressure_gradient,
+    reynolds_number,
+)
+
+
+def colebrook(reynolds, relative_roughness):
+    """Colebrook–White friction factor by fixed-point iteration."""
+    x = numpy.full(numpy.broadcast(reynolds, relative_roughness).shape, 8.0)
+    for _ in range(200):
+        x = -2 * numpy.log10(relative_roughness / 3.7 + 2.51 * x / reynolds)
+    return 1 / x**2
+
+
+class TestFrictionFactor(TestCase):
+    """Unit tests for friction_factor function."""
+
+    def test_friction_factor_matches_colebrook(self):
+        reynolds = numpy.geomspace(LAMINAR_REYNOLDS_NUMBER, 1e9, 200)[:, None]
+        roughness = numpy.concatenate(([0], numpy.geomspace(1e-7, 0.1, 30)))
+        numpy.testing.assert_allclose(
+            friction_factor(reynolds, roughness),
+            colebrook(reynolds, roughness),
+            rtol=1e-14,
+        )
+
+    def test_friction_factor_of_smooth_pipe_succeeds(self):
+        """Moody chart: Re = 1e5, smooth pipe."""
+        self.assertAlmostEqual(friction_factor(1e5, 0), 0.01799, places=5)
+
+    def test_friction_factor_of_laminar_flow_succeeds(self):
+        numpy.testing.assert_allclose(friction_factor([100, 2000], 0.01), [0.64, 0.032])
+
+    def test_friction_factor_of_zero_reynolds_number_is_infinite(self):
+        self.assertEqual(friction_factor(0, 0.001), numpy.inf)
+
+
+class TestPressureGradient(TestCase):
+    """Unit tests for pressure_gradient function."""
+
+    def test_pressure_gradient_succeeds(self):
+        """R = λ / d * ϱ * v² / 2"""
+        reynolds = reynolds_number(1.0, 0.05, 1e-6)
+        expected = friction_factor(reynolds, 1e-4 / 0.05) / 0.05 * 1000 * 1.0 / 2
+        self.assertAlmostEqual(pressure_gradient(1.0, 0.05, 1e-4, 1000, 1e-6), expected)
+
+    def test_pressure_gradient_of_laminar_flow_is_hagen_poiseuille(self):
+        """R = 32 * ϱ * ν * v / d²"""
+        self.assertAlmostEqual(
+            pressure_gradient(0.01, 0.01, 0, 1000, 1e-6), 32 * 1000 * 1e-6 * 0.01 / 1e-4
+        )
+
+    def test_pressure_gradient_without_flow_is_zero(self):
+        gradients = pressure_gradient(
+            numpy.array([0.0, -1.0, 1.0]), 0.05, 0, 1000, 1e-6
+        )
+        self.assertEqual(gradients[0], 0)
+        self.assertEqual(gradients[1], -gradients[2])
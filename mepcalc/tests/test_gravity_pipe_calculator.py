@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+from unittest import TestCase
+
+import numpy
+from pint import Quantity
+
+from mepcalc.common.gravity_pipe_calculator import (
+    DRAIN_PIPE_SERIES,
+    MAX_SOLVED_FILL_RATIO,
+    STANDARD_GRAVITY,
+    GravityPipeCalculator,
+    cross_section_ratios,
+)
+from mepcalc.common.medium import Medium
+from mepcalc.common.pipe_calculator import NO_SIZE
+from mepcalc.kostra.design_rain import DesignRain
+from mepcalc.tests.kostra_store import shared_store
+
+
+class TestGravityPipeCalculator(TestCase):
+    """Unit tests for GravityPipeCalculator class."""
+
+    def setUp(self):
+        self.medium = Medium(
+            "Test",
+            heat_cap=Quantity(1, "J/(kg K)"),
+            density=Quantity(1000, "kg/m³"),
+            viscosity=Quantity(1.3, "mPa s"),
+        )
+        self.g = GravityPipeCalculator(medium=self.medium)
+        # good inputs
+        self.good_diameter = Quantity(150, "mm")
+        self.good_slope = Quantity(1, "%")
+        self.good_roughness = Quantity(1, "mm")
+        # bad inputs
+        self.bad_volume_flow = Quantity(1, "m³")
+        self.bad_diameter = Quantity(1, "m²")
+        self.bad_slope = Quantity(1, "m")
+        self.bad_fill_ratio = Quantity(1, "m")
+
+    def test_cross_section_ratios_succeed(self):
+        area_ratio, diameter_ratio = cross_section_ratios([0, 0.5, 1])
+        numpy.testing.assert_allclose(area_ratio, [0, 0.5, 1], atol=1e-15)
+        # half and full pipes have the hydraulic diameter of the pipe
+        numpy.testing.assert_allclose(diameter_ratio, [0, 1, 1])
+
+    def test_full_flow_succeeds(self):
+        """V_v = -2 log10(2.51 ν / (d √(2 g d J)) + k / (3.71 d)) √(2 g d J) A"""
+        root = math.sqrt(2 * STANDARD_GRAVITY * 0.15 * 0.01)
+        velocity = -2 * math.log10(2.51 * 1.3e-6 / (0.15 * root) + 1e-3 / 0.5565)
+        expected = velocity * root * math.pi / 4 * 0.15**2
+        volume_flow = self.g.full_flow(self.good_diameter, self.good_slope)
+        self.assertAlmostEqual(volume_flow.m_as("m³/s"), expected)
+        self.assertAlmostEqual(
+            self.g.full_velocity(self.good_diameter, self.good_slope).m_as("m/s"),
+            velocity * root,
+        )
+
+    def test_part_flow_of_full_pipe_is_full_flow(self):
+        self.assertAlmostEqual(
+            self.g.part_flow(self.good_diameter, self.good_slope, Quantity(1, "")).m_as(
+                "l/s"
+            ),
+            self.g.full_flow(self.good_diameter, self.good_slope).m_as("l/s"),
+        )
+        self.assertEqual(
+            self.g.part_flow(self.good_diameter, self.good_slope, Quantity(0, "")).m,
+            0,
+        )
+
+    def test_part_flow_has_maximum_near_94_percent(self):
+        fill_ratios = Quantity(numpy.linspace(0.5, 1, 501), "")
+        flows = self.g.part_flow(self.good_diameter, self.good_slope, fill_ratios)
+        maximum = fill_ratios.m[numpy.argmax(flows.m)]
+        self.assertGreater(maximum, MAX_SOLVED_FILL_RATIO)
+        self.assertLess(maximum, 0.95)
+
+    def test_fill_ratio_inverts_part_flow(self):
+        fill_ratios = numpy.linspace(0.01, MAX_SOLVED_FILL_RATIO, 200)
+        for diameter, slope in [(100, 0.05), (150, 1), (500, 5)]:
+            diameter = Quantity(diameter, "mm")
+            slope = Quantity(slope, "%")
+            flows = self.g.part_flow(diameter, slope, Quantity(fill_ratios, ""))
+            numpy.testing.assert_allclose(
+                self.g.fill_ratio(flows, diameter, slope).m_as(""),
+                fill_ratios,
+                atol=1e-4,
+            )
+
+    def test_fill_ratio_broadcasts_against_diameters(self):
+        diameters = Quantity([[100], [200]], "mm")
+        flows = Quantity([1, 2, 5], "l/s")
+        fill_ratios = self.g.fill_ratio(flows, diameters, self.good_slope)
+        self.assertEqual(fill_ratios.shape, (2, 3))
+        self.assertAlmostEqual(
+            fill_ratios[1, 2].m,
+            self.g.fill_ratio(flows[2], diameters[1, 0], self.good_slope).m,
+        )
+
+    def test_fill_ratio_of_no_and_too_much_flow(self):
+        full_flow = self.g.full_flow(self.good_diameter, self.good_slope)
+        fill_ratios = self.g.fill_ratio(
+            Quantity([0, 1.1 * full_flow.m], full_flow.u),
+            self.good_diameter,
+            self.good_slope,
+        ).m
+        self.assertEqual(fill_ratios[0], 0)
+        self.assertTrue(numpy.isnan(fill_ratios[1]))
+
+    def test_slope_inverts_flows(self):
+        slopes = numpy.geomspace(1e-4, 0.1, 30)
+        flows = self.g.full_flow(self.good_diameter, Quantity(slopes, ""))
+        numpy.testing.assert_allclose(
+            self.g.slope(flows, self.good_diameter).m_as(""), slopes, rtol=1e-12
+        )
+        half = Quantity(0.5, "")
+        flows = self.g.part_flow(self.good_diameter, Quantity(slopes, ""), half)
+        numpy.testing.assert_allclose(
+            self.g.slope(flows, self.good_diameter, half).m_as(""),
+            slopes,
+            rtol=1e-12,
+        )
+
+    def test_nominal_size_matches_linear_search(self):
+        rng = numpy.random.default_rng(16)
+        flows = rng.uniform(0, 200, 500)
+        slopes = rng.choice([0.005, 0.01, 0.02], 500)
+        half = Quantity(0.5, "")
+        sizes = self.g.nominal_size(
+            Quantity(flows, "l/s"), Quantity(slopes, ""), max_fill_ratio=half
+        )
+        for flow, slope, size in zip(flows, slopes, sizes):
+            expected = NO_SIZE
+            for candidate, inner_diameter in sorted(DRAIN_PIPE_SERIES.items()):
+                capacity = self.g.part_flow(
+                    Quantity(inner_diameter, "mm"), Quantity(slope, ""), half
+                )
+                if flow <= capacity.m_as("l/s"):
+                    expected = candidate
+                    break
+            self.assertEqual(size, expected)
+        self.assertIn(NO_SIZE, sizes)
+
+    def test_nominal_size_of_scalar_is_int(self):
+        size = self.g.nominal_size(Quantity(8, "l/s"), self.good_slope)
+        self.assertIsInstance(size, int)
+        self.assertEqual(size, 125)
+
+    def test_rain_flow_succeeds(self):
+        """Q = 300 l/(s ha) * 0.9 * 1000 m² = 27 l/s"""
+        volume_flow = self.g.rain_flow(
+            Quantity(300, "l/(s*ha)"), Quantity(1000, "m²"), Quantity(0.9, "")
+        )
+        self.assertAlmostEqual(volume_flow.m_as("l/s"), 27)
+
+    def test_design_rain_flow_succeeds(self):
+        design_rain = DesignRain(shared_store())
+        volume_flow = self.g.design_rain_flow(
+            design_rain, 52.5065133, 13.1445524, Quantity(1, "ha")
+        )
+        intensity = design_rain.intensity(52.5065133, 13.1445524, 5, 2)
+        self.assertAlmostEqual(volume_flow.m_as("l/s"), intensity)
+
+    def test_bad_dimensions_fail(self):
+        with self.assertRaises(ValueError):
+            self.g.full_flow(self.bad_diameter, self.good_slope)
+        with self.assertRaises(ValueError):
+            self.g.full_flow(self.good_diameter, self.bad_slope)
+        with self.assertRaises(ValueError):
+            self.g.part_flow(self.good_diameter, self.good_slope, self.bad_fill_ratio)
+        with self.assertRaises(ValueError):
+            self.g.fill_ratio(self.bad_volume_flow, self.good_diameter, self.good_slope)
+        with self.assertRaises(ValueError):
+            self.g.slope(self.bad_volume_flow, self.good_diameter)
+        with self.assertRaises(ValueError):
+            self.g.nominal_size(self.bad_volume_flow, self.good_slope)
+        with self.assertRaises(ValueError):
+            self.g.rain_flow(Quantity(1, "mm"), Quantity(1, "m²"))
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import time
+from unittest import TestCase
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+from mepcalc.common.medium import Medium  # noqa: E402
+from mepcalc.common.units import Units, units_map  # noqa: E402
+from mepcalc.gui.base_calculator import (  # noqa: E402
+    BaseCalculatorWidget,
+    FieldSpec,
+    unit_model,
+)
+from mepcalc.gui.heat_calculator_mass import HeatCalculatorMassWidget  # noqa: E402
+
+TIMEOUT = 5.0  # s
+
+
+def application() -> QApplication:
+    """The QApplication, created once for all GUI tests."""
+    return QApplication.instance() or QApplication([])
+
+
+def wait_until(condition, timeout: float = TIMEOUT) -> bool:
+    """Process events until condition() holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        application().processEvents()
+        time.sleep(0.001)
+    return True
+
+
+class CalculatorWidgetTestCase(TestCase):
+    """Base class of calculator widget tests, with helpers to edit fields and
+    to wait for the calculations."""
+
+    widget_class = HeatCalculatorMassWidget
+    medium = Medium.water()
+
+    def setUp(self):
+        application()
+        self.widget = self.widget_class(medium=self.medium)
+        self.wait_for_calculations()
+
+    def tearDown(self):
+        self.wait_for_calculations()
+        self.widget.deleteLater()
+
+    def wait_for_calculations(self):
+        """Wait until all started calculations have reported back."""
+        self.assertTrue(wait_until(lambda: not self.widget.pending))
+
+    def edit(self, name: str, text: str):
+        """Type text into a field, as the user does."""
+        edit = self.widget.rows[name].edit
+        edit.setText(text)
+        edit.textEdited.emit(text)
+
+    def select_output(self, name: str):
+        """Select the output field."""
+        self.widget.rows[name].radio.setChecked(True)
+        self.wait_for_calculations()
+
+    def recalculate(self):
+        """Recalculate now, instead of after the debounce delay."""
+        self.widget.recalculate()
+        self.wait_for_calculations()
+
+    def text(self, name: str) -> str:
+        """Text of a field."""
+        return self.widget.rows[name].edit.text()
+
+
+class TestRecalculation(CalculatorWidgetTestCase):
+    """Unit tests for the debounced recalculation in worker threads."""
+
+    def test_edits_recalculate_once_after_delay(self):
+        generation = self.widget.generation
+        for text in ("2", "20", "200"):
+            self.edit("mass_flow", text)
+        self.assertTrue(self.widget.recalculation_timer.isActive())
+        self.assertEqual(self.widget.generation, generation)
+        self.assertTrue(wait_until(lambda: self.widget.generation > generation))
+        self.wait_for_calculations()
+        self.assertEqual(self.widget.generation, generation + 1)
+        self.assertAlmostEqual(float(self.text("heat_flow")), 200 * 4.184)
+
+    def test_stale_results_are_dropped(self):
+        self.recalculate()
+        heat_flow = self.text("heat_flow")
+        stale = self.widget.generation - 1
+        self.widget.calculation_finished(stale, {"heat_flow": self.medium.density})
+        self.widget.calculation_failed(stale, "stale")
+        self.assertEqual(self.text("heat_flow"), heat_flow)
+        self.assertIsNone(self.widget.error)
+
+    def test_incomplete_number_starts_no_calculation(self):
+        generation = self.widget.generation
+        for text in ("-", ".", "1e"):
+            self.edit("mass_flow", text)
+            self.recalculate()
+            self.assertEqual(self.widget.generation, generation)
+            self.assertFalse(self.widget.pending)
+
+    def test_failed_calculation_clears_outputs_and_shows_error(self):
+        self.edit("heat_flow", "10")
+        self.select_output("mass_flow")
+        self.assertNotEqual(self.text("mass_flow"), "")
+        self.edit("temp_diff", "0")
+        self.recalculate()
+        self.assertEqual(self.widget.error, "float division by zero")
+        self.assertIn(self.widget.error, self.widget.status.text())
+        self.assertEqual(self.text("mass_flow"), "")
+        self.assertEqual(self.text("volume_flow"), "")
+        self.edit("temp_diff", "5")
+        self.recalculate()
+        self.assertIsNone(self.widget.error)
+        self.assertEqual(self.widget.status.text(), "")
+        self.assertAlmostEqual(float(self.text("mass_flow")), 10 / (4.184 * 5), 5)
+
+
+class LengthSumWidget(BaseCalculatorWidget):
+    """Calculator widget without graph, the total is the sum of the parts."""
+
+    FIELDS = (
+        FieldSpec("total", "Total", "l", Units.Length),
+        FieldSpec("first", "First", "l₁", Units.Length, "First Part"),
+        FieldSpec("second", "Second", "l₂", Units.Length),
+    )
+
+    def calculate_total(self, inputs, medium):
+        """Calculate total."""
+        return {"total": inputs["first"] + inputs["second"]}
+
+    def calculate_first(self, inputs, medium):
+        """Calculate first part."""
+        return {"first": inputs["total"] - inputs["second"]}
+
+    def calculate_second(self, inputs, medium):
+        """Calculate second part."""
+        return {"second": inputs["total"] - inputs["first"]}
+
+
+class TestFields(CalculatorWidgetTestCase):
+    """Unit tests for the widgets generated from the FIELDS table."""
+
+    widget_class = LengthSumWidget
+
+    def test_rows_follow_fields(self):
+        self.assertEqual(list(self.widget.rows), ["total", "first", "second"])
+        first = self.widget.rows["first"]
+        self.assertEqual(first.label.text(), "First")
+        self.assertEqual(first.symbol.text(), "l₁")
+        self.assertEqual(first.edit.placeholderText(), "First Part")
+        self.assertEqual(self.widget.rows["second"].edit.placeholderText(), "Second")
+        self.assertEqual(
+            [first.combo.itemText(i) for i in range(first.combo.count())],
+            units_map[Units.Length],
+        )
+
+    def test_combo_boxes_share_unit_models(self):
+        other = LengthSumWidget(medium=self.medium)
+        self.addCleanup(other.deleteLater)
+        self.assertIs(self.widget.rows["first"].combo.model(), unit_model(Units.Length))
+        self.assertIs(other.rows["total"].combo.model(), unit_model(Units.Length))
+
+    def test_first_field_is_output(self):
+        self.assertIs(self.widget.output(), LengthSumWidget.FIELDS[0])
+        self.assertFalse(self.widget.rows["total"].edit.isEnabled())
+        self.assertTrue(self.widget.rows["first"].edit.isEnabled())
+
+    def test_output_dispatches_to_calculate_method(self):
+        self.assertEqual(float(self.text("total")), 2)
+        self.select_output("second")
+        self.assertTrue(self.widget.rows["total"].edit.isEnabled())
+        self.assertFalse(self.widget.rows["second"].edit.isEnabled())
+        self.edit("total", "5")
+        self.recalculate()
+        self.assertEqual(float(self.text("second")), 4)
+
+    def test_results_in_selected_units(self):
+        self.widget.rows["total"].combo.setCurrentText("mm")
+        self.recalculate()
+        self.assertEqual(float(self.text("total")), 2000)
+
+
+class TestDerivedFields(CalculatorWidgetTestCase):
+    """Unit tests for DERIVED fields."""
+
+    def test_derived_fields_are_never_inputs_nor_outputs(self):
+        volume_flow = self.widget.rows["volume_flow"]
+        for output in ("heat_flow", "mass_flow", "temp_diff"):
+            self.select_output(output)
+            self.assertFalse(volume_flow.radio.isEnabled())
+            self.assertFalse(volume_flow.edit.isEnabled())
+            self.assertNotEqual(self.text("volume_flow"), "1.0")
+
+
+class TestUnitSelection(CalculatorWidgetTestCase):
+    """Unit tests for switching the unit of a field."""
+
+    def select_unit(self, name: str, unit: str):
+        """Select the unit of a field and wait for the recalculation."""
+        self.widget.rows[name].combo.setCurrentText(unit)
+        self.recalculate()
+
+    def test_output_shows_selected_unit(self):
+        heat_flow = float(self.text("heat_flow"))
+        self.select_unit("heat_flow", "W")
+        self.assertAlmostEqual(float(self.text("heat_flow")), heat_flow * 1000, 3)
+        self.select_unit("heat_flow", "MW")
+        self.assertAlmostEqual(float(self.text("heat_flow")), heat_flow / 1000)
+
+    def test_input_is_read_in_selected_unit(self):
+        heat_flow = float(self.text("heat_flow"))
+        self.select_unit("mass_flow", "g/s")
+        self.assertAlmostEqual(float(self.text("heat_flow")), heat_flow / 1000)
+        self.select_unit("mass_flow", "kg/min")
+        self.assertAlmostEqual(float(self.text("heat_flow")), heat_flow / 60)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from mepcalc.common.equation_graph import FLOW_GRAPH  # noqa: E402
+from mepcalc.common.medium import Medium  # noqa: E402
+from mepcalc.gui.duct_calculator_rectangular import (  # noqa: E402
+    DuctCalculatorRectangularWidget,
+)
+from mepcalc.gui.duct_calculator_round import DuctCalculatorRoundWidget  # noqa: E402
+from mepcalc.tests.test_gui_base_calculator import (  # noqa: E402
+    CalculatorWidgetTestCase,
+)
+
+
+class TestDuctCalculatorRectangularWidget(CalculatorWidgetTestCase):
+    """Unit tests for the rectangular duct calculator widget."""
+
+    widget_class = DuctCalculatorRectangularWidget
+    medium = Medium.air()
+
+    def test_only_flows_are_outputs(self):
+        for name in ("width", "height", "area", "mass_flow"):
+            self.assertFalse(self.widget.rows[name].radio.isEnabled(), name)
+        for name in ("volume_flow", "velocity"):
+            self.assertTrue(self.widget.rows[name].radio.isEnabled(), name)
+        self.assertEqual(self.widget.output().name, "volume_flow")
+
+    def test_volume_flow_succeeds(self):
+        """V = v * B * H = 1 m/s * 1 m * 1 m = 3600 m³/h"""
+        self.assertEqual(float(self.text("area")), 1)
+        self.assertAlmostEqual(float(self.text("volume_flow")), 3600)
+        self.assertAlmostEqual(
+            float(self.text("mass_flow")), self.medium.density.m_as("kg/m³"), 5
+        )
+
+    def test_velocity_succeeds(self):
+        """v = V / (B * H) = 1 m³/s / (0.5 m * 1 m) = 2 m/s"""
+        self.select_output("velocity")
+        self.edit("volume_flow", "3600")
+        self.edit("width", "0.5")
+        self.recalculate()
+        self.assertAlmostEqual(float(self.text("velocity")), 2)
+        self.assertAlmostEqual(float(self.text("area")), 0.5)
+
+    def test_edit_updates_previous_solution(self):
+        solution = self.widget.solution
+        self.edit("width", "2")
+        inputs = self.widget.read_inputs()
+        medium = self.medium.freeze()
+        calculation = self.widget.calculation(inputs, medium)
+        self.assertEqual(calculation.func, solution.updated)
+        self.assertEqual(calculation.keywords, {"width": inputs["width"]})
+        unknown = ("volume_flow", "area", "mass_flow")
+        known = {name: value for name, value in inputs.items() if name not in unknown}
+        expected = FLOW_GRAPH.solve(medium, unknown, **known).results
+        results = calculation().results
+        self.assertEqual(set(results), set(expected))
+        for name, value in expected.items():
+            self.assertAlmostEqual(results[name].m_as(value.units), value.magnitude)
+        self.recalculate()
+        self.assertAlmostEqual(float(self.text("volume_flow")), 7200)
+
+    def test_output_change_solves_anew(self):
+        self.widget.rows["velocity"].radio.setChecked(True)
+        calculation = self.widget.calculation(
+            self.widget.read_inputs(), self.medium.freeze()
+        )
+        self.assertEqual(calculation.func, FLOW_GRAPH.solve)
+        self.wait_for_calculations()
+
+
+class TestDuctCalculatorRoundWidget(CalculatorWidgetTestCase):
+    """Unit tests for the round duct calculator widget."""
+
+    widget_class = DuctCalculatorRoundWidget
+    medium = Medium.air()
+
+    def test_volume_flow_succeeds(self):
+        """V = v * pi/4 * D^2 = 1 m/s * pi/4 * (1 m)^2 = 900 pi m³/h"""
+        self.assertFalse(self.widget.rows["diameter"].radio.isEnabled())
+        self.assertAlmostEqual(float(self.text("area")), math.pi / 4, 5)
+        self.assertAlmostEqual(float(self.text("volume_flow")), 900 * math.pi, 1)
@@ -3,6 +3,7 @@
 
 from unittest import TestCase
 
+import numpy
 from pint import Quantity
 
 from mepcalc.common.medium import Medium
@@ -207,3 +208,99 @@ class TestHeatCalculator(TestCase):
             self.q.temp_diff_from_volume_flow(
                 heat_flow=self.bad_heat_flow, volume_flow=self.good_volume_flow
             )
+
+
+class TestHeatCalculatorBatch(TestCase):
+    """Unit tests for HeatCalculator batch calculations."""
+
+    def setUp(self):
+        self.q = HeatCalculator(medium=Medium.water())
+        rng = numpy.random.default_rng(42)
+        self.heat_flow = (rng.uniform(0.1, 100.0, 100), "kW")
+        self.mass_flow = (rng.uniform(0.1, 10.0, 100), "kg/h")
+        self.volume_flow = (rng.uniform(0.1, 10.0, 100), "m³/h")
+        self.temp_diff = (rng.uniform(1.0, 20.0, 100), "K")
+
+    def assert_batch_matches_scalar(self, formula, unit, **columns):
+        """Check batch results are bit for bit identical to scalar results."""
+        results = self.q.batch(formula, unit=unit, **columns)
+        method = getattr(self.q, formula)
+        for row, result in enumerate(results):
+            inputs = {
+                name: Quantity(magnitudes[row], column_unit)
+                for name, (magnitudes, column_unit) in columns.items()
+            }
+            self.assertEqual(result, method(**inputs, unit=unit).magnitude)
+
+    def test_heat_flow_from_mass_flow_batch_succeeds(self):
+        self.assert_batch_matches_scalar(
+            "heat_flow_from_mass_flow",
+            "kW",
+            mass_flow=self.mass_flow,
+            temp_diff=self.temp_diff,
+        )
+
+    def test_heat_flow_from_volume_flow_batch_succeeds(self):
+        self.assert_batch_matches_scalar(
+            "heat_flow_from_volume_flow",
+            "kW",
+            volume_flow=self.volume_flow,
+            temp_diff=self.temp_diff,
+        )
+
+    def test_mass_flow_from_heat_flow_batch_succeeds(self):
+        self.assert_batch_matches_scalar(
+            "mass_flow_from_heat_flow",
+            "kg/h",
+            heat_flow=self.heat_flow,
+            temp_diff=self.temp_diff,
+        )
+
+    def test_mass_flow_from_volume_flow_batch_succeeds(self):
+        self.assert_batch_matches_scalar(
+            "mass_flow_from_volume_flow", "kg/h", volume_flow=self.volume_flow
+        )
+
+    def test_volume_flow_from_heat_flow_batch_succeeds(self):
+        self.assert_batch_matches_scalar(
+            "volume_flow_from_heat_flow",
+            "m³/h",
+            heat_flow=self.heat_flow,
+            temp_diff=self.temp_diff,
+        )
+
+    def test_volume_flow_from_mass_flow_batch_succeeds(self):
+        self.assert_batch_matches_scalar(
+            "volume_flow_from_mass_flow", "m³/h", mass_flow=self.mass_flow
+        )
+
+    def test_temp_diff_from_mass_flow_batch_succeeds(self):
+        self.assert_batch_matches_scalar(
+            "temp_diff_from_mass_flow",
+            "K",
+            heat_flow=self.heat_flow,
+            mass_flow=self.mass_flow,
+        )
+
+    def test_temp_diff_from_volume_flow_batch_succeeds(self):
+        self.assert_batch_matches_scalar(
+            "temp_diff_from_volume_flow",
+            "K",
+            heat_flow=self.heat_flow,
+            volume_flow=self.volume_flow,
+        )
+
+    def test_batch_accepts_array_quantities(self):
+        results = self.q.batch(
+            "volume_flow_from_mass_flow",
+            mass_flow=Quantity(self.mass_flow[0], self.mass_flow[1]),
+        )
+        self.assertEqual(results.shape, (100,))
+
+    def test_batch_fails_on_bad_column(self):
+        with self.assertRaises(ValueError):
+            self.q.batch(
+                "heat_flow_from_mass_flow",
+                mass_flow=self.volume_flow,
+                temp_diff=self.temp_diff,
+            )
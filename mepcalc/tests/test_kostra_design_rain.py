@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+import numpy
+
+from mepcalc.kostra.design_rain import DesignRain
+from mepcalc.kostra.store import NO_DATA
+from mepcalc.tests.kostra_store import shared_store
+
+
+class TestDesignRain(TestCase):
+    """Unit tests for DesignRain class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.store = shared_store()
+        cls.design_rain = DesignRain(cls.store)
+        rng = numpy.random.default_rng(14)
+        cls.cells = rng.choice(len(cls.store.index_rc), 1000)
+        centers = numpy.asarray(cls.store.centers)[cls.cells]
+        cls.longitude, cls.latitude = centers[:, 0], centers[:, 1]
+
+    def test_intensity_succeeds(self):
+        """Berlin, as in the KostraRain notebook."""
+        self.assertAlmostEqual(
+            self.design_rain.intensity(52.5065133, 13.1445524, 15, 100),
+            self.store.intensity(35060, 15, 100),
+        )
+
+    def test_intensities_match_store_lookups(self):
+        index_rc = self.store.index_rc[self.cells]
+        intensities = self.design_rain.intensity(self.latitude, self.longitude, 5, 5)
+        numpy.testing.assert_array_equal(
+            intensities, self.store.intensity(index_rc, 5, 5)
+        )
+        for value, cell in zip(intensities[:20], index_rc[:20]):
+            numpy.testing.assert_equal(value, self.store.intensity(cell, 5, 5))
+
+    def test_durations_and_return_periods_per_site(self):
+        durations = numpy.where(numpy.arange(1000) % 2, 5, 15)
+        return_periods = numpy.where(numpy.arange(1000) % 2, 5, 100)
+        depths = self.design_rain.depth(
+            self.latitude, self.longitude, durations, return_periods
+        )
+        index_rc = self.store.index_rc[self.cells]
+        numpy.testing.assert_array_equal(
+            depths, self.store.depth(index_rc, durations, return_periods)
+        )
+
+    def test_sites_broadcast_against_durations(self):
+        intensities = self.design_rain.intensity(
+            self.latitude[:, None], self.longitude[:, None], [5, 15], [5, 100]
+        )
+        self.assertEqual(intensities.shape, (1000, 2))
+        numpy.testing.assert_array_equal(
+            intensities[:, 1],
+            self.design_rain.intensity(self.latitude, self.longitude, 15, 100),
+        )
+
+    def test_shape_mismatch_fails(self):
+        """Three sites against two durations, instead of sites[:, None]."""
+        with self.assertRaises(ValueError):
+            self.design_rain.intensity(
+                self.latitude[:3], self.longitude[:3], [5, 15], [5, 100]
+            )
+        with self.assertRaises(ValueError):
+            self.design_rain.depth(self.latitude[:3], self.longitude[:2], 60, 10)
+
+    def test_depth_in_unit_succeeds(self):
+        numpy.testing.assert_allclose(
+            self.design_rain.depth(self.latitude, self.longitude, 60, 10, unit="m"),
+            self.design_rain.depth(self.latitude, self.longitude, 60, 10) / 1000,
+            rtol=1e-6,
+        )
+
+    def test_sites_without_data_give_nan(self):
+        """Paris lies outside the raster, cell 0 has no data."""
+        self.assertEqual(self.design_rain.slot(48.86, 2.35), NO_DATA)
+        latitude, longitude = self.store.centers[0, 1], self.store.centers[0, 0]
+        depths = self.design_rain.depth([48.86, latitude], [2.35, longitude], 60, 10)
+        self.assertTrue(numpy.isnan(depths).all())
+
+    def test_lookup_fails_on_untabulated_duration(self):
+        with self.assertRaises(ValueError):
+            self.design_rain.intensity(self.latitude, self.longitude, [5, 7], 5)
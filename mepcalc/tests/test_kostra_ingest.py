@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import numpy
+
+from mepcalc.kostra.ingest import (
+    ALL_DEPTHS_FILE_NAME,
+    ORIGINAL_DIRECTORY,
+    ingest,
+    ingest_depths,
+    original_file_name,
+    read_chunks,
+)
+from mepcalc.kostra.store import STORE_FILES, KostraStore
+from mepcalc.tests.kostra_store import shared_store
+
+
+class TestIngest(TestCase):
+    """Unit tests for the ingest of the original KOSTRA files."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.path = Path(cls.directory.name)
+        cls.expected = shared_store()
+        ingest(store_directory=cls.path / "ingested", workers=2)
+        cls.store = KostraStore(cls.path / "ingested")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.cleanup()
+
+    def test_ingest_writes_all_store_files(self):
+        for name in STORE_FILES:
+            self.assertTrue((self.path / "ingested" / name).exists())
+        self.assertFalse((self.path / "ingested" / ALL_DEPTHS_FILE_NAME).exists())
+
+    def test_ingest_matches_cleaned_csv_files(self):
+        numpy.testing.assert_array_equal(self.store.hn, self.expected.hn)
+        numpy.testing.assert_array_equal(self.store.slots, self.expected.slots)
+        numpy.testing.assert_array_equal(self.store.index_rc, self.expected.index_rc)
+        numpy.testing.assert_array_equal(self.store.centers, self.expected.centers)
+        numpy.testing.assert_array_equal(self.store.corners, self.expected.corners)
+
+    def test_missing_depths_are_nan(self):
+        self.assertTrue(numpy.isnan(self.store.depth(0, 5, 1)))
+        self.assertAlmostEqual(self.store.depth(2022, 5, 1), 5.1, places=5)
+
+    def test_read_chunks_in_small_chunks_succeeds(self):
+        path = ORIGINAL_DIRECTORY / original_file_name(60)
+        chunks = list(read_chunks(path, range(10), chunk_bytes=4096))
+        self.assertGreater(len(chunks), 1)
+        table = numpy.concatenate(chunks)
+        numpy.testing.assert_array_equal(
+            table, numpy.concatenate(list(read_chunks(path, range(10))))
+        )
+        self.assertEqual(table.shape, (len(self.store.index_rc), 10))
+
+    def test_ingest_depths_fails_on_unexpected_columns(self):
+        source = self.path / "bad.csv"
+        shutil.copy(ORIGINAL_DIRECTORY / original_file_name(5), source)
+        text = source.read_text().replace("HN_100A", "HN_200A", 1)
+        source.write_text(text)
+        with self.assertRaises(ValueError):
+            ingest_depths(source, self.path / "ingested" / "hn.npy", 0)
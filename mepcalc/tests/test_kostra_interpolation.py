@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+import numpy
+
+from mepcalc.kostra.interpolation import DepthInterpolator
+from mepcalc.kostra.store import DURATIONS, NO_CELL, RETURN_PERIODS
+from mepcalc.tests.kostra_store import shared_store
+
+
+class TestDepthInterpolator(TestCase):
+    """Unit tests for DepthInterpolator class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.store = shared_store()
+        cls.interpolator = DepthInterpolator(cls.store)
+
+    def test_depth_reproduces_tables(self):
+        index_rc = self.store.data_index_rc[:, None, None]
+        durations = numpy.array(DURATIONS)[:, None]
+        depths = self.interpolator.depth(index_rc, durations, RETURN_PERIODS)
+        numpy.testing.assert_allclose(depths, self.store.hn, rtol=1e-6)
+
+    def test_depth_matches_store_at_tabulated_points(self):
+        """E.g. 5.1 mm at 5 min and 1 a."""
+        self.assertAlmostEqual(
+            self.interpolator.depth(2022, 5, 1), self.store.depth(2022, 5, 1)
+        )
+        self.assertAlmostEqual(self.interpolator.depth(2022, 5, 1), 5.1, places=5)
+
+    def test_depth_of_cells_without_data_is_nan(self):
+        depths = self.interpolator.depth([0, 2022], 60, 10)
+        self.assertTrue(numpy.isnan(depths[0]))
+        self.assertFalse(numpy.isnan(depths[1]))
+
+    def test_depth_of_no_cell_is_nan(self):
+        depths = self.interpolator.depth([NO_CELL, 2022], [60, 75], 10)
+        self.assertTrue(numpy.isnan(depths[0]))
+        self.assertFalse(numpy.isnan(depths[1]))
+        self.assertTrue(numpy.isnan(self.interpolator.intensity(NO_CELL, 60, 10)))
+
+    def test_depth_fails_outside_raster(self):
+        with self.assertRaises(ValueError):
+            self.interpolator.depth(1079, 60, 10)
+
+    def test_depth_succeeds(self):
+        self.assertAlmostEqual(self.interpolator.depth(2022, 60, 10), 29.8, places=5)
+
+    def test_depth_between_durations_is_log_log_linear(self):
+        lower = self.interpolator.depth(2022, 60, 10)
+        upper = self.interpolator.depth(2022, 90, 10)
+        expected = lower * (upper / lower) ** (numpy.log(75 / 60) / numpy.log(90 / 60))
+        self.assertAlmostEqual(self.interpolator.depth(2022, 75, 10), expected)
+
+    def test_depth_between_return_periods_is_log_linear(self):
+        lower = self.interpolator.depth(2022, 60, 10)
+        upper = self.interpolator.depth(2022, 60, 20)
+        expected = lower + (upper - lower) * numpy.log(15 / 10) / numpy.log(20 / 10)
+        self.assertAlmostEqual(self.interpolator.depth(2022, 60, 15), expected)
+
+    def test_depth_increases_with_duration_and_return_period(self):
+        durations = numpy.geomspace(5, 4320, 50)[:, None]
+        return_periods = numpy.geomspace(1, 100, 50)
+        depths = self.interpolator.depth(35060, durations, return_periods)
+        self.assertTrue(numpy.all(numpy.diff(depths, axis=0) > 0))
+        self.assertTrue(numpy.all(numpy.diff(depths, axis=1) > 0))
+
+    def test_depth_in_unit_succeeds(self):
+        self.assertAlmostEqual(
+            self.interpolator.depth(2022, 75, 10, unit="cm"),
+            self.interpolator.depth(2022, 75, 10) / 10,
+        )
+
+    def test_intensity_matches_store(self):
+        durations = numpy.array(DURATIONS)[:, None]
+        intensities = self.interpolator.intensity(52040, durations, RETURN_PERIODS)
+        numpy.testing.assert_allclose(
+            intensities, self.store.cell_intensities(52040), rtol=1e-6
+        )
+
+    def test_intensity_in_unit_succeeds(self):
+        self.assertAlmostEqual(
+            self.interpolator.intensity(2022, 75, 10, unit="mm/min"),
+            self.interpolator.depth(2022, 75, 10) / 75,
+        )
+
+    def test_vectorized_depth_matches_scalar_depth(self):
+        index_rc = numpy.array([2022, 35060, 52040])
+        durations = numpy.array([7.5, 100, 3000])
+        return_periods = numpy.array([1.5, 25, 100])
+        depths = self.interpolator.depth(index_rc, durations, return_periods)
+        for depth, arguments in zip(depths, zip(index_rc, durations, return_periods)):
+            self.assertEqual(depth, self.interpolator.depth(*arguments))
+
+    def test_depth_fails_outside_tabulated_durations(self):
+        with self.assertRaises(ValueError):
+            self.interpolator.depth(2022, 4, 10)
+        with self.assertRaises(ValueError):
+            self.interpolator.depth(2022, [60, 5000], 10)
+
+    def test_depth_fails_outside_tabulated_return_periods(self):
+        with self.assertRaises(ValueError):
+            self.interpolator.depth(2022, 60, 0.5)
+        with self.assertRaises(ValueError):
+            self.interpolator.depth(2022, 60, 200)
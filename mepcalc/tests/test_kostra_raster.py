@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+import numpy
+
+from mepcalc.kostra.raster import NO_CELL, RasterIndex
+from mepcalc.tests.kostra_store import shared_store
+
+
+class TestRasterIndex(TestCase):
+    """Unit tests for RasterIndex class."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.store = shared_store()
+        cls.index = RasterIndex.from_store(cls.store)
+
+    def brute_force_nearest(self, latitude, longitude):
+        points = self.index.project(latitude, longitude)
+        deltas = self.index.points[None, :, :] - points[:, None, :]
+        distances = (deltas**2).sum(axis=-1)
+        nearest = distances.argmin(axis=1)
+        within = distances.min(axis=1) <= self.index.bin_size**2
+        return numpy.where(within, self.store.index_rc[nearest], NO_CELL)
+
+    def test_nearest_succeeds(self):
+        """Berlin, as in the KostraRain notebook."""
+        self.assertEqual(self.index.nearest(52.5065133, 13.1445524), 35060)
+
+    def test_cell_centers_resolve_to_their_cells(self):
+        longitude, latitude = self.store.centers[:, 0], self.store.centers[:, 1]
+        numpy.testing.assert_array_equal(
+            self.index.nearest(latitude, longitude), self.store.index_rc
+        )
+
+    def test_batch_matches_brute_force(self):
+        rng = numpy.random.default_rng(7)
+        latitude = rng.uniform(46.0, 56.0, 5000)
+        longitude = rng.uniform(4.0, 17.0, 5000)
+        numpy.testing.assert_array_equal(
+            self.index.nearest(latitude, longitude),
+            self.brute_force_nearest(latitude, longitude),
+        )
+
+    def test_batch_keeps_shape(self):
+        latitude = numpy.full((2, 3), 52.5)
+        longitude = numpy.full((2, 3), 13.4)
+        self.assertEqual(self.index.nearest(latitude, longitude).shape, (2, 3))
+
+    def test_coordinates_outside_raster_give_no_cell(self):
+        self.assertEqual(self.index.nearest(40.7, -74.0), NO_CELL)  # New York
+        self.assertEqual(self.index.nearest(48.86, 2.35), NO_CELL)  # Paris
+
+    def brute_force_containing(self, latitude, longitude):
+        points = self.index.project(latitude, longitude)
+        corners = self.index.corners[:-1]
+        edges = numpy.roll(corners, -1, axis=1) - corners
+        offsets = points[:, None, None, :] - corners[None]
+        cross = (
+            edges[None, ..., 0] * offsets[..., 1]
+            - edges[None, ..., 1] * offsets[..., 0]
+        )
+        inside = (cross >= 0).all(axis=-1) | (cross <= 0).all(axis=-1)
+        return numpy.where(
+            inside.any(axis=1), self.store.index_rc[inside.argmax(axis=1)], NO_CELL
+        )
+
+    def test_containing_succeeds(self):
+        self.assertEqual(self.index.containing(52.5065133, 13.1445524), 35060)
+
+    def test_cell_centers_are_contained_in_their_cells(self):
+        longitude, latitude = self.store.centers[:, 0], self.store.centers[:, 1]
+        numpy.testing.assert_array_equal(
+            self.index.containing(latitude, longitude), self.store.index_rc
+        )
+
+    def test_containing_batch_matches_brute_force(self):
+        rng = numpy.random.default_rng(11)
+        latitude = rng.uniform(46.0, 56.0, 2000)
+        longitude = rng.uniform(4.0, 17.0, 2000)
+        numpy.testing.assert_array_equal(
+            self.index.containing(latitude, longitude),
+            self.brute_force_containing(latitude, longitude),
+        )
+
+    def test_containing_differs_from_nearest_near_borders(self):
+        """Near cell borders the nearest center is not always the right cell."""
+        rng = numpy.random.default_rng(13)
+        cells = rng.integers(0, len(self.store.index_rc), 5000)
+        corners = self.store.corners[cells]
+        # random points concentrated towards the cells' corners and edges
+        weights = rng.dirichlet([0.3] * 4, len(cells))
+        points = numpy.einsum("ijk,ij->ik", corners, weights)
+        latitude, longitude = points[:, 1], points[:, 0]
+        containing = self.index.containing(latitude, longitude)
+        numpy.testing.assert_array_equal(containing, self.store.index_rc[cells])
+        nearest = self.index.nearest(latitude, longitude)
+        self.assertTrue(numpy.any(nearest != containing))
+
+    def test_containing_outside_raster_gives_no_cell(self):
+        self.assertEqual(self.index.containing(48.86, 2.35), NO_CELL)
+
+    def test_containing_fails_without_corners(self):
+        index = RasterIndex(self.store.centers, self.store.index_rc)
+        with self.assertRaises(ValueError):
+            index.containing(52.5, 13.4)
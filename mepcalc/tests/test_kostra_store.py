@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+from unittest import TestCase
+
+import numpy
+from pint import Quantity
+
+from mepcalc import ureg
+from mepcalc.kostra.store import (
+    CELLS,
+    DATA_DIRECTORY,
+    DURATIONS,
+    INTENSITY_FACTOR,
+    NO_CELL,
+    NO_DATA,
+    RETURN_PERIODS,
+    STORE_FORMAT_VERSION,
+    cell_position,
+    store_format_version,
+    store_is_current,
+)
+from mepcalc.tests.kostra_store import shared_store, shared_store_directory
+
+
+class TestCellPosition(TestCase):
+    """Unit tests for cell_position function."""
+
+    def test_cell_position_succeeds(self):
+        self.assertEqual(cell_position(0), 0)
+        self.assertEqual(cell_position(78), 78)
+        self.assertEqual(cell_position(1000), 79)
+        self.assertEqual(cell_position(106078), CELLS - 1)
+
+    def test_cell_position_of_array_succeeds(self):
+        positions = cell_position(numpy.array([1000, 2022]))
+        numpy.testing.assert_array_equal(positions, [79, 180])
+
+    def test_cell_position_fails_outside_raster(self):
+        """NO_CELL, column overflow (not aliased into the next row), row
+        overflow."""
+        for index_rc in (NO_CELL, 1079, 107000, [0, 1079]):
+            with self.subTest(index_rc=index_rc), self.assertRaises(ValueError):
+                cell_position(index_rc)
+
+
+class TestKostraStore(TestCase):
+    """Unit tests for the KOSTRA binary store."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.store_directory = shared_store_directory()
+        cls.store = shared_store()
+
+    def test_store_shape(self):
+        cells = len(self.store.data_index_rc)
+        self.assertEqual(
+            self.store.hn.shape, (cells, len(DURATIONS), len(RETURN_PERIODS))
+        )
+        self.assertEqual(self.store.hn.dtype, numpy.float32)
+        self.assertIsInstance(self.store.hn, numpy.memmap)
+        self.assertEqual(self.store.slots.shape, (CELLS,))
+
+    def test_store_holds_cells_with_data_only(self):
+        """About a third of the raster lies outside Germany."""
+        self.assertFalse(numpy.isnan(self.store.hn).any())
+        self.assertEqual(numpy.count_nonzero(self.store.slots != NO_DATA), 5405)
+        numpy.testing.assert_array_equal(
+            self.store.slot(self.store.data_index_rc), numpy.arange(5405)
+        )
+
+    def test_store_is_current(self):
+        self.assertTrue(store_is_current(store_directory=self.store_directory))
+
+    def test_store_is_outdated_by_newer_csv_files(self):
+        hn_file = self.store_directory / "hn.npy"
+        modified = hn_file.stat().st_mtime
+        os.utime(hn_file, (0, 0))
+        try:
+            self.assertFalse(store_is_current(store_directory=self.store_directory))
+        finally:
+            os.utime(hn_file, (modified, modified))
+
+    def test_store_is_outdated_by_other_format_version(self):
+        metadata_file = self.store_directory / "metadata.json"
+        metadata = metadata_file.read_text()
+        self.assertEqual(
+            store_format_version(self.store_directory), STORE_FORMAT_VERSION
+        )
+        try:
+            metadata_file.write_text('{"format_version": 0}')
+            self.assertFalse(store_is_current(store_directory=self.store_directory))
+            metadata_file.unlink()
+            self.assertIsNone(store_format_version(self.store_directory))
+            self.assertFalse(store_is_current(store_directory=self.store_directory))
+        finally:
+            metadata_file.write_text(metadata)
+
+    def test_depth_matches_csv_file(self):
+        table = numpy.loadtxt(DATA_DIRECTORY / "d0060.csv", delimiter=",", skiprows=1)
+        (row,) = numpy.nonzero(table[:, 0] == 52040)[0]
+        for return_period_index, return_period in enumerate(RETURN_PERIODS):
+            self.assertAlmostEqual(
+                self.store.depth(52040, 60, return_period),
+                table[row, 1 + return_period_index],
+                places=5,
+            )
+
+    def test_cell_depths_succeeds(self):
+        depths = self.store.cell_depths(2022)
+        self.assertEqual(depths.shape, (len(DURATIONS), len(RETURN_PERIODS)))
+        self.assertAlmostEqual(depths[0, 0], 5.1, places=5)
+        self.assertAlmostEqual(depths[-1, -1], 94.9, places=5)
+
+    def test_depth_in_unit_succeeds(self):
+        self.assertAlmostEqual(
+            self.store.depth(2022, 60, 10, unit="m"),
+            self.store.depth(2022, 60, 10) / 1000,
+        )
+
+    def test_intensity_matches_depth(self):
+        """r = hN / D converted with pint."""
+        depth = Quantity(self.store.depth(52040, 15, 5), "mm")
+        expected = (depth / Quantity(15, "min")).to("l/(s*ha)").magnitude
+        self.assertAlmostEqual(
+            self.store.intensity(52040, 15, 5), expected, delta=1e-5 * expected
+        )
+
+    def test_intensity_in_unit_succeeds(self):
+        intensity = self.store.intensity(52040, 60, 10)
+        depth = self.store.depth(52040, 60, 10)
+        self.assertAlmostEqual(
+            self.store.intensity(52040, 60, 10, unit=ureg.mm / ureg.hour),
+            depth,
+            places=4,
+        )
+        self.assertAlmostEqual(
+            self.store.intensity(52040, 60, 10, unit="l/(s*m²)"),
+            intensity / 10000,
+        )
+
+    def test_intensity_fails_on_unit_of_wrong_dimensionality(self):
+        with self.assertRaises(ValueError):
+            self.store.intensity(52040, 60, 10, unit="mm")
+
+    def test_cell_intensities_succeeds(self):
+        intensities = self.store.cell_intensities(2022)
+        numpy.testing.assert_allclose(
+            intensities,
+            self.store.cell_depths(2022)
+            * INTENSITY_FACTOR
+            / numpy.array(DURATIONS)[:, None],
+            rtol=1e-6,
+        )
+        self.assertTrue(numpy.isnan(self.store.cell_intensities(0)).all())
+
+    def test_depth_of_cell_without_data_is_nan(self):
+        self.assertEqual(self.store.slot(0), NO_DATA)
+        self.assertTrue(numpy.isnan(self.store.depth(0, 60, 10)))
+        self.assertTrue(numpy.isnan(self.store.cell_depths(0)).all())
+
+    def test_slot_of_no_cell_is_no_data(self):
+        self.assertEqual(self.store.slot(NO_CELL), NO_DATA)
+        numpy.testing.assert_array_equal(
+            self.store.slot([NO_CELL, 2022]), [NO_DATA, self.store.slot(2022)]
+        )
+        self.assertTrue(numpy.isnan(self.store.depth(NO_CELL, 60, 10)))
+        self.assertTrue(numpy.isnan(self.store.cell_intensities(NO_CELL)).all())
+
+    def test_slot_fails_outside_raster(self):
+        for index_rc in (-2, 1079, 107000):
+            with self.subTest(index_rc=index_rc), self.assertRaises(ValueError):
+                self.store.slot(index_rc)
+
+    def test_depth_fails_on_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.store.depth([2022, 52040, 2022], [5, 15], [5, 100])
+
+    def test_depth_fails_on_untabulated_duration(self):
+        with self.assertRaises(ValueError):
+            self.store.depth(2022, 7, 1)
+
+    def test_depth_fails_on_untabulated_return_period(self):
+        with self.assertRaises(ValueError):
+            self.store.depth(2022, 5, 4)
+
+    def test_depths_of_all_cells_with_data(self):
+        depths = self.store.depths(60, 10)
+        self.assertEqual(depths.shape, (5405,))
+        self.assertAlmostEqual(self.store.depth(2022, 60, 10), depths[0])
+
+    def test_depths_of_region_skip_cells_without_data(self):
+        depths = self.store.depths(60, 10, [0, 2022, 52040])
+        numpy.testing.assert_array_equal(
+            depths, [self.store.depth(2022, 60, 10), self.store.depth(52040, 60, 10)]
+        )
+
+    def test_maximum_succeeds(self):
+        table = numpy.loadtxt(DATA_DIRECTORY / "d0060.csv", delimiter=",", skiprows=1)
+        self.assertAlmostEqual(
+            self.store.maximum(60, 100), table[:, -1].max(), places=5
+        )
+
+    def test_maximum_of_region_succeeds(self):
+        region = [2022, 52040]
+        self.assertEqual(
+            self.store.maximum(60, 10, region),
+            max(self.store.depth(index_rc, 60, 10) for index_rc in region),
+        )
+
+    def test_quantile_succeeds(self):
+        table = numpy.loadtxt(DATA_DIRECTORY / "d0060.csv", delimiter=",", skiprows=1)
+        depths = table[table[:, 1] != -99.9, 5]
+        quantiles = self.store.quantile([0.5, 0.9], 60, 10)
+        numpy.testing.assert_allclose(
+            quantiles, numpy.quantile(depths, [0.5, 0.9]), rtol=1e-6
+        )
+        self.assertIsInstance(self.store.quantile(0.5, 60, 10), float)
@@ -3,9 +3,12 @@
 
 from unittest import TestCase
 
+import numpy
 from pint import Quantity
 
-from mepcalc.common.medium import Medium
+from mepcalc.common.heat_calculator import HeatCalculator
+from mepcalc.common.medium import FrozenMedium, Media, Medium, media_map
+from mepcalc.common.properties import Glycol, glycol_properties
 
 
 class TestMedium(TestCase):
@@ -38,6 +41,30 @@ class TestMedium(TestCase):
     def test_density_getter_succeeds(self):
         self.assertEqual(self.medium.density, self.density)
 
+    def test_viscosity_defaults_to_none(self):
+        self.assertIsNone(self.medium.viscosity)
+
+    def test_instantiation_fails_on_bad_viscosity(self):
+        with self.assertRaises(ValueError):
+            Medium("Name", self.heat_capacity, self.density, Quantity(1, "m²/s"))
+
+    def test_viscosity_setter_succeeds(self):
+        viscosity = Quantity(1, "mPa s")
+        self.medium.viscosity = viscosity
+        self.assertEqual(self.medium.viscosity, viscosity)
+
+    def test_viscosity_setter_fails_on_bad_viscosity(self):
+        with self.assertRaises(ValueError):
+            self.medium.viscosity = Quantity(1, "Pa")
+
+    def test_kinematic_viscosity_getter_succeeds(self):
+        self.medium.viscosity = Quantity(1, "Pa s")
+        self.assertEqual(self.medium.kinematic_viscosity, Quantity(1, "Pa s/(kg/m³)"))
+
+    def test_kinematic_viscosity_getter_fails_without_viscosity(self):
+        with self.assertRaises(ValueError):
+            self.medium.kinematic_viscosity
+
     def test_volumetric_heat_capacity_getter_succeeds(self):
         self.assertEqual(
             self.medium.volumetric_heat_capacity, self.heat_capacity * self.density
@@ -60,3 +87,202 @@ class TestMedium(TestCase):
     def test_density_setter_fails(self):
         with self.assertRaises(ValueError):
             self.medium.density = Quantity(666, "m³/kg")
+
+    def test_at_fails_without_property_table(self):
+        with self.assertRaises(ValueError):
+            self.medium.at(temperature=Quantity(20, "°C"))
+
+    def test_water_at_temperatures_succeeds(self):
+        temperatures = Quantity(numpy.array([10.0, 20.0, 70.0]), "°C")
+        water = Medium.water().at(temperature=temperatures)
+        self.assertEqual(water.name, "Water")
+        numpy.testing.assert_allclose(
+            water.density.m_as("kg/m³"), [999.70, 998.21, 977.76]
+        )
+        numpy.testing.assert_allclose(
+            water.viscosity.m_as("mPa s"), [1.3060, 1.0016, 0.4035]
+        )
+        self.assertIs(water.properties, Medium.water().properties)
+
+    def test_heat_capacity_matches_property_tables(self):
+        """The default heat capacities are the tabulated ones at 20 °C, in
+        J/(kg K)."""
+        for medium in (Medium.water(), Medium.air()):
+            with self.subTest(medium=medium.name):
+                reference = medium.at(temperature=Quantity(20, "°C"))
+                self.assertAlmostEqual(
+                    medium.si.heat_capacity, reference.si.heat_capacity, delta=1
+                )
+
+    def test_heat_flow_over_temperature_range_succeeds(self):
+        temperatures = Quantity(numpy.linspace(20, 80, 7), "°C")
+        calculator = HeatCalculator(Medium.water().at(temperature=temperatures))
+        heat_flow = calculator.heat_flow_from_volume_flow(
+            Quantity(1, "m³/h"), Quantity(10, "K"), unit="kW"
+        )
+        self.assertEqual(heat_flow.shape, (7,))
+        self.assertTrue(numpy.all(numpy.diff(heat_flow.m) < 0))
+
+    def test_air_at_state_keeps_unset_state_variables_at_defaults(self):
+        air = Medium.air().at(
+            temperature=Quantity(20, "°C"), pressure=Quantity(1013.25, "hPa")
+        )
+        self.assertAlmostEqual(
+            air.density.m, Medium.air().at(temperature=Quantity(20, "°C")).density.m
+        )
+
+    def test_glycol_succeeds(self):
+        medium = Medium.glycol(Glycol.Propylene, Quantity(30, "%"))
+        self.assertEqual(medium.name, "Propylene Glycol 30 %")
+        self.assertIs(medium.properties, glycol_properties(Glycol.Propylene))
+        self.assertAlmostEqual(medium.density.m_as("kg/m³"), 1028, delta=5)
+        self.assertIsInstance(medium.density.m, float)
+
+    def test_glycol_fails_on_bad_concentration(self):
+        with self.assertRaises(ValueError):
+            Medium.glycol(Glycol.Ethylene, Quantity(30, "kg"))
+        with self.assertRaises(ValueError):
+            Medium.glycol(Glycol.Ethylene, Quantity(80, "%"))
+
+    def test_media_heat_capacities_are_on_one_scale(self):
+        """Every medium of media_map in J/(kg K), between air and water, and
+        at its tabulated value at 20 °C."""
+        for media, medium in media_map.items():
+            with self.subTest(media=media.name):
+                heat_capacity = medium.si.heat_capacity
+                self.assertGreaterEqual(heat_capacity, 1000)
+                self.assertLessEqual(heat_capacity, 4200)
+                reference = medium.at(temperature=Quantity(20, "°C"))
+                self.assertAlmostEqual(
+                    heat_capacity, reference.si.heat_capacity, delta=1
+                )
+
+    def test_glycol_at_temperature_keeps_concentration(self):
+        medium = media_map[Media.EthyleneGlycol40]
+        self.assertAlmostEqual(
+            medium.at(temperature=Quantity(20, "°C")).density.m, medium.density.m
+        )
+        cold = medium.at(temperature=Quantity([-10, 0], "°C"))
+        self.assertTrue(numpy.all(cold.density.m > medium.density.m))
+        self.assertEqual(cold.name, medium.name)
+
+    def test_mixed_fluid_batch_succeeds(self):
+        """Heat flows of segments with water and glycol mixtures in one run."""
+        concentrations = numpy.array([0, 0.3, 0.4])
+        temperatures = numpy.array([6.0, 6.0, 12.0])
+        medium = Medium.glycol(Glycol.Ethylene, Quantity(0, "%")).at(
+            concentration=Quantity(concentrations, ""),
+            temperature=Quantity(temperatures, "°C"),
+        )
+        heat_flows = HeatCalculator(medium).batch(
+            "heat_flow_from_volume_flow",
+            volume_flow=([1, 1, 1], "m³/h"),
+            temp_diff=([6, 6, 6], "K"),
+            unit="kW",
+        )
+        for concentration, temperature, heat_flow in zip(
+            concentrations, temperatures, heat_flows
+        ):
+            segment = Medium.glycol(Glycol.Ethylene, Quantity(concentration, "")).at(
+                temperature=Quantity(temperature, "°C")
+            )
+            expected = HeatCalculator(segment).heat_flow_from_volume_flow(
+                Quantity(1, "m³/h"), Quantity(6, "K"), unit="kW"
+            )
+            self.assertAlmostEqual(heat_flow, expected.m)
+
+    def test_setters_invalidate_derived_properties(self):
+        self.medium.viscosity = Quantity(2, "Pa s")
+        self.assertEqual(self.medium.volumetric_heat_capacity.m, 1)
+        self.assertEqual(self.medium.si.kinematic_viscosity, 2)
+        self.medium.heat_capacity = Quantity(3, "J/(kg K)")
+        self.medium.density = Quantity(2, "kg/m³")
+        self.assertEqual(self.medium.volumetric_heat_capacity.m, 6)
+        self.assertEqual(self.medium.si.volumetric_heat_capacity, 6)
+        self.assertEqual(self.medium.kinematic_viscosity.m, 1)
+        self.medium.viscosity = None
+        self.assertIsNone(self.medium.si.viscosity)
+        with self.assertRaises(ValueError):
+            self.medium.kinematic_viscosity
+
+    def test_si_magnitudes_succeed(self):
+        si = Medium.air().si
+        self.assertEqual(si.heat_capacity, 1006.0)
+        self.assertEqual(si.density, 1.205)
+        self.assertAlmostEqual(si.volumetric_heat_capacity, 1006.0 * 1.205)
+        self.assertAlmostEqual(si.viscosity, 18.2e-6)
+        self.assertAlmostEqual(si.kinematic_viscosity, 18.2e-6 / 1.205)
+
+
+class TestFrozenMedium(TestCase):
+    """Unit tests for FrozenMedium class."""
+
+    def setUp(self):
+        self.medium = FrozenMedium(
+            "Name", Quantity(2, "J/(kg K)"), Quantity(3, "kg/m³"), Quantity(1, "Pa s")
+        )
+
+    def test_properties_succeed(self):
+        self.assertEqual(self.medium.name, "Name")
+        self.assertEqual(self.medium.volumetric_heat_capacity, Quantity(6, "J/(m³ K)"))
+        self.assertEqual(self.medium.si.volumetric_heat_capacity, 6)
+
+    def test_changes_fail(self):
+        with self.assertRaises(AttributeError):
+            self.medium.density = Quantity(1, "kg/m³")
+        with self.assertRaises(AttributeError):
+            self.medium._density = Quantity(1, "kg/m³")
+        with self.assertRaises(AttributeError):
+            self.medium.other = 1
+        with self.assertRaises(AttributeError):
+            del self.medium._name
+
+    def test_equal_media_are_equal_and_hash_equal(self):
+        other = FrozenMedium(
+            "Name", Quantity(2, "J/(kg K)"), Quantity(3000, "g/m³"), Quantity(1, "Pa s")
+        )
+        self.assertEqual(self.medium, other)
+        self.assertEqual(hash(self.medium), hash(other))
+        cache = {self.medium: "cached"}
+        self.assertEqual(cache[other], "cached")
+
+    def test_different_media_are_not_equal(self):
+        self.assertNotEqual(FrozenMedium.water(), FrozenMedium.air())
+        self.assertNotEqual(
+            Medium.glycol(Glycol.Ethylene, Quantity(30, "%")).freeze(),
+            Medium.glycol(Glycol.Ethylene, Quantity(40, "%")).freeze(),
+        )
+        self.assertNotEqual(self.medium, Medium.water())
+
+    def test_freeze_succeeds(self):
+        medium = Medium.water()
+        frozen = medium.freeze()
+        self.assertIsInstance(frozen, FrozenMedium)
+        self.assertEqual(frozen, FrozenMedium.water())
+        self.assertIs(frozen.freeze(), frozen)
+        medium.density = Quantity(1000, "kg/m³")
+        self.assertEqual(frozen.density, Quantity(998.2, "kg/m³"))
+
+    def test_at_keeps_media_frozen(self):
+        medium = FrozenMedium.glycol(Glycol.Propylene, Quantity(30, "%"))
+        cold = medium.at(temperature=Quantity(0, "°C"))
+        self.assertIsInstance(cold, FrozenMedium)
+        self.assertEqual(cold.state, medium.state)
+        self.assertEqual(cold, medium.at(temperature=Quantity(273.15, "K")))
+
+    def test_media_at_arrays_of_states_are_not_hashable(self):
+        medium = FrozenMedium.water().at(temperature=Quantity([10, 20], "°C"))
+        with self.assertRaises(TypeError):
+            hash(medium)
+        self.assertEqual(medium, medium)
+        self.assertNotEqual(medium, FrozenMedium.water())
+
+    def test_calculators_accept_frozen_media(self):
+        calculator = HeatCalculator(FrozenMedium.water())
+        heat_flow = calculator.heat_flow_from_volume_flow(
+            Quantity(1, "m³/h"), Quantity(10, "K")
+        )
+        expected = HeatCalculator(Medium.water()).heat_flow_from_volume_flow(
+            Quantity(1, "m³/h"), Quantity(10, "K")
+        )
+        self.assertEqual(heat_flow, expected)
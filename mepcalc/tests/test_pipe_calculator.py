@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import math
+from unittest import TestCase
+
+import numpy
+from pint import Quantity
+
+from mepcalc.common.friction import friction_factor
+from mepcalc.common.medium import Medium
+from mepcalc.common.pipe_calculator import (
+    NO_SIZE,
+    STEEL_PIPE_SERIES,
+    PipeCalculator,
+)
+
+
+class TestPipeCalculator(TestCase):
+    """Unit tests for PipeCalculator class."""
+
+    def setUp(self):
+        self.medium = Medium(
+            "Test",
+            heat_cap=Quantity(1, "J/(kg K)"),
+            density=Quantity(1000, "kg/m³"),
+            viscosity=Quantity(1, "mPa s"),
+        )
+        self.p = PipeCalculator(medium=self.medium)
+        # good inputs: v = 1 m/s in d = 0.1 m, Re = 1e5
+        self.good_volume_flow = Quantity(math.pi / 4 * 0.01, "m³/s")
+        self.good_diameter = Quantity(100, "mm")
+        self.good_length = Quantity(10, "m")
+        self.good_roughness = Quantity(0.1, "mm")
+        # bad inputs
+        self.bad_volume_flow = Quantity(1, "m³")
+        self.bad_diameter = Quantity(1, "m²")
+        self.bad_length = Quantity(1, "m/s")
+        self.bad_roughness = Quantity(1, "s")
+
+    def test_reynolds_number_succeeds(self):
+        reynolds = self.p.reynolds_number(self.good_volume_flow, self.good_diameter)
+        self.assertAlmostEqual(reynolds.m_as(""), 1e5)
+
+    def test_friction_factor_succeeds(self):
+        factor = self.p.friction_factor(
+            self.good_volume_flow, self.good_diameter, self.good_roughness
+        )
+        self.assertAlmostEqual(factor.m_as(""), friction_factor(1e5, 1e-3))
+
+    def test_pressure_gradient_succeeds(self):
+        """R = λ / d * ϱ * v² / 2 = λ / 0.1 m * 1000 kg/m³ * (1 m/s)² / 2"""
+        gradient = self.p.pressure_gradient(
+            self.good_volume_flow, self.good_diameter, self.good_roughness
+        )
+        expected = friction_factor(1e5, 1e-3) / 0.1 * 1000 / 2
+        self.assertAlmostEqual(gradient.m_as("Pa/m"), expected)
+
+    def test_pressure_drop_succeeds(self):
+        pressure_drop = self.p.pressure_drop(
+            self.good_volume_flow,
+            self.good_diameter,
+            self.good_length,
+            self.good_roughness,
+            unit="kPa",
+        )
+        gradient = self.p.pressure_gradient(
+            self.good_volume_flow, self.good_diameter, self.good_roughness
+        )
+        self.assertAlmostEqual(pressure_drop.m, gradient.m_as("kPa/m") * 10)
+
+    def test_pressure_drop_fails_on_bad_inputs(self):
+        with self.assertRaises(ValueError):
+            self.p.pressure_drop(
+                self.bad_volume_flow, self.good_diameter, self.good_length
+            )
+        with self.assertRaises(ValueError):
+            self.p.pressure_drop(
+                self.good_volume_flow, self.bad_diameter, self.good_length
+            )
+        with self.assertRaises(ValueError):
+            self.p.pressure_drop(
+                self.good_volume_flow, self.good_diameter, self.bad_length
+            )
+        with self.assertRaises(ValueError):
+            self.p.pressure_drop(
+                self.good_volume_flow,
+                self.good_diameter,
+                self.good_length,
+                self.bad_roughness,
+            )
+
+    def test_pressure_gradient_fails_without_viscosity(self):
+        medium = Medium("Test", Quantity(1, "J/(kg K)"), Quantity(1, "kg/m³"))
+        with self.assertRaises(ValueError):
+            PipeCalculator(medium).pressure_gradient(
+                self.good_volume_flow, self.good_diameter
+            )
+
+    def test_batch_matches_scalar_pressure_gradient(self):
+        volume_flows = numpy.array([0.5, 2.0, 10.0])
+        diameters = numpy.array([16.1, 41.9, 80.9])
+        gradients = self.p.batch(
+            "pressure_gradient",
+            volume_flow=(volume_flows, "m³/h"),
+            diameter=(diameters, "mm"),
+        )
+        for gradient, volume_flow, diameter in zip(gradients, volume_flows, diameters):
+            self.assertEqual(
+                gradient,
+                self.p.pressure_gradient(
+                    Quantity(volume_flow, "m³/h"), Quantity(diameter, "mm")
+                ).m,
+            )
+
+
+class TestPipeCalculatorNominalSize(TestCase):
+    """Unit tests for the pipe sizing of PipeCalculator."""
+
+    def setUp(self):
+        self.medium = Medium(
+            "Water",
+            heat_cap=Quantity(4.18, "kJ/(kg K)"),
+            density=Quantity(998.2, "kg/m³"),
+            viscosity=Quantity(1.002, "mPa s"),
+        )
+        self.p = PipeCalculator(medium=self.medium)
+        rng = numpy.random.default_rng(15)
+        self.volume_flows = rng.uniform(0, 300, 1000)
+
+    def smallest_fitting_size(self, volume_flow, max_gradient, max_velocity=math.inf):
+        for size in sorted(STEEL_PIPE_SERIES):
+            diameter = Quantity(STEEL_PIPE_SERIES[size], "mm")
+            gradient = self.p.pressure_gradient(Quantity(volume_flow, "m³/h"), diameter)
+            velocity = volume_flow / 3600 / (math.pi / 4 * diameter.m_as("m") ** 2)
+            if gradient.m_as("Pa/m") <= max_gradient and velocity <= max_velocity:
+                return size
+        return NO_SIZE
+
+    def test_nominal_size_succeeds(self):
+        size = self.p.nominal_size(Quantity(2, "l/s"), Quantity(100, "Pa/m"))
+        self.assertEqual(size, 65)
+        self.assertIsInstance(size, int)
+
+    def test_nominal_sizes_match_search(self):
+        sizes = self.p.nominal_size(
+            Quantity(self.volume_flows, "m³/h"), Quantity(100, "Pa/m")
+        )
+        for size, volume_flow in zip(sizes[:100], self.volume_flows[:100]):
+            self.assertEqual(size, self.smallest_fitting_size(volume_flow, 100))
+
+    def test_nominal_sizes_with_velocity_limit_match_search(self):
+        sizes = self.p.nominal_size(
+            Quantity(self.volume_flows, "m³/h"),
+            Quantity(200, "Pa/m"),
+            max_velocity=Quantity(1.5, "m/s"),
+        )
+        for size, volume_flow in zip(sizes[:100], self.volume_flows[:100]):
+            self.assertEqual(size, self.smallest_fitting_size(volume_flow, 200, 1.5))
+
+    def test_nominal_sizes_with_limit_per_segment(self):
+        sizes = self.p.nominal_size(
+            Quantity([2, 2], "l/s"), Quantity([100, 1000], "Pa/m")
+        )
+        self.assertEqual(sizes[0], 65)
+        self.assertLess(sizes[1], 65)
+
+    def test_nominal_size_without_fitting_size(self):
+        self.assertEqual(
+            self.p.nominal_size(Quantity(2000, "m³/h"), Quantity(100, "Pa/m")), NO_SIZE
+        )
+
+    def test_nominal_size_fails_on_bad_limit(self):
+        with self.assertRaises(ValueError):
+            self.p.nominal_size(Quantity(2, "l/s"), Quantity(100, "Pa"))
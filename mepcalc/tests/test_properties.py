@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase
+
+import numpy
+from pint import Quantity
+
+from mepcalc.common.properties import (
+    STANDARD_PRESSURE,
+    WATER_REFERENCE,
+    Axis,
+    Glycol,
+    PropertyTable,
+    air_properties,
+    glycol_mixture,
+    glycol_properties,
+    humid_air,
+    water_density,
+    water_heat_capacity,
+    water_properties,
+    water_viscosity,
+)
+
+
+def quadratic(x, y):
+    return {"value": 1 + 2 * x - x * y + 0.5 * y * y}
+
+
+class TestPropertyTable(TestCase):
+    """Unit tests for PropertyTable class."""
+
+    def setUp(self):
+        self.axes = [Axis("x", 0, 4, 8, "m"), Axis("y", -1, 1, 4, "s")]
+        self.table = PropertyTable.from_function(self.axes, quadratic, {"value": ""})
+        rng = numpy.random.default_rng(18)
+        self.x = rng.uniform(0, 4, 1000)
+        self.y = rng.uniform(-1, 1, 1000)
+
+    def test_grid_points_are_exact(self):
+        x, y = numpy.meshgrid(self.axes[0].values, self.axes[1].values)
+        for method in ["linear", "cubic"]:
+            values = self.table.interpolate(method, x, y)["value"]
+            numpy.testing.assert_allclose(values, quadratic(x, y)["value"])
+
+    def test_linear_interpolation_is_exact_for_bilinear_functions(self):
+        table = PropertyTable.from_function(
+            self.axes, lambda x, y: {"value": 1 + 2 * x - x * y}, {"value": ""}
+        )
+        values = table.interpolate("linear", self.x, self.y)["value"]
+        numpy.testing.assert_allclose(values, 1 + 2 * self.x - self.x * self.y)
+
+    def test_cubic_interpolation_is_exact_for_quadratic_functions(self):
+        """Catmull–Rom reproduces quadratics, also in the boundary cells with
+        the quadratically extrapolated ghost layer."""
+        values = self.table.interpolate("cubic", self.x, self.y)
+        numpy.testing.assert_allclose(
+            values["value"], quadratic(self.x, self.y)["value"]
+        )
+
+    def test_evaluate_converts_units_and_broadcasts(self):
+        values = self.table.evaluate(
+            x=Quantity([[100], [200], [300]], "cm"), y=Quantity([0, 500], "ms")
+        )["value"]
+        self.assertEqual(values.shape, (3, 2))
+        self.assertEqual(values.u, Quantity(1, "").u)
+        self.assertAlmostEqual(values[1, 1].m, quadratic(2.0, 0.5)["value"])
+
+    def test_evaluate_of_scalars_succeeds(self):
+        value = self.table.evaluate(x=Quantity(4, "m"), y=Quantity(1, "s"))["value"]
+        self.assertAlmostEqual(float(value.m), quadratic(4, 1)["value"])
+
+    def test_evaluate_uses_defaults(self):
+        axes = [Axis("x", 0, 4, 8, "m"), Axis("y", -1, 1, 4, "s", default=0.5)]
+        table = PropertyTable.from_function(axes, quadratic, {"value": ""})
+        value = table.evaluate("linear", x=Quantity(2, "m"))["value"]
+        self.assertAlmostEqual(float(value.m), quadratic(2, 0.5)["value"])
+
+    def test_evaluate_fails_on_bad_states(self):
+        with self.assertRaises(ValueError):
+            self.table.evaluate(x=Quantity(5, "m"), y=Quantity(0, "s"))
+        with self.assertRaises(ValueError):
+            self.table.evaluate(x=Quantity(1, "m"), y=Quantity(0, "m"))
+        with self.assertRaises(ValueError):
+            self.table.evaluate(x=Quantity(1, "m"))
+        with self.assertRaises(ValueError):
+            self.table.evaluate(x=Quantity(1, "m"), y=Quantity(0, "s"), z=1)
+        with self.assertRaises(ValueError):
+            self.table.evaluate("spline", x=Quantity(1, "m"), y=Quantity(0, "s"))
+
+    def test_instantiation_fails_on_bad_table_shape(self):
+        with self.assertRaises(ValueError):
+            PropertyTable(self.axes, {"value": numpy.zeros((9, 4))}, {"value": ""})
+        with self.assertRaises(ValueError):
+            PropertyTable(
+                [Axis("x", 0, 1, 1, "m")], {"value": numpy.zeros(2)}, {"value": ""}
+            )
+
+
+class TestMediumProperties(TestCase):
+    """Unit tests for the built-in water and air property tables."""
+
+    def test_water_properties_at_reference_temperatures(self):
+        temperature, heat_capacity, density, viscosity = WATER_REFERENCE.T
+        properties = water_properties().evaluate(
+            temperature=Quantity(temperature + 273.15, "K")
+        )
+        numpy.testing.assert_allclose(properties["heat_capacity"].m, heat_capacity)
+        numpy.testing.assert_allclose(properties["density"].m, density)
+        numpy.testing.assert_allclose(properties["viscosity"].m_as("mPa s"), viscosity)
+
+    def test_water_density_between_reference_temperatures(self):
+        """25 °C: 997.05 kg/m³ (IAPWS-95)"""
+        density = water_properties().evaluate(temperature=Quantity(25, "°C"))
+        self.assertAlmostEqual(float(density["density"].m), 997.05, places=1)
+
+    def test_dry_air_at_20_degrees_celsius(self):
+        properties = air_properties().evaluate(temperature=Quantity(20, "°C"))
+        self.assertAlmostEqual(float(properties["density"].m), 1.204, places=3)
+        self.assertAlmostEqual(
+            float(properties["viscosity"].m_as("µPa s")), 18.13, places=2
+        )
+        self.assertAlmostEqual(float(properties["heat_capacity"].m), 1006)
+
+    def test_humid_air_is_lighter(self):
+        properties = air_properties().evaluate(
+            temperature=Quantity(30, "°C"), humidity=Quantity([0, 1], "")
+        )
+        dry, humid = properties["density"].m
+        self.assertLess(humid, dry)
+
+    def test_air_table_matches_function(self):
+        rng = numpy.random.default_rng(18)
+        temperature = rng.uniform(-20, 60, 10000)
+        pressure = rng.uniform(80000, 110000, 10000)
+        humidity = rng.uniform(0, 1, 10000)
+        expected = humid_air(temperature, pressure, humidity)
+        values = air_properties().interpolate("cubic", temperature, pressure, humidity)
+        for name, value in values.items():
+            numpy.testing.assert_allclose(value, expected[name], rtol=1e-4)
+
+    def test_air_pressure_defaults_to_standard_pressure(self):
+        table = air_properties()
+        default = table.evaluate(temperature=Quantity(10, "°C"))
+        standard = table.evaluate(
+            temperature=Quantity(10, "°C"),
+            pressure=Quantity(STANDARD_PRESSURE, "Pa"),
+            humidity=Quantity(0, "%"),
+        )
+        self.assertAlmostEqual(default["density"].m, standard["density"].m)
+
+
+class TestGlycolProperties(TestCase):
+    """Unit tests for the glycol/water mixture property surfaces."""
+
+    def test_mixture_without_glycol_is_water(self):
+        temperature, heat_capacity, density, viscosity = WATER_REFERENCE.T
+        for glycol in Glycol:
+            properties = glycol_mixture(glycol, 0.0, temperature)
+            numpy.testing.assert_allclose(
+                properties["heat_capacity"], heat_capacity, rtol=5e-4
+            )
+            numpy.testing.assert_allclose(properties["density"], density, rtol=1e-4)
+            numpy.testing.assert_allclose(properties["viscosity"], viscosity, rtol=3e-2)
+
+    def test_water_functions_match_reference(self):
+        temperature, heat_capacity, density, viscosity = WATER_REFERENCE.T
+        numpy.testing.assert_allclose(water_density(temperature), density, rtol=2e-5)
+        numpy.testing.assert_allclose(
+            water_heat_capacity(temperature), heat_capacity, rtol=5e-4
+        )
+        numpy.testing.assert_allclose(
+            water_viscosity(temperature), viscosity, rtol=3e-2
+        )
+
+    def test_typical_mixture_properties(self):
+        """Ethylene glycol 30 % at 20 °C: about 1040 kg/m³, 3.65 kJ/(kg K)
+        and 2.1 mPa s, propylene glycol 30 %: about 1028 kg/m³,
+        3.85 kJ/(kg K) and 2.8 mPa s"""
+        ethylene = glycol_mixture(Glycol.Ethylene, 0.3, 20.0)
+        self.assertAlmostEqual(ethylene["density"], 1040, delta=5)
+        self.assertAlmostEqual(ethylene["heat_capacity"], 3650, delta=50)
+        self.assertAlmostEqual(ethylene["viscosity"], 2.1, delta=0.2)
+        propylene = glycol_mixture(Glycol.Propylene, 0.3, 20.0)
+        self.assertAlmostEqual(propylene["density"], 1028, delta=5)
+        self.assertAlmostEqual(propylene["heat_capacity"], 3850, delta=50)
+        self.assertAlmostEqual(propylene["viscosity"], 2.8, delta=0.3)
+
+    def test_more_glycol_is_denser_and_more_viscous(self):
+        concentration = numpy.linspace(0, 0.6, 13)
+        for glycol in Glycol:
+            properties = glycol_mixture(glycol, concentration, 10.0)
+            self.assertTrue(numpy.all(numpy.diff(properties["density"]) > 0))
+            self.assertTrue(numpy.all(numpy.diff(properties["viscosity"]) > 0))
+            self.assertTrue(numpy.all(numpy.diff(properties["heat_capacity"]) < 0))
+
+    def test_surface_matches_mixture(self):
+        rng = numpy.random.default_rng(19)
+        concentration = rng.uniform(0, 0.6, 10000)
+        temperature = rng.uniform(-20, 100, 10000)
+        for glycol in Glycol:
+            expected = glycol_mixture(glycol, concentration, temperature)
+            values = glycol_properties(glycol).interpolate(
+                "cubic", concentration, temperature
+            )
+            for name, value in values.items():
+                numpy.testing.assert_allclose(value, expected[name], rtol=2e-3)
+
+    def test_surfaces_are_built_once(self):
+        self.assertIs(
+            glycol_properties(Glycol.Ethylene), glycol_properties(Glycol.Ethylene)
+        )
+        self.assertIsNot(
+            glycol_properties(Glycol.Ethylene), glycol_properties(Glycol.Propylene)
+        )
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+from unittest import TestCase
+
+from pint import Quantity, Unit
+
+from mepcalc import ureg
+from mepcalc.common.medium import Medium
+
+
+class TestUnitRegistry(TestCase):
+    """Unit tests for the shared unit registry."""
+
+    def test_registry_is_created_lazily(self):
+        code = "import pint, mepcalc; " "print(type(mepcalc.ureg) is pint.LazyRegistry)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "True")
+
+    def test_quantities_share_registry(self):
+        self.assertIs(Quantity(1, "m")._REGISTRY, ureg)
+        self.assertIs(Unit("m")._REGISTRY, ureg)
+        self.assertIs(Medium.water().density._REGISTRY, ureg)
+
+    def test_quantities_from_both_constructors_operate(self):
+        length = Quantity(1, "m") + ureg.Quantity(1, "m")
+        self.assertEqual(length, Quantity(2, "m"))
+
+    def test_registry_uses_disk_cache(self):
+        self.assertIsNotNone(ureg.cache_folder)
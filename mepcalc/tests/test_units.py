@@ -1,11 +1,24 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import subprocess
+import sys
 from unittest import TestCase
 
+import numpy
 from pint import Quantity, Unit
 
-from mepcalc.common.units import check_dimensionality
+from mepcalc.common.units import (
+    DIMENSIONALITY_CACHE_SIZE,
+    Conversion,
+    Units,
+    check_dimensionality,
+    dimensionality_cache_clear,
+    dimensionality_cache_info,
+    unit_conversion,
+    unit_conversion_cache_info,
+    units_map,
+)
 
 
 class TestCheckDimensionality(TestCase):
@@ -22,3 +35,93 @@ class TestCheckDimensionality(TestCase):
     def test_check_raises(self):
         with self.assertRaises(ValueError):
             check_dimensionality(self.quantity, self.bad_unit)
+
+    def test_check_raises_repeatedly(self):
+        for _ in range(3):
+            with self.assertRaises(ValueError):
+                check_dimensionality(self.quantity, self.bad_unit)
+
+
+class TestDimensionalityCache(TestCase):
+    """Unit tests for the dimensionality cache."""
+
+    def setUp(self):
+        dimensionality_cache_clear()
+        self.unit = Unit("kg/s")
+
+    def tearDown(self):
+        dimensionality_cache_clear()
+
+    def test_repeated_units_hit_cache(self):
+        for magnitude in range(10):
+            check_dimensionality(Quantity(magnitude, "kg/h"), self.unit)
+        info = dimensionality_cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 9)
+
+    def test_different_units_miss_cache(self):
+        check_dimensionality(Quantity(1, "kg/h"), self.unit)
+        check_dimensionality(Quantity(1, "g/s"), self.unit)
+        self.assertEqual(dimensionality_cache_info().misses, 2)
+
+    def test_cache_is_bounded(self):
+        for exponent in range(1, DIMENSIONALITY_CACHE_SIZE + 10):
+            unit = Unit(f"m**{exponent}")
+            check_dimensionality(Quantity(1, f"mm**{exponent}"), unit)
+        self.assertEqual(
+            dimensionality_cache_info().currsize, DIMENSIONALITY_CACHE_SIZE
+        )
+
+
+class TestUnitConversions(TestCase):
+    """Unit tests for the cached unit conversions."""
+
+    def test_import_derives_no_conversions(self):
+        code = (
+            "from mepcalc.common.units import unit_conversion_cache_info; "
+            "print(unit_conversion_cache_info().currsize)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, check=True, text=True
+        ).stdout
+        self.assertEqual(output.strip(), "0")
+
+    def test_conversions_are_cached(self):
+        conversion = unit_conversion(Units.Area, "cm²")
+        hits = unit_conversion_cache_info().hits
+        self.assertIs(unit_conversion(Units.Area, "cm²"), conversion)
+        self.assertEqual(unit_conversion_cache_info().hits, hits + 1)
+
+    def test_conversions_match_pint(self):
+        magnitudes = numpy.array([-3.5, 0.0, 1.0, 42.0, 1e6])
+        for kind, names in units_map.items():
+            for name in names:
+                with self.subTest(kind=kind, name=name):
+                    conversion = unit_conversion(kind, name)
+                    expected = Quantity(magnitudes, name).to_base_units()
+                    self.assertEqual(conversion.unit, expected.units)
+                    numpy.testing.assert_allclose(
+                        conversion.to_si(magnitudes), expected.magnitude, rtol=1e-14
+                    )
+                    numpy.testing.assert_allclose(
+                        conversion.magnitude(Quantity(magnitudes, name)),
+                        magnitudes,
+                        rtol=1e-14,
+                        atol=1e-14,
+                    )
+
+    def test_quantity_converts_like_pint(self):
+        conversion = unit_conversion(Units.VolumeFlow, "m³/h")
+        self.assertAlmostEqual(
+            conversion.quantity(3600.0).m_as("l/s"),
+            Quantity(3600.0, "m³/h").m_as("l/s"),
+        )
+
+    def test_offset_units_convert(self):
+        conversion = Conversion.of("degC")
+        self.assertAlmostEqual(conversion.to_si(20.0), 293.15)
+        self.assertAlmostEqual(conversion.from_si(273.15), 0.0)
+
+    def test_unexpected_unit_fails(self):
+        with self.assertRaises(ValueError):
+            unit_conversion(Units.Length, "kg")
@@ -3,10 +3,9 @@
 """Simple unit conversion GUI."""
 import sys
 
-import pint
 from PySide6 import QtCore, QtGui, QtWidgets
 
-ureg = pint.UnitRegistry()
+from mepcalc import ureg
 
 
 class Converter(QtWidgets.QWidget):
@@ -107,8 +106,7 @@ def convert(amount, input_unit, output_unit):
 
 def get_all_units(registry):
     """Get all units from a pint unit registry."""
-    members = registry.__dict__["_units"]
-    return list(members.keys())
+    return list(registry._units.keys())
 
 
 def main():